@@ -2,12 +2,99 @@
 
 from __future__ import annotations
 
-from collections import Counter
+import copy
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
 from typing import Dict, Iterable, List, Sequence
 
-import math
+import numpy as np
 import pandas as pd
 
+_CRITERIA = ("gain_ratio", "information_gain", "gini")
+# Below this many (row, feature) cells a node is scored on the calling thread.
+_PARALLEL_MIN_CELLS = 1 << 16
+
+
+def encode_labels(labels: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Factorize labels into dense integer codes (once, in encounter order).
+
+    Args:
+        labels (Sequence[str]): Iterable of hashable categorical labels.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Integer code per label (0..k-1) and the
+        k unique label values, so that ``uniques[codes]`` recovers the input.
+    """
+    if not isinstance(labels, (pd.Series, np.ndarray)):
+        values = list(labels)
+        labels = np.empty(len(values), dtype=object)
+        labels[:] = values
+    codes, uniques = pd.factorize(labels, sort=False, use_na_sentinel=False)
+    return codes.astype(np.intp, copy=False), np.asarray(uniques, dtype=object)
+
+
+def group_class_counts(
+    group_codes: np.ndarray,
+    label_codes: np.ndarray,
+    n_groups: int,
+    n_classes: int,
+) -> np.ndarray:
+    """
+    Count labels per group with a single flat bincount.
+
+    Args:
+        group_codes (np.ndarray): Group index (0..n_groups-1) per sample.
+        label_codes (np.ndarray): Class index (0..n_classes-1) per sample.
+        n_groups (int): Number of groups.
+        n_classes (int): Number of classes.
+
+    Returns:
+        np.ndarray: Integer matrix of shape (n_groups, n_classes).
+    """
+    group_codes = np.asarray(group_codes, dtype=np.intp)
+    flat = group_codes * n_classes + np.asarray(label_codes, dtype=np.intp)
+    return np.bincount(flat, minlength=n_groups * n_classes).reshape(n_groups, n_classes)
+
+
+def entropy_from_counts(counts: np.ndarray) -> np.ndarray | float:
+    """
+    Shannon entropy (bits) of class-count vectors.
+
+    Args:
+        counts (np.ndarray): Counts of shape (n_classes,) for one group, or
+            (n_groups, n_classes) to score many groups at once.
+
+    Returns:
+        float | np.ndarray: Entropy per group (0.0 for empty groups).
+    """
+    counts = np.asarray(counts, dtype=float)
+    totals = counts.sum(axis=-1, keepdims=True)
+    probs = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+    log_probs = np.log2(probs, out=np.zeros_like(probs), where=probs > 0)
+    result = -np.sum(probs * log_probs, axis=-1)
+    return float(result) if result.ndim == 0 else result
+
+
+def gini_from_counts(counts: np.ndarray) -> np.ndarray | float:
+    """
+    Gini impurity of class-count vectors.
+
+    Args:
+        counts (np.ndarray): Counts of shape (n_classes,) or (n_groups, n_classes).
+
+    Returns:
+        float | np.ndarray: Gini impurity per group (0.0 for empty groups).
+    """
+    counts = np.asarray(counts, dtype=float)
+    totals = counts.sum(axis=-1)
+    sum_sq = np.sum(counts * counts, axis=-1)
+    safe_totals = np.where(totals > 0, totals, 1.0)
+    result = np.where(totals > 0, 1.0 - sum_sq / safe_totals**2, 0.0)
+    return float(result) if result.ndim == 0 else result
+
 
 def entropy(labels: Sequence[str]) -> float:
     """
@@ -19,7 +106,10 @@ def entropy(labels: Sequence[str]) -> float:
     Returns:
         float: Entropy value in bits. Returns 0.0 for empty input.
     """
-    raise NotImplementedError("Implement entropy.")
+    codes, _ = encode_labels(labels)
+    if codes.size == 0:
+        return 0.0
+    return entropy_from_counts(np.bincount(codes))
 
 
 def gini(labels: Sequence[str]) -> float:
@@ -32,7 +122,10 @@ def gini(labels: Sequence[str]) -> float:
     Returns:
         float: Gini impurity (0.0 indicates pure set).
     """
-    raise NotImplementedError("Implement gini.")
+    codes, _ = encode_labels(labels)
+    if codes.size == 0:
+        return 0.0
+    return gini_from_counts(np.bincount(codes))
 
 
 def partition_dataset(df: pd.DataFrame, feature: str) -> Dict[str, pd.DataFrame]:
@@ -47,7 +140,76 @@ def partition_dataset(df: pd.DataFrame, feature: str) -> Dict[str, pd.DataFrame]
         Dict[str, pd.DataFrame]: Mapping from feature value to subset dataframe
         (reindexed from 0).
     """
-    raise NotImplementedError("Implement partition_dataset.")
+    return {
+        value: subset.reset_index(drop=True)
+        for value, subset in df.groupby(feature, sort=False)
+    }
+
+
+def contingency_table(
+    df: pd.DataFrame,
+    feature: str,
+    target: str = "play",
+) -> np.ndarray:
+    """
+    Count rows per (feature value, target class) pair with one bincount.
+
+    Args:
+        df (pd.DataFrame): Dataset containing feature and target columns.
+        feature (str): Feature column (rows of the table, encounter order).
+        target (str): Target column (columns of the table, encounter order).
+
+    Returns:
+        np.ndarray: Integer matrix of shape (n_feature_values, n_classes).
+    """
+    feature_codes, feature_values = encode_labels(df[feature])
+    target_codes, classes = encode_labels(df[target])
+    return group_class_counts(feature_codes, target_codes, len(feature_values), len(classes))
+
+
+def _score_stacked_tables(
+    tables: np.ndarray,
+    starts: np.ndarray,
+    parent_counts: np.ndarray,
+    criterion: str,
+) -> np.ndarray:
+    """
+    Score several features from their vertically stacked contingency tables.
+
+    Args:
+        tables (np.ndarray): (total_feature_values, n_classes) counts where the
+            rows of feature j begin at ``starts[j]``.
+        starts (np.ndarray): First row of each feature's table (increasing).
+        parent_counts (np.ndarray): Class counts of the unsplit node.
+        criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+
+    Returns:
+        np.ndarray: One score per feature (higher is better).
+    """
+    total_rows = parent_counts.sum()
+    if total_rows == 0:
+        return np.zeros(len(starts))
+    weights = tables.sum(axis=1) / total_rows
+    if criterion == "gini":
+        parent_impurity = gini_from_counts(parent_counts)
+        child_impurity = gini_from_counts(tables)
+    else:
+        parent_impurity = entropy_from_counts(parent_counts)
+        child_impurity = entropy_from_counts(tables)
+    gains = parent_impurity - np.add.reduceat(weights * child_impurity, starts)
+    if criterion != "gain_ratio":
+        return gains
+    log_weights = np.log2(weights, out=np.zeros_like(weights), where=weights > 0)
+    split_info = np.add.reduceat(-weights * log_weights, starts)
+    return np.divide(gains, split_info, out=np.zeros_like(gains), where=split_info > 0)
+
+
+def _score_single_feature(df: pd.DataFrame, feature: str, target: str, criterion: str) -> float:
+    """
+    Score one feature from its contingency table.
+    """
+    table = contingency_table(df, feature, target)
+    return float(_score_stacked_tables(table, np.array([0]), table.sum(axis=0), criterion)[0])
 
 
 def information_gain(
@@ -66,7 +228,7 @@ def information_gain(
     Returns:
         float: Information gain in bits.
     """
-    raise NotImplementedError("Implement information_gain.")
+    return _score_single_feature(df, feature, target, "information_gain")
 
 
 def _split_info(partitions: Dict[str, pd.DataFrame], total_rows: int) -> float:
@@ -80,7 +242,9 @@ def _split_info(partitions: Dict[str, pd.DataFrame], total_rows: int) -> float:
     Returns:
         float: Split information (entropy of partition proportions).
     """
-    raise NotImplementedError("Implement _split_info.")
+    if total_rows == 0:
+        return 0.0
+    return entropy_from_counts(np.array([len(subset) for subset in partitions.values()]))
 
 
 def gain_ratio(
@@ -99,7 +263,290 @@ def gain_ratio(
     Returns:
         float: Gain ratio (0 when split information is zero).
     """
-    raise NotImplementedError("Implement gain_ratio.")
+    return _score_single_feature(df, feature, target, "gain_ratio")
+
+
+def score_encoded_features(
+    feature_codes: np.ndarray,
+    cardinalities: np.ndarray,
+    target_codes: np.ndarray,
+    n_classes: int,
+    criterion: str = "gain_ratio",
+    n_jobs: int | None = None,
+) -> np.ndarray:
+    """
+    Score every candidate feature at once from integer-encoded columns.
+
+    All features' contingency tables are built by a single flat bincount over
+    a shared (feature, value, class) index space, then reduced per feature.
+    With ``n_jobs > 1`` the columns are split into contiguous blocks scored on
+    a thread pool; each feature's score does not depend on the blocking, so
+    the result is identical to the serial one.
+
+    Args:
+        feature_codes (np.ndarray): (n_samples, n_features) value codes, column
+            j taking values in 0..cardinalities[j]-1.
+        cardinalities (np.ndarray): Number of distinct values per feature.
+        target_codes (np.ndarray): Class code per sample.
+        n_classes (int): Number of classes.
+        criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+        n_jobs (int | None): Worker threads (None = 1, -1 = all CPUs).
+
+    Returns:
+        np.ndarray: Score per feature (higher is better).
+
+    Raises:
+        ValueError: If an invalid criterion or n_jobs is provided.
+    """
+    if criterion not in _CRITERIA:
+        raise ValueError(f"criterion must be one of {sorted(_CRITERIA)}.")
+    n_jobs = _resolve_n_jobs(n_jobs)
+    if n_jobs == 1:
+        return _score_block(feature_codes, cardinalities, target_codes, n_classes, criterion)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return _score_blocks_parallel(
+            executor, n_jobs, feature_codes, cardinalities, target_codes, n_classes, criterion
+        )
+
+
+def _resolve_n_jobs(n_jobs: int | None) -> int:
+    """
+    Translate an sklearn-style ``n_jobs`` into a worker count.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs cannot be 0.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _resolve_max_features(max_features: int | float | str | None, n_features: int) -> int:
+    """
+    Translate a ``max_features`` setting into a per-node subset size.
+    """
+    if max_features is None:
+        return n_features
+    if max_features == "sqrt":
+        return max(1, int(np.sqrt(n_features)))
+    if max_features == "log2":
+        return max(1, int(np.log2(n_features)))
+    if isinstance(max_features, (int, np.integer)) and not isinstance(max_features, bool):
+        if max_features < 1:
+            raise ValueError("max_features must be positive.")
+        return min(int(max_features), n_features)
+    if isinstance(max_features, float) and 0.0 < max_features <= 1.0:
+        return max(1, int(max_features * n_features))
+    raise ValueError("max_features must be a positive int, a fraction in (0, 1], 'sqrt' or 'log2'.")
+
+
+def _score_blocks_parallel(
+    executor: Executor,
+    n_blocks: int,
+    feature_codes: np.ndarray,
+    cardinalities: np.ndarray,
+    target_codes: np.ndarray,
+    n_classes: int,
+    criterion: str,
+) -> np.ndarray:
+    """
+    Score contiguous column blocks on `executor` and stitch them in order.
+
+    Threads read the caller's arrays directly (column slices of an F-ordered
+    matrix are views), so nothing is pickled or copied per worker.
+    """
+    cardinalities = np.asarray(cardinalities, dtype=np.intp)
+    blocks = np.array_split(np.arange(cardinalities.size), min(n_blocks, cardinalities.size))
+    futures = [
+        executor.submit(
+            _score_block,
+            feature_codes[:, block[0] : block[-1] + 1],
+            cardinalities[block],
+            target_codes,
+            n_classes,
+            criterion,
+        )
+        for block in blocks
+        if block.size
+    ]
+    return np.concatenate([future.result() for future in futures])
+
+
+def _score_block(
+    feature_codes: np.ndarray,
+    cardinalities: np.ndarray,
+    target_codes: np.ndarray,
+    n_classes: int,
+    criterion: str,
+) -> np.ndarray:
+    """
+    Serial kernel behind `score_encoded_features`.
+    """
+    cardinalities = np.asarray(cardinalities, dtype=np.intp)
+    starts = np.concatenate(([0], np.cumsum(cardinalities)[:-1]))
+    n_groups = int(cardinalities.sum())
+    group_codes = np.asarray(feature_codes, dtype=np.intp) + starts
+    labels = np.broadcast_to(np.asarray(target_codes, dtype=np.intp)[:, None], group_codes.shape)
+    tables = group_class_counts(group_codes.ravel(), labels.ravel(), n_groups, n_classes)
+    parent_counts = np.bincount(target_codes, minlength=n_classes)
+    return _score_stacked_tables(tables, starts, parent_counts, criterion)
+
+
+def _best_threshold_from_cumulative(
+    left_counts: np.ndarray,
+    parent_counts: np.ndarray,
+    thresholds: np.ndarray,
+    criterion: str,
+) -> tuple[float, float]:
+    """
+    Pick the best binary split among candidates described by cumulative counts.
+
+    Args:
+        left_counts (np.ndarray): (n_candidates, n_classes) class counts of the
+            rows that fall at or below each candidate threshold.
+        parent_counts (np.ndarray): Class counts of all rows.
+        thresholds (np.ndarray): Threshold value of each candidate.
+        criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+
+    Returns:
+        tuple[float, float]: Best threshold and its score; (nan, 0.0) when
+        there is no candidate.
+    """
+    if thresholds.size == 0:
+        return float("nan"), 0.0
+    right_counts = parent_counts - left_counts
+    total_rows = parent_counts.sum()
+    left_weight = left_counts.sum(axis=1) / total_rows
+    right_weight = 1.0 - left_weight
+    impurity = gini_from_counts if criterion == "gini" else entropy_from_counts
+    gains = (
+        impurity(parent_counts)
+        - left_weight * impurity(left_counts)
+        - right_weight * impurity(right_counts)
+    )
+    if criterion == "gain_ratio":
+        split_info = entropy_from_counts(np.column_stack([left_weight, right_weight]))
+        gains = np.divide(gains, split_info, out=np.zeros_like(gains), where=split_info > 0)
+    best = int(np.argmax(gains))
+    return float(thresholds[best]), float(gains[best])
+
+
+def _exact_threshold(
+    sorted_values: np.ndarray,
+    sorted_targets: np.ndarray,
+    n_classes: int,
+    criterion: str,
+) -> tuple[float, float]:
+    """
+    Score every midpoint between distinct sorted values in one O(n) sweep.
+
+    A running (prefix-sum) class histogram gives the left-hand counts for all
+    cut positions at once. When two values are adjacent floats the midpoint
+    rounds to the upper one, so the lower value is used instead to keep
+    ``value > threshold`` separating the two sides.
+    """
+    n_rows = sorted_values.shape[0]
+    if n_rows < 2:
+        return float("nan"), 0.0
+    cumulative = np.zeros((n_rows, n_classes))
+    cumulative[np.arange(n_rows), sorted_targets] = 1.0
+    np.cumsum(cumulative, axis=0, out=cumulative)
+    cuts = np.flatnonzero(sorted_values[1:] > sorted_values[:-1])
+    lower, upper = sorted_values[cuts], sorted_values[cuts + 1]
+    thresholds = (lower + upper) / 2.0
+    thresholds = np.where(thresholds < upper, thresholds, lower)
+    return _best_threshold_from_cumulative(cumulative[cuts], cumulative[-1], thresholds, criterion)
+
+
+def _binned_threshold(
+    bin_codes: np.ndarray,
+    targets: np.ndarray,
+    edges: np.ndarray,
+    n_classes: int,
+    criterion: str,
+) -> tuple[float, float]:
+    """
+    Histogram variant of `_exact_threshold`: candidates are the bin edges.
+    """
+    counts = group_class_counts(bin_codes, targets, edges.size + 1, n_classes)
+    cumulative = np.cumsum(counts, axis=0)[:-1]
+    n_left = cumulative.sum(axis=1)
+    keep = (n_left > 0) & (n_left < targets.size)
+    return _best_threshold_from_cumulative(
+        cumulative[keep], counts.sum(axis=0), edges[keep], criterion
+    )
+
+
+def quantile_bin_edges(values: np.ndarray, max_bins: int) -> np.ndarray:
+    """
+    Compute up to ``max_bins - 1`` distinct inner quantile edges of a column.
+
+    Values ``v`` map to bin ``b`` with ``edges[b-1] < v <= edges[b]``, so a
+    split "bin <= b" is the threshold split "v <= edges[b]".
+
+    Args:
+        values (np.ndarray): Numeric column.
+        max_bins (int): Maximum number of bins (>= 2).
+
+    Returns:
+        np.ndarray: Sorted unique edges.
+    """
+    if max_bins < 2:
+        raise ValueError("max_bins must be at least 2.")
+    quantiles = np.linspace(0.0, 1.0, max_bins + 1)[1:-1]
+    return np.unique(np.quantile(np.asarray(values, dtype=float), quantiles))
+
+
+def _numeric_column(df: pd.DataFrame, feature: str) -> np.ndarray:
+    """
+    Extract a numeric column as floats, rejecting missing values.
+    """
+    values = df[feature].to_numpy(dtype=float)
+    if np.isnan(values).any():
+        raise ValueError(f"Numeric feature '{feature}' contains missing values.")
+    return values
+
+
+def best_threshold(
+    df: pd.DataFrame,
+    feature: str,
+    target: str = "play",
+    criterion: str = "gain_ratio",
+    max_bins: int | None = None,
+) -> tuple[float, float]:
+    """
+    Find the best C4.5-style binary split ``feature <= threshold``.
+
+    The column is sorted once and every candidate threshold is scored from
+    cumulative class counts. With `max_bins`, values are first bucketed into
+    quantile bins and only bin edges are considered, which costs O(n) plus
+    O(max_bins * n_classes) regardless of how many distinct values exist.
+
+    Args:
+        df (pd.DataFrame): Dataset containing feature and target columns.
+        feature (str): Numeric feature to evaluate.
+        target (str): Target column name.
+        criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+        max_bins (int | None): Enable histogram mode with this many bins.
+
+    Returns:
+        tuple[float, float]: Threshold and score (nan, 0.0 if the column is
+        constant).
+
+    Raises:
+        ValueError: If the criterion is invalid or the column has NaNs.
+    """
+    if criterion not in _CRITERIA:
+        raise ValueError(f"criterion must be one of {sorted(_CRITERIA)}.")
+    values = _numeric_column(df, feature)
+    target_codes, classes = encode_labels(df[target])
+    if max_bins is not None:
+        edges = quantile_bin_edges(values, max_bins)
+        bins = np.searchsorted(edges, values, side="left")
+        return _binned_threshold(bins, target_codes, edges, len(classes), criterion)
+    order = np.argsort(values, kind="stable")
+    return _exact_threshold(values[order], target_codes[order], len(classes), criterion)
 
 
 def best_split(
@@ -107,15 +554,28 @@ def best_split(
     candidate_features: Iterable[str],
     target: str = "play",
     criterion: str = "gain_ratio",
+    numeric_features: Iterable[str] | None = None,
+    max_bins: int | None = None,
+    n_jobs: int | None = None,
 ) -> str:
     """
     Select the best feature to split on using the specified criterion.
 
+    Categorical features are scored by their multiway split; numeric features
+    by their best binary threshold split (see `best_threshold`). With
+    ``n_jobs > 1`` column encoding and scoring run on a thread pool that
+    shares the encoded matrix; ties still go to the first candidate, exactly
+    as in the serial path.
+
     Args:
         df (pd.DataFrame): Dataset including candidate feature columns.
         candidate_features (Iterable[str]): Feature names to evaluate.
         target (str): Target column name.
         criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+        numeric_features (Iterable[str] | None): Features to treat as numeric.
+            None treats every floating-point column as numeric.
+        max_bins (int | None): Histogram mode for numeric features.
+        n_jobs (int | None): Worker threads (None = 1, -1 = all CPUs).
 
     Returns:
         str: Feature name with highest score.
@@ -123,5 +583,678 @@ def best_split(
     Raises:
         ValueError: If an invalid criterion is provided or no candidates exist.
     """
-    raise NotImplementedError("Implement best_split.")
+    if criterion not in _CRITERIA:
+        raise ValueError(f"criterion must be one of {sorted(_CRITERIA)}.")
+    features: List[str] = list(candidate_features)
+    if not features:
+        raise ValueError("candidate_features must not be empty.")
+    n_jobs = _resolve_n_jobs(n_jobs)
+    numeric = _resolve_numeric_features(df, features, numeric_features)
+    if n_jobs == 1:
+        scores = _score_candidates(df, features, numeric, target, criterion, max_bins)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            scores = _score_candidates(
+                df, features, numeric, target, criterion, max_bins, executor, n_jobs
+            )
+    # First feature wins ties, matching max() over the candidate order.
+    return features[int(np.argmax(scores))]
+
+
+def _score_candidates(
+    df: pd.DataFrame,
+    features: List[str],
+    numeric: set,
+    target: str,
+    criterion: str,
+    max_bins: int | None,
+    executor: Executor | None = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """
+    Score every candidate of `best_split`, on `executor` when one is given.
+    """
+    target_codes, classes = encode_labels(df[target])
+    scores = np.zeros(len(features))
+    categorical = [j for j, feature in enumerate(features) if feature not in numeric]
+    numeric_idx = [j for j, feature in enumerate(features) if feature in numeric]
+    # Executor.map submits eagerly, so thresholds compute alongside the encoding.
+    mapper = executor.map if executor is not None else map
+    thresholds = mapper(
+        lambda j: best_threshold(df, features[j], target, criterion, max_bins), numeric_idx
+    )
+    if categorical:
+        feature_codes = np.empty((len(df), len(categorical)), dtype=np.intp, order="F")
+        cardinalities = np.empty(len(categorical), dtype=np.intp)
+        encoded = mapper(lambda j: encode_labels(df[features[j]]), categorical)
+        for col, (codes, values) in enumerate(encoded):
+            feature_codes[:, col] = codes
+            cardinalities[col] = len(values)
+        if executor is None:
+            scores[categorical] = _score_block(
+                feature_codes, cardinalities, target_codes, len(classes), criterion
+            )
+        else:
+            scores[categorical] = _score_blocks_parallel(
+                executor,
+                n_jobs,
+                feature_codes,
+                cardinalities,
+                target_codes,
+                len(classes),
+                criterion,
+            )
+    for j, (_, score) in zip(numeric_idx, thresholds):
+        scores[j] = score
+    return scores
+
+
+def _resolve_numeric_features(
+    df: pd.DataFrame,
+    features: List[str],
+    numeric_features: Iterable[str] | None,
+) -> set:
+    """
+    Decide which candidate features use threshold splits.
+    """
+    if numeric_features is not None:
+        return set(numeric_features) & set(features)
+    return {feature for feature in features if pd.api.types.is_float_dtype(df[feature])}
+
+
+class DecisionTreeClassifier:
+    """
+    ID3/C4.5-style decision tree with multiway categorical and binary numeric splits.
+
+    Columns are factorized once into an integer column store and the tree is
+    grown from arrays of row indices, so no DataFrame is copied per node. The
+    fitted tree is a flat node table:
+
+    - ``node_feature_[i]``: feature index split on at node i (-1 for leaves).
+    - ``node_child_offset_[i]``: start of node i's slots in ``child_index_``;
+      slot ``offset + value_code`` holds the child for that value (-1 if the
+      value never reached this node).
+    - ``node_class_[i]``: majority class code, used at leaves and as the
+      fallback for unseen values.
+    - ``node_threshold_[i]``: threshold of a numeric split (NaN otherwise);
+      slot 0 holds ``value <= threshold`` and slot 1 the rest.
+
+    Each numeric column is argsorted once at fit time; a node reuses that
+    order filtered to its rows (or sorts locally when it is small) and scores
+    all thresholds with cumulative class counts.
+    """
+
+    def __init__(
+        self,
+        criterion: str = "gain_ratio",
+        max_depth: int | None = None,
+        min_samples_split: int = 2,
+        max_bins: int | None = None,
+        n_jobs: int | None = None,
+        max_features: int | float | str | None = None,
+        random_state: int | np.random.Generator | None = None,
+    ) -> None:
+        """
+        Args:
+            criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+            max_depth (int | None): Maximum depth of the tree (None = unlimited).
+            min_samples_split (int): Minimum rows required to split a node (>= 2).
+            max_bins (int | None): Bucket numeric features into this many
+                quantile bins and only consider bin edges as thresholds.
+            n_jobs (int | None): Threads used to score candidate features at
+                large nodes (None = 1, -1 = all CPUs). The grown tree does not
+                depend on this setting.
+            max_features (int | float | str | None): Size of the random feature
+                subset scored at each node: a count, a fraction, "sqrt",
+                "log2", or None for every feature.
+            random_state (int | np.random.Generator | None): Seed for the
+                per-node feature subsets.
+        """
+        if criterion not in _CRITERIA:
+            raise ValueError(f"criterion must be one of {sorted(_CRITERIA)}.")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth cannot be negative.")
+        if min_samples_split < 2:
+            raise ValueError("min_samples_split must be at least 2.")
+        if max_bins is not None and max_bins < 2:
+            raise ValueError("max_bins must be at least 2.")
+        self.criterion = criterion
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.max_bins = max_bins
+        self.n_jobs = n_jobs
+        self.max_features = max_features
+        self.random_state = random_state
+        _resolve_n_jobs(n_jobs)
+        _resolve_max_features(max_features, 1)
+        self.features_: List[str] | None = None
+        self.numeric_: np.ndarray | None = None
+        self.categories_: List[np.ndarray | None] | None = None
+        self.classes_: np.ndarray | None = None
+        self.node_feature_: np.ndarray | None = None
+        self.node_child_offset_: np.ndarray | None = None
+        self.node_class_: np.ndarray | None = None
+        self.node_threshold_: np.ndarray | None = None
+        self.child_index_: np.ndarray | None = None
 
+    def fit(
+        self,
+        df: pd.DataFrame,
+        target: str = "play",
+        features: Iterable[str] | None = None,
+        numeric_features: Iterable[str] | None = None,
+    ) -> "DecisionTreeClassifier":
+        """
+        Grow the tree on a dataset of categorical and numeric features.
+
+        Args:
+            df (pd.DataFrame): Training data with feature and target columns.
+            target (str): Target column name.
+            features (Iterable[str] | None): Feature columns; defaults to every
+                column except the target.
+            numeric_features (Iterable[str] | None): Features split by
+                threshold. None treats every floating-point column as numeric.
+
+        Returns:
+            DecisionTreeClassifier: Fitted estimator (self).
+
+        Raises:
+            ValueError: If the dataset is empty or a numeric column has NaNs.
+        """
+        codes, numeric_values, target_codes = self._encode_training(
+            df, target, features, numeric_features
+        )
+        self._fit_encoded(codes, numeric_values, target_codes)
+        return self
+
+    def _encode_training(
+        self,
+        df: pd.DataFrame,
+        target: str,
+        features: Iterable[str] | None,
+        numeric_features: Iterable[str] | None,
+    ) -> tuple[np.ndarray, Dict[int, np.ndarray], np.ndarray]:
+        """
+        Build the column store and record the encoding attributes.
+
+        Returns:
+            tuple: (n_samples, n_features) F-ordered codes (zeros in numeric
+            columns), numeric columns keyed by feature index, and target codes.
+        """
+        if len(df) == 0:
+            raise ValueError("Cannot fit on an empty dataset.")
+        if features is None:
+            features = [col for col in df.columns if col != target]
+        self.features_ = list(features)
+        numeric = _resolve_numeric_features(df, self.features_, numeric_features)
+        self.numeric_ = np.array([feature in numeric for feature in self.features_], dtype=bool)
+        target_codes, self.classes_ = encode_labels(df[target])
+        codes = np.zeros((len(df), len(self.features_)), dtype=np.intp, order="F")
+        numeric_values: Dict[int, np.ndarray] = {}
+        self.categories_ = []
+        for j, feature in enumerate(self.features_):
+            if self.numeric_[j]:
+                numeric_values[j] = _numeric_column(df, feature)
+                self.categories_.append(None)
+            else:
+                codes[:, j], values = encode_labels(df[feature])
+                self.categories_.append(values)
+        return codes, numeric_values, target_codes
+
+    def _fit_encoded(
+        self,
+        codes: np.ndarray,
+        numeric_values: Dict[int, np.ndarray],
+        target_codes: np.ndarray,
+        rows: np.ndarray | None = None,
+    ) -> None:
+        """
+        Grow the tree on an already-encoded column store.
+
+        Args:
+            codes (np.ndarray): Output of `_encode_training`.
+            numeric_values (Dict[int, np.ndarray]): Output of `_encode_training`.
+            target_codes (np.ndarray): Output of `_encode_training`.
+            rows (np.ndarray | None): Training row indices, repeats allowed
+                (e.g. a bootstrap sample); defaults to every row.
+        """
+        if rows is None:
+            rows = np.arange(codes.shape[0])
+        rng = np.random.default_rng(self.random_state)
+        n_jobs = _resolve_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            self._grow(codes, numeric_values, target_codes, rows, rng)
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                self._grow(codes, numeric_values, target_codes, rows, rng, executor, n_jobs)
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Predict class labels for every row at once.
+
+        All rows descend the tree together, one level per step, using array
+        gathers on the node table rather than a per-row Python walk.
+
+        Args:
+            df (pd.DataFrame): Rows containing the training feature columns.
+
+        Returns:
+            np.ndarray: Predicted class labels.
+
+        Raises:
+            RuntimeError: If called before fit.
+        """
+        if self.node_feature_ is None:
+            raise RuntimeError("DecisionTreeClassifier must be fitted before predicting.")
+        codes, numeric_values = self._encode_features(df)
+        return self.classes_[self.node_class_[self._apply(codes, numeric_values)]]
+
+    def _encode_features(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Map categorical values to training codes (-1 for unseen values) and
+        gather numeric columns into a float matrix (None if there are none).
+        """
+        codes = np.zeros((len(df), len(self.features_)), dtype=np.intp, order="F")
+        numeric_values = None
+        if self.numeric_.any():
+            numeric_values = np.full((len(df), len(self.features_)), np.nan, order="F")
+        for j, feature in enumerate(self.features_):
+            if self.numeric_[j]:
+                numeric_values[:, j] = df[feature].to_numpy(dtype=float)
+            else:
+                codes[:, j] = pd.Index(self.categories_[j]).get_indexer(df[feature])
+        return codes, numeric_values
+
+    def _apply(self, codes: np.ndarray, numeric_values: np.ndarray | None = None) -> np.ndarray:
+        """
+        Return the index of the node where each encoded row stops.
+
+        Missing numeric values stop at the current node, like unseen categories.
+        """
+        rows = np.arange(codes.shape[0])
+        nodes = np.zeros(codes.shape[0], dtype=np.intp)
+        active = rows
+        while active.size:
+            features = self.node_feature_[nodes[active]]
+            internal = features >= 0
+            active, features = active[internal], features[internal]
+            values = codes[active, features]
+            if numeric_values is not None:
+                thresholds = self.node_threshold_[nodes[active]]
+                split = ~np.isnan(thresholds)
+                observed = numeric_values[active[split], features[split]]
+                values[split] = np.where(
+                    np.isnan(observed), -1, (observed > thresholds[split]).astype(np.intp)
+                )
+            slots = self.node_child_offset_[nodes[active]] + values
+            children = np.where(values >= 0, self.child_index_[np.where(values >= 0, slots, 0)], -1)
+            moving = children >= 0
+            nodes[active[moving]] = children[moving]
+            active = active[moving]
+        return nodes
+
+    def _grow(
+        self,
+        codes: np.ndarray,
+        numeric_values: Dict[int, np.ndarray],
+        target_codes: np.ndarray,
+        root_rows: np.ndarray,
+        rng: np.random.Generator,
+        executor: Executor | None = None,
+        n_jobs: int = 1,
+    ) -> None:
+        """
+        Build the node table depth-first from row-index arrays.
+
+        When an executor is given, nodes with at least `_PARALLEL_MIN_CELLS`
+        candidate cells score their features on it.
+        """
+        n_rows = codes.shape[0]
+        n_classes = len(self.classes_)
+        cardinalities = np.array(
+            [2 if values is None else len(values) for values in self.categories_], dtype=np.intp
+        )
+        if self.max_bins is None:
+            presorted = {j: np.argsort(v, kind="stable") for j, v in numeric_values.items()}
+        else:
+            edges = {j: quantile_bin_edges(v, self.max_bins) for j, v in numeric_values.items()}
+            bins = {
+                j: np.searchsorted(edges[j], v, side="left") for j, v in numeric_values.items()
+            }
+        node_feature: List[int] = [-1]
+        node_offset: List[int] = [-1]
+        node_class: List[int] = [0]
+        node_threshold: List[float] = [np.nan]
+        child_index: List[int] = []
+        all_features = np.arange(len(self.features_))
+        subset_size = _resolve_max_features(self.max_features, all_features.size)
+        stack = [(0, root_rows, 0, all_features)]
+        while stack:
+            node, rows, depth, available = stack.pop()
+            node_targets = target_codes[rows]
+            class_counts = np.bincount(node_targets, minlength=n_classes)
+            node_class[node] = int(np.argmax(class_counts))
+            if (
+                np.count_nonzero(class_counts) <= 1
+                or rows.size < self.min_samples_split
+                or (self.max_depth is not None and depth >= self.max_depth)
+                or available.size == 0
+            ):
+                continue
+            candidates = available
+            if subset_size < available.size:
+                # Sorted so ties still favour the earlier feature.
+                candidates = np.sort(rng.choice(available, subset_size, replace=False))
+            scores = np.zeros(candidates.size)
+            thresholds = np.full(candidates.size, np.nan)
+            categorical = ~self.numeric_[candidates]
+            pool = executor if rows.size * candidates.size >= _PARALLEL_MIN_CELLS else None
+            if categorical.any():
+                node_codes = codes[np.ix_(rows, candidates[categorical])]
+                node_cardinalities = cardinalities[candidates[categorical]]
+                if pool is None:
+                    scores[categorical] = _score_block(
+                        node_codes, node_cardinalities, node_targets, n_classes, self.criterion
+                    )
+                else:
+                    scores[categorical] = _score_blocks_parallel(
+                        pool,
+                        n_jobs,
+                        node_codes,
+                        node_cardinalities,
+                        node_targets,
+                        n_classes,
+                        self.criterion,
+                    )
+            multiplicity = None
+            if self.max_bins is None and rows.size * np.log2(rows.size + 1) >= n_rows:
+                # Filtering the global presort is O(n); cheaper than re-sorting here.
+                multiplicity = np.bincount(rows, minlength=n_rows)
+
+            def score_numeric(j: int) -> tuple[float, float]:
+                if self.max_bins is not None:
+                    return _binned_threshold(
+                        bins[j][rows], node_targets, edges[j], n_classes, self.criterion
+                    )
+                if multiplicity is None:
+                    ordered = rows[np.argsort(numeric_values[j][rows], kind="stable")]
+                else:
+                    ordered = np.repeat(presorted[j], multiplicity[presorted[j]])
+                return _exact_threshold(
+                    numeric_values[j][ordered], target_codes[ordered], n_classes, self.criterion
+                )
+
+            numeric_slots = np.flatnonzero(~categorical)
+            results = (pool.map if pool is not None else map)(
+                score_numeric, [int(candidates[k]) for k in numeric_slots]
+            )
+            for k, (threshold, score) in zip(numeric_slots, results):
+                thresholds[k], scores[k] = threshold, score
+            best = int(np.argmax(scores))
+            if scores[best] <= 0:
+                continue
+            feature = int(candidates[best])
+            if self.numeric_[feature]:
+                values = (numeric_values[feature][rows] > thresholds[best]).astype(np.intp)
+                # Numeric features can be split again further down the path.
+                remaining = available
+            else:
+                values = codes[rows, feature]
+                remaining = available[available != feature]
+            group_sizes = np.bincount(values, minlength=cardinalities[feature])
+            if np.count_nonzero(group_sizes) < 2:
+                # A split that keeps every row in one child cannot make progress.
+                continue
+            node_feature[node] = feature
+            node_offset[node] = len(child_index)
+            node_threshold[node] = thresholds[best]
+            child_index.extend([-1] * int(cardinalities[feature]))
+            order = np.argsort(values, kind="stable")
+            bounds = np.cumsum(group_sizes)
+            for value, group in enumerate(np.split(rows[order], bounds[:-1])):
+                if group.size == 0:
+                    continue
+                child = len(node_feature)
+                node_feature.append(-1)
+                node_offset.append(-1)
+                node_class.append(0)
+                node_threshold.append(np.nan)
+                child_index[node_offset[node] + value] = child
+                stack.append((child, group, depth + 1, remaining))
+        self.node_feature_ = np.asarray(node_feature, dtype=np.intp)
+        self.node_child_offset_ = np.asarray(node_offset, dtype=np.intp)
+        self.node_class_ = np.asarray(node_class, dtype=np.intp)
+        self.node_threshold_ = np.asarray(node_threshold, dtype=float)
+        self.child_index_ = np.asarray(child_index, dtype=np.intp)
+
+
+class RandomForestClassifier:
+    """
+    Bagged ensemble of `DecisionTreeClassifier` with majority-vote prediction.
+
+    The training frame is encoded once; every tree then grows on a bootstrap
+    sample of row indices into that shared column store, scoring a random
+    feature subset at each node. With ``n_jobs > 1`` trees are trained on a
+    process pool and the encoded arrays are published read-only through
+    shared memory, so workers attach to them instead of receiving pickled
+    copies. Each tree draws from its own child of ``SeedSequence(random_state)``,
+    which makes the fitted forest independent of ``n_jobs``.
+    """
+
+    def __init__(
+        self,
+        n_estimators: int = 100,
+        criterion: str = "gain_ratio",
+        max_depth: int | None = None,
+        min_samples_split: int = 2,
+        max_features: int | float | str | None = "sqrt",
+        max_bins: int | None = None,
+        bootstrap: bool = True,
+        n_jobs: int | None = None,
+        random_state: int | None = None,
+    ) -> None:
+        """
+        Args:
+            n_estimators (int): Number of trees.
+            criterion (str): One of {"gain_ratio", "information_gain", "gini"}.
+            max_depth (int | None): Maximum depth of each tree.
+            min_samples_split (int): Minimum rows required to split a node.
+            max_features (int | float | str | None): Per-node feature subset
+                size (see `DecisionTreeClassifier`).
+            max_bins (int | None): Histogram mode for numeric features.
+            bootstrap (bool): Train each tree on a bootstrap sample.
+            n_jobs (int | None): Worker processes (None = 1, -1 = all CPUs).
+            random_state (int | None): Seed for bootstrap samples and subsets.
+        """
+        if n_estimators < 1:
+            raise ValueError("n_estimators must be at least 1.")
+        _resolve_n_jobs(n_jobs)
+        self.n_estimators = n_estimators
+        self.criterion = criterion
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.max_features = max_features
+        self.max_bins = max_bins
+        self.bootstrap = bootstrap
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.estimators_: List[DecisionTreeClassifier] | None = None
+        self.classes_: np.ndarray | None = None
+        self._encoder: DecisionTreeClassifier | None = None
+
+    def fit(
+        self,
+        df: pd.DataFrame,
+        target: str = "play",
+        features: Iterable[str] | None = None,
+        numeric_features: Iterable[str] | None = None,
+    ) -> "RandomForestClassifier":
+        """
+        Train the ensemble.
+
+        Args:
+            df (pd.DataFrame): Training data with feature and target columns.
+            target (str): Target column name.
+            features (Iterable[str] | None): Feature columns; defaults to every
+                column except the target.
+            numeric_features (Iterable[str] | None): Features split by
+                threshold. None treats every floating-point column as numeric.
+
+        Returns:
+            RandomForestClassifier: Fitted estimator (self).
+        """
+        template = DecisionTreeClassifier(
+            criterion=self.criterion,
+            max_depth=self.max_depth,
+            min_samples_split=self.min_samples_split,
+            max_bins=self.max_bins,
+            max_features=self.max_features,
+        )
+        codes, numeric_values, target_codes = template._encode_training(
+            df, target, features, numeric_features
+        )
+        seeds = np.random.SeedSequence(self.random_state).spawn(self.n_estimators)
+        n_jobs = min(_resolve_n_jobs(self.n_jobs), self.n_estimators)
+        if n_jobs == 1:
+            self.estimators_ = [
+                _grow_forest_member(
+                    template, codes, numeric_values, target_codes, seed, self.bootstrap
+                )
+                for seed in seeds
+            ]
+        else:
+            self.estimators_ = _fit_forest_parallel(
+                template, codes, numeric_values, target_codes, seeds, self.bootstrap, n_jobs
+            )
+        self.classes_ = template.classes_
+        self._encoder = template
+        return self
+
+    def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Return the fraction of trees voting for each class.
+
+        Args:
+            df (pd.DataFrame): Rows containing the training feature columns.
+
+        Returns:
+            np.ndarray: (n_samples, n_classes) vote shares, columns ordered as
+            ``classes_``.
+
+        Raises:
+            RuntimeError: If called before fit.
+        """
+        if self.estimators_ is None:
+            raise RuntimeError("RandomForestClassifier must be fitted before predicting.")
+        codes, numeric_values = self._encoder._encode_features(df)
+        n_rows, n_classes = codes.shape[0], len(self.classes_)
+        offsets = np.arange(n_rows) * n_classes
+        votes = np.zeros(n_rows * n_classes)
+        for tree in self.estimators_:
+            leaves = tree._apply(codes, numeric_values)
+            votes += np.bincount(offsets + tree.node_class_[leaves], minlength=votes.size)
+        return votes.reshape(n_rows, n_classes) / len(self.estimators_)
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Predict the majority-vote class (ties go to the earlier class).
+
+        Args:
+            df (pd.DataFrame): Rows containing the training feature columns.
+
+        Returns:
+            np.ndarray: Predicted class labels.
+        """
+        return self.classes_[np.argmax(self.predict_proba(df), axis=1)]
+
+
+def _grow_forest_member(
+    template: DecisionTreeClassifier,
+    codes: np.ndarray,
+    numeric_values: Dict[int, np.ndarray],
+    target_codes: np.ndarray,
+    seed: np.random.SeedSequence,
+    bootstrap: bool,
+) -> DecisionTreeClassifier:
+    """
+    Grow one ensemble tree on a bootstrap sample of the shared column store.
+    """
+    rng = np.random.default_rng(seed)
+    tree = copy.copy(template)
+    tree.random_state = rng
+    n_rows = codes.shape[0]
+    rows = rng.integers(0, n_rows, n_rows) if bootstrap else None
+    tree._fit_encoded(codes, numeric_values, target_codes, rows)
+    return tree
+
+
+def _fit_forest_parallel(
+    template: DecisionTreeClassifier,
+    codes: np.ndarray,
+    numeric_values: Dict[int, np.ndarray],
+    target_codes: np.ndarray,
+    seeds: List[np.random.SeedSequence],
+    bootstrap: bool,
+    n_jobs: int,
+) -> List[DecisionTreeClassifier]:
+    """
+    Train ensemble members on a process pool over shared-memory inputs.
+    """
+    numeric_index = sorted(numeric_values)
+    numeric_matrix = np.empty((codes.shape[0], len(numeric_index)), order="F")
+    for col, j in enumerate(numeric_index):
+        numeric_matrix[:, col] = numeric_values[j]
+    segments: List[shared_memory.SharedMemory] = []
+    try:
+        specs = [
+            _share_array(array, segments) for array in (codes, numeric_matrix, target_codes)
+        ]
+        worker = partial(_fit_forest_member, template, specs, numeric_index, bootstrap=bootstrap)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(worker, seeds))
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def _fit_forest_member(
+    template: DecisionTreeClassifier,
+    specs: List[tuple],
+    numeric_index: List[int],
+    seed: np.random.SeedSequence,
+    bootstrap: bool,
+) -> DecisionTreeClassifier:
+    """
+    Process-pool entry point: attach to the shared arrays and grow one tree.
+    """
+    segments = [shared_memory.SharedMemory(name=spec[0]) for spec in specs]
+    try:
+        codes, numeric_matrix, target_codes = (
+            np.ndarray(shape, dtype=dtype, buffer=segment.buf, order="F")
+            for segment, (_, shape, dtype) in zip(segments, specs)
+        )
+        numeric_values = {j: numeric_matrix[:, col] for col, j in enumerate(numeric_index)}
+        tree = _grow_forest_member(
+            template, codes, numeric_values, target_codes, seed, bootstrap
+        )
+        # Views must be released before the segments can be closed.
+        del codes, numeric_matrix, target_codes, numeric_values
+        return tree
+    finally:
+        for segment in segments:
+            segment.close()
+
+
+def _share_array(
+    array: np.ndarray, segments: List[shared_memory.SharedMemory]
+) -> tuple[str, tuple, str]:
+    """
+    Copy `array` into a new shared-memory segment and describe it for workers.
+    """
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    segments.append(segment)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf, order="F")
+    view[...] = array
+    del view
+    return segment.name, array.shape, array.dtype.str
@@ -0,0 +1,368 @@
+"""Asyncio micro-batching prediction service for the probabilistic classifiers.
+
+Concurrent single-row requests are coalesced into one matrix and scored with a
+single vectorised ``predict_proba`` call, so per-call NumPy overhead is paid
+once per batch instead of once per request. The service speaks line-delimited
+JSON over a local TCP socket:
+
+    request:  {"id": 7, "features": [0.1, 2.3]}
+    response: {"id": 7, "proba": [0.2, 0.8]}     (a float for LogisticRegression)
+    request:  {"stats": true}
+    response: {"stats": {...}}                    (see `BatchStats.summary`)
+
+Run ``python inference_server.py MODEL_FILE --model-type softmax`` to serve a
+model written by ``save``; `load_generator.py` drives it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+from logistic_softmax import LogisticRegression, SoftmaxRegression
+
+_MODEL_TYPES = {"logistic": LogisticRegression, "softmax": SoftmaxRegression}
+# Latency samples kept for percentile estimates.
+_LATENCY_WINDOW = 100_000
+
+
+class BatchStats:
+    """
+    Running request latency and batch-size statistics.
+
+    Counters cover the whole lifetime of the service; latency percentiles are
+    computed over the most recent `_LATENCY_WINDOW` requests.
+    """
+
+    def __init__(self) -> None:
+        self.n_requests = 0
+        self.n_batches = 0
+        self.max_batch_size = 0
+        self.latencies_ = deque(maxlen=_LATENCY_WINDOW)
+
+    def record(self, latencies: np.ndarray) -> None:
+        """
+        Record one scored batch.
+
+        Args:
+            latencies (np.ndarray): Seconds from enqueue to result, per request.
+        """
+        self.n_requests += latencies.size
+        self.n_batches += 1
+        self.max_batch_size = max(self.max_batch_size, int(latencies.size))
+        self.latencies_.extend(latencies.tolist())
+
+    def summary(self) -> dict:
+        """
+        Summarise the statistics collected so far.
+
+        Returns:
+            dict: Keys "requests", "batches", "mean_batch_size",
+            "max_batch_size", and "latency_ms" holding mean/p50/p95/p99/max.
+        """
+        latencies_ms = np.asarray(self.latencies_, dtype=float) * 1e3
+        if latencies_ms.size:
+            p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+            latency = {
+                "mean": float(latencies_ms.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(latencies_ms.max()),
+            }
+        else:
+            latency = {key: 0.0 for key in ("mean", "p50", "p95", "p99", "max")}
+        return {
+            "requests": self.n_requests,
+            "batches": self.n_batches,
+            "mean_batch_size": self.n_requests / self.n_batches if self.n_batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "latency_ms": latency,
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent row predictions into batched `predict_proba` calls.
+
+    A batch is closed as soon as it holds `max_batch_size` rows or
+    `max_wait_ms` has passed since its first row arrived, whichever is first.
+    Scoring runs on the event loop, which is the right trade-off for the
+    sub-millisecond vectorised calls this is built for.
+    """
+
+    def __init__(
+        self,
+        predict_proba: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        n_features: int | None = None,
+    ) -> None:
+        """
+        Args:
+            predict_proba (Callable): Vectorised scorer taking (n, p) rows.
+            max_batch_size (int): Upper bound on rows per call (>= 1).
+            max_wait_ms (float): Longest time a row waits for companions (>= 0).
+            n_features (int | None): Expected row length. Rows of any other
+                length are rejected before they are queued; None skips the
+                check and relies on per-row re-scoring of failed batches.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative.")
+        self.predict_proba = predict_proba
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.n_features = n_features
+        self.stats = BatchStats()
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        # Rows taken off the queue but not yet resolved, so `stop` can fail them.
+        self._batch: list = []
+
+    async def start(self) -> None:
+        """
+        Start the batching task on the running event loop.
+        """
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the batching task; rows in flight or still queued are failed.
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        pending = self._batch
+        self._batch = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("MicroBatcher stopped."))
+
+    async def predict(self, features) -> np.ndarray | float:
+        """
+        Score one row, sharing a `predict_proba` call with concurrent callers.
+
+        Args:
+            features (array-like): One feature vector of shape (n_features,).
+
+        Returns:
+            np.ndarray | float: That row of the model's `predict_proba` output.
+
+        Raises:
+            RuntimeError: If the batcher has not been started.
+            ValueError: If the row length differs from `n_features`.
+        """
+        if self._worker is None:
+            raise RuntimeError("MicroBatcher must be started before predicting.")
+        row = np.asarray(features, dtype=float).ravel()
+        if self.n_features is not None and row.size != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {row.size}.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future, time.perf_counter()))
+        return await future
+
+    async def _run(self) -> None:
+        """
+        Collect batches from the queue and fan results back to the callers.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch = batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1e3
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                self._score(batch)
+            except Exception as exc:  # keep the worker alive for later requests
+                _fail(batch, exc)
+            self._batch = []
+
+    def _score(self, batch: list) -> None:
+        """
+        Run one vectorised call for `batch` and resolve its futures.
+
+        If the batched call fails, the rows are re-scored one at a time so
+        that only the offending requests receive the error.
+        """
+        rows, futures, enqueued = zip(*batch)
+        try:
+            probs = self.predict_proba(np.stack(rows))
+            if len(probs) != len(rows):
+                raise ValueError(f"Scorer returned {len(probs)} rows for {len(rows)} requests.")
+        except Exception as exc:  # isolate bad rows before reporting errors
+            if len(batch) == 1:
+                _fail(batch, exc)
+            else:
+                for item in batch:
+                    self._score([item])
+            return
+        done = time.perf_counter()
+        for future, result in zip(futures, probs):
+            if not future.done():
+                future.set_result(result)
+        self.stats.record(done - np.asarray(enqueued))
+
+
+def _fail(batch: list, exc: BaseException) -> None:
+    """
+    Resolve every unfinished future in `batch` with `exc`.
+    """
+    for _, future, _ in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+class InferenceServer:
+    """
+    Line-delimited JSON prediction server on a local TCP socket.
+
+    Every request line is handled in its own task, so a client may pipeline
+    many requests over one connection; responses carry the request ``id`` and
+    may arrive out of order.
+    """
+
+    def __init__(
+        self,
+        model,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            model: Fitted estimator exposing `predict_proba`; its `weights` (if
+                any) fix the accepted row length.
+            host (str): Interface to bind.
+            port (int): Port to bind (0 picks a free one; see `port`).
+            max_batch_size (int): Forwarded to `MicroBatcher`.
+            max_wait_ms (float): Forwarded to `MicroBatcher`.
+        """
+        self.host = host
+        self.port = port
+        weights = getattr(model, "weights", None)
+        n_features = None if weights is None else int(np.shape(weights)[0])
+        self.batcher = MicroBatcher(model.predict_proba, max_batch_size, max_wait_ms, n_features)
+        self._server: asyncio.base_events.Server | None = None
+
+    async def start(self) -> int:
+        """
+        Start batching and listening.
+
+        Returns:
+            int: The bound port.
+        """
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """
+        Stop accepting connections and shut the batcher down.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        """
+        Start (if needed) and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one client connection.
+        """
+        pending = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """
+        Answer one request line.
+        """
+        request: dict = {}
+        try:
+            request = json.loads(line)
+            if request.get("stats"):
+                response = {"stats": self.batcher.stats.summary()}
+            else:
+                proba = await self.batcher.predict(request["features"])
+                response = {"id": request.get("id"), "proba": np.asarray(proba).tolist()}
+        except Exception as exc:  # report bad requests instead of dropping the connection
+            request_id = request.get("id") if isinstance(request, dict) else None
+            response = {"id": request_id, "error": str(exc)}
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Serve a saved classifier until interrupted.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("model", help="Model file written by the classifier's save().")
+    parser.add_argument("--model-type", choices=sorted(_MODEL_TYPES), default="softmax")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+    model = _MODEL_TYPES[args.model_type].load(args.model)
+    server = InferenceServer(model, args.host, args.port, args.max_batch_size, args.max_wait_ms)
+
+    async def run() -> None:
+        port = await server.start()
+        print(f"Serving {args.model_type} model on {args.host}:{port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,48 +2,384 @@
 
 from __future__ import annotations
 
+from typing import Iterable, Iterator, Sequence
+
 import numpy as np
+import pandas as pd
+
+from model_io import load_model, save_model
+from sparse_utils import as_csr, is_sparse, to_dense
+
+_SOLVERS = ("auto", "cholesky", "qr", "svd", "cg")
+# Rows per block when accumulating XᵀX, so temporaries stay O(chunk * p).
+_GRAM_CHUNK_ROWS = 65536
+# Above this many features "auto" avoids forming the (p, p) Gram matrix.
+_DIRECT_MAX_FEATURES = 2000
+# Condition estimate beyond which "auto" abandons Cholesky for SVD.
+_MAX_CHOLESKY_CONDITION = 1e10
+_CG_TOL = 1e-10
+_PATH_SCORINGS = ("loo", "gcv")
+
+
+def iter_csv_blocks(
+    path,
+    feature_columns: Sequence[str],
+    target_column: str,
+    chunk_rows: int = 100_000,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream a CSV file as (X_block, y_block) pairs of at most `chunk_rows` rows.
+
+    Only one block is held in memory at a time, so the blocks can be fed to
+    `LinearRegression.partial_fit` / `fit_chunks` for files larger than RAM.
+
+    Args:
+        path (str | Path): CSV file, e.g. ``data/regression_2d.csv``.
+        feature_columns (Sequence[str]): Columns forming X, in order.
+        target_column (str): Column holding y.
+        chunk_rows (int): Maximum rows per block (> 0).
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: Float feature block and target block.
+
+    Raises:
+        ValueError: If chunk_rows is not positive.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive.")
+    columns = list(feature_columns) + [target_column]
+    for frame in pd.read_csv(path, usecols=columns, chunksize=chunk_rows):
+        yield (
+            frame[list(feature_columns)].to_numpy(dtype=float),
+            frame[target_column].to_numpy(dtype=float),
+        )
+
+
+def _conjugate_gradient(
+    matvec,
+    rhs: np.ndarray,
+    diag: np.ndarray,
+    tol: float = _CG_TOL,
+    max_iter: int | None = None,
+) -> np.ndarray:
+    """
+    Jacobi-preconditioned conjugate gradients for a symmetric PD operator.
+
+    Args:
+        matvec (Callable[[np.ndarray], np.ndarray]): Computes A @ v.
+        rhs (np.ndarray): Right-hand side b.
+        diag (np.ndarray): Diagonal of A, used as the preconditioner.
+        tol (float): Relative residual tolerance ||r|| / ||b||.
+        max_iter (int | None): Iteration cap (defaults to 10 * len(b)).
+
+    Returns:
+        np.ndarray: Approximate solution of A x = b.
+    """
+    max_iter = 10 * rhs.shape[0] if max_iter is None else max_iter
+    inv_diag = np.where(diag > 0, 1.0 / np.where(diag > 0, diag, 1.0), 1.0)
+    x = np.zeros_like(rhs)
+    residual = rhs.copy()
+    z = inv_diag * residual
+    direction = z.copy()
+    rz = float(residual @ z)
+    threshold = tol * max(float(np.linalg.norm(rhs)), np.finfo(float).tiny)
+    for _ in range(max_iter):
+        if np.linalg.norm(residual) <= threshold:
+            break
+        a_dir = matvec(direction)
+        step = rz / float(direction @ a_dir)
+        x += step * direction
+        residual -= step * a_dir
+        z = inv_diag * residual
+        rz_next = float(residual @ z)
+        direction = z + (rz_next / rz) * direction
+        rz = rz_next
+    return x
 
 
 class LinearRegression:
-    def __init__(self, fit_intercept: bool = True, reg_strength: float = 0.0) -> None:
+    def __init__(
+        self,
+        fit_intercept: bool = True,
+        reg_strength: float = 0.0,
+        solver: str = "auto",
+    ) -> None:
         """
         Closed-form linear regression solver with optional L2 regularisation.
 
         Args:
-            fit_intercept (bool): Whether to augment X with a bias column.
+            fit_intercept (bool): Whether to fit an unpenalised bias term.
             reg_strength (float): Ridge penalty applied to coefficients
                 (intercept excluded).
+            solver (str): One of {"auto", "cholesky", "qr", "svd", "cg"}.
+                "cholesky" factors XᵀX accumulated in row chunks (fastest for
+                tall data), "qr" and "svd" factor the centred X (more stable;
+                "svd" also handles rank deficiency) and "cg" runs conjugate
+                gradients without ever forming XᵀX. "auto" picks by shape,
+                sparsity and the conditioning seen during the Cholesky step;
+                the choice is stored in `solver_`.
         """
         if reg_strength < 0:
             raise ValueError("reg_strength cannot be negative.")
+        if solver not in _SOLVERS:
+            raise ValueError(f"solver must be one of {_SOLVERS}.")
         self.fit_intercept = fit_intercept
         self.reg_strength = reg_strength
+        self.solver = solver
         self.coef_: np.ndarray | None = None
         self.intercept_: float = 0.0
+        self.solver_: str | None = None
+        self.alphas_: np.ndarray | None = None
+        self.coef_path_: np.ndarray | None = None
+        self.intercept_path_: np.ndarray | None = None
+        self.cv_errors_: np.ndarray | None = None
+        self.best_alpha_: float | None = None
+        self._stats: dict | None = None
+        # Set by partial_fit: `_stats` holds rows that coef_ does not reflect yet.
+        self._stale = False
+
+    @property
+    def coef_(self) -> np.ndarray | None:
+        """
+        Fitted coefficients, solving for rows added by `partial_fit` first.
+        """
+        if self._stale:
+            self._solve_accumulated()
+        return self._coef
+
+    @coef_.setter
+    def coef_(self, value: np.ndarray | None) -> None:
+        self._coef = value
+        self._stale = False
+
+    @property
+    def intercept_(self) -> float:
+        """
+        Fitted intercept, solving for rows added by `partial_fit` first.
+        """
+        if self._stale:
+            self._solve_accumulated()
+        return self._intercept
+
+    @intercept_.setter
+    def intercept_(self, value: float) -> None:
+        self._intercept = value
 
     def fit(self, X: np.ndarray, y: np.ndarray) -> "LinearRegression":
         """
-        Solve the normal equations and store weights/intercept.
+        Solve the (ridge) least-squares problem and store weights/intercept.
+
+        The intercept is handled by centring rather than by a bias column, so
+        X is never copied into an augmented matrix. SciPy sparse inputs are
+        supported by the "cholesky" and "cg" solvers.
 
         Args:
-            X (array-like): Training design matrix (n_samples, n_features).
+            X (array-like | scipy.sparse matrix): Training design matrix
+                (n_samples, n_features).
             y (array-like): Target vector (n_samples,) or (n_samples, 1).
 
         Returns:
             LinearRegression: Fitted estimator (self).
 
         Raises:
-            ValueError: If X and y have different numbers of samples.
+            ValueError: If X and y have different numbers of samples, or the
+                solver does not support sparse input.
+        """
+        X_arr, y_arr = self._prepare_training_data(X, y)
+        solver = self._select_solver(X_arr)
+        if solver in ("qr", "svd") and is_sparse(X_arr):
+            raise ValueError(f"solver '{solver}' does not support sparse input.")
+
+        self._stats = None
+        if solver == "cholesky":
+            stats = self._empty_statistics(X_arr)
+            self._accumulate_statistics(stats, X_arr, y_arr)
+            coef, intercept, well_conditioned = self._solve_from_statistics(stats)
+            if not well_conditioned and self.solver == "auto" and not is_sparse(X_arr):
+                solver = "svd"
+            else:
+                self._stats = stats
+        if solver == "cg":
+            coef, intercept = self._fit_cg(X_arr, y_arr)
+        elif solver in ("qr", "svd"):
+            coef, intercept = self._fit_factorized(X_arr, y_arr, solver)
+
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.solver_ = solver
+        return self
+
+    def fit_path(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        alphas,
+        scoring: str = "loo",
+    ) -> "LinearRegression":
+        """
+        Fit the ridge solution for every penalty in `alphas` from one SVD.
+
+        The centred design matrix is factorised once, after which each alpha
+        only rescales the singular values. Leave-one-out errors come from the
+        closed-form hat-matrix diagonal, so no refitting is needed either. The
+        estimator ends up holding the solution for the best-scoring alpha;
+        `reg_strength` itself is left unchanged.
+
+        Args:
+            X (array-like): Dense design matrix (n_samples, n_features).
+            y (array-like): Target vector.
+            alphas (array-like): Non-negative ridge penalties to evaluate.
+            scoring (str): "loo" for the exact leave-one-out mean squared error
+                or "gcv" for generalised cross-validation.
+
+        Returns:
+            LinearRegression: Estimator with `alphas_`, `coef_path_`
+            (n_alphas, n_features), `intercept_path_`, `cv_errors_` and
+            `best_alpha_` populated, and `coef_`/`intercept_` set to the best fit.
+
+        Raises:
+            ValueError: If alphas is empty or negative, scoring is unknown, or
+                X is sparse.
+        """
+        if scoring not in _PATH_SCORINGS:
+            raise ValueError(f"scoring must be one of {_PATH_SCORINGS}.")
+        alphas_arr = np.asarray(alphas, dtype=float).ravel()
+        if alphas_arr.size == 0 or np.any(alphas_arr < 0):
+            raise ValueError("alphas must be a non-empty sequence of non-negative values.")
+        X_arr, y_arr = self._prepare_training_data(X, y)
+        if is_sparse(X_arr):
+            raise ValueError("fit_path does not support sparse input.")
+        n_samples = X_arr.shape[0]
+        x_mean = X_arr.mean(axis=0) if self.fit_intercept else np.zeros(X_arr.shape[1])
+        y_mean = float(y_arr.mean()) if self.fit_intercept else 0.0
+        X_c = X_arr - x_mean if self.fit_intercept else X_arr
+        u, sing, vt = np.linalg.svd(X_c, full_matrices=False)
+        cutoff = np.finfo(float).eps * max(X_c.shape) * (sing[0] if sing.size else 0.0)
+        sing = np.where(sing > cutoff, sing, 0.0)
+        uty = u.T @ (y_arr - y_mean)
+
+        # shrink[k, a] = s_k² / (s_k² + alpha_a); 0/0 (null directions, alpha=0) -> 0.
+        sq = sing[:, None] ** 2
+        denom = sq + alphas_arr[None, :]
+        shrink = np.divide(sq, denom, out=np.zeros_like(denom), where=denom > 0)
+        inv_sing = np.divide(1.0, sing, out=np.zeros_like(sing), where=sing > 0)
+        coef_path = (vt.T @ (shrink * (inv_sing * uty)[:, None])).T
+        intercept_path = y_mean - coef_path @ x_mean
+
+        residuals = (y_arr - y_mean)[:, None] - u @ (shrink * uty[:, None])
+        offset = 1.0 / n_samples if self.fit_intercept else 0.0
+        # Interpolating fits (leverage 1, e.g. alpha=0 with p >= n - 1) score inf.
+        if scoring == "loo":
+            denom = 1.0 - ((u**2) @ shrink + offset)
+            loo = np.divide(
+                residuals, denom, out=np.full_like(residuals, np.inf), where=denom > 1e-12
+            )
+            cv_errors = np.mean(loo**2, axis=0)
+        else:
+            denom = 1.0 - (shrink.sum(axis=0) / n_samples + offset)
+            mse = np.mean(residuals**2, axis=0)
+            cv_errors = np.divide(
+                mse, denom**2, out=np.full_like(mse, np.inf), where=denom > 1e-12
+            )
+
+        best = int(np.nanargmin(cv_errors))
+        self.alphas_ = alphas_arr
+        self.coef_path_ = coef_path
+        self.intercept_path_ = np.asarray(intercept_path, dtype=float)
+        self.cv_errors_ = cv_errors
+        self.best_alpha_ = float(alphas_arr[best])
+        self.coef_ = coef_path[best].copy()
+        self.intercept_ = float(self.intercept_path_[best])
+        self.solver_ = "svd"
+        self._stats = None
+        return self
+
+    def partial_fit(self, X_chunk: np.ndarray, y_chunk: np.ndarray) -> "LinearRegression":
+        """
+        Add one chunk of rows to the running sufficient statistics.
+
+        Only XᵀX, Xᵀy, the column/target sums and the row count are kept, so
+        memory is O(n_features²) however many rows are streamed. Each call is
+        O(n_rows * n_features²); the O(n_features³) solve is deferred until
+        `coef_`, `intercept_` or `predict` is next used, so it runs once
+        however many chunks arrive in between. The weights then equal those of
+        a single Cholesky `fit` on the concatenated chunks (up to
+        floating-point rounding). Continues from a previous `fit` when that
+        fit used the Cholesky solver.
+
+        Args:
+            X_chunk (array-like | scipy.sparse matrix): Rows (n_rows, n_features).
+            y_chunk (array-like): Targets for those rows.
+
+        Returns:
+            LinearRegression: Updated estimator (self).
+
+        Raises:
+            ValueError: If the chunk's feature count differs from earlier chunks.
+            RuntimeError: If the current fit kept no sufficient statistics
+                (a non-Cholesky solver, `fit_path`, or a model saved without
+                them), since its data cannot be combined with the new chunk.
+        """
+        if self._stats is None and self._coef is not None:
+            raise RuntimeError(
+                f"Cannot continue a '{self.solver_}' fit without sufficient statistics; "
+                "refit with solver='cholesky' or start a new stream with fit_chunks."
+            )
+        self._accumulate_chunk(X_chunk, y_chunk)
+        self._stale = True
+        self.solver_ = "cholesky"
+        return self
+
+    def fit_chunks(self, chunks: Iterable[tuple[np.ndarray, np.ndarray]]) -> "LinearRegression":
         """
-        raise NotImplementedError("Implement LinearRegression.fit.")
+        Fit on a stream of (X_block, y_block) pairs, solving only once at the end.
+
+        Args:
+            chunks (Iterable[tuple]): E.g. the output of `iter_csv_blocks`.
+
+        Returns:
+            LinearRegression: Fitted estimator (self).
+
+        Raises:
+            ValueError: If the stream is empty or chunk widths disagree.
+        """
+        self._stats = None
+        for X_chunk, y_chunk in chunks:
+            self._accumulate_chunk(X_chunk, y_chunk)
+        if self._stats is None:
+            raise ValueError("Cannot fit on an empty stream of chunks.")
+        self._solve_accumulated()
+        return self
+
+    def _accumulate_chunk(self, X_chunk, y_chunk) -> None:
+        """
+        Validate a chunk and fold it into `self._stats`.
+        """
+        X_arr, y_arr = self._prepare_training_data(X_chunk, y_chunk)
+        if self._stats is None:
+            self._stats = self._empty_statistics(X_arr)
+        elif X_arr.shape[1] != self._stats["gram"].shape[0]:
+            raise ValueError("X_chunk has a different number of features than seen before.")
+        elif not self._stats["gram"].flags.writeable:
+            # Statistics mapped read-only by `load`; copy before accumulating.
+            for key in ("gram", "xty", "col_sums", "shift"):
+                self._stats[key] = np.array(self._stats[key])
+        self._accumulate_statistics(self._stats, X_arr, y_arr)
+
+    def _solve_accumulated(self) -> None:
+        """
+        Solve the normal equations held in `self._stats`.
+        """
+        self.coef_, self.intercept_, _ = self._solve_from_statistics(self._stats)
+        self.solver_ = "cholesky"
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Predict responses for new samples.
 
         Args:
-            X (array-like): Input matrix of shape (n_samples, n_features).
+            X (array-like | scipy.sparse matrix): Input matrix of shape
+                (n_samples, n_features).
 
         Returns:
             np.ndarray: 1-D array of predictions.
@@ -51,18 +387,278 @@ class LinearRegression:
         Raises:
             RuntimeError: If called before fit.
         """
-        raise NotImplementedError("Implement LinearRegression.predict.")
+        if self.coef_ is None:
+            raise RuntimeError("LinearRegression must be fitted before predicting.")
+        X_arr = self._ensure_2d(X)
+        if X_arr.shape[1] != self.coef_.shape[0]:
+            raise ValueError("X has a different number of features than seen during fit.")
+        return np.asarray(X_arr @ self.coef_).ravel() + self.intercept_
+
+    def save(self, path, include_stats: bool = False) -> None:
+        """
+        Write the fitted model to a binary model file (see `model_io`).
+
+        The regularisation path is stored too. The streaming sufficient
+        statistics hold a (n_features, n_features) Gram matrix, so they are
+        only written on request.
+
+        Args:
+            path (str | Path): Destination file.
+            include_stats (bool): Also store the sufficient statistics so a
+                loaded model can keep calling `partial_fit`.
+
+        Raises:
+            RuntimeError: If called before fit.
+        """
+        if self.coef_ is None:
+            raise RuntimeError("LinearRegression must be fitted before saving.")
+        params = {
+            "fit_intercept": self.fit_intercept,
+            "reg_strength": self.reg_strength,
+            "solver": self.solver,
+            "intercept_": self.intercept_,
+            "solver_": self.solver_,
+            "best_alpha_": self.best_alpha_,
+        }
+        arrays = {"coef_": self.coef_}
+        for name in ("alphas_", "coef_path_", "intercept_path_", "cv_errors_"):
+            if getattr(self, name) is not None:
+                arrays[name] = getattr(self, name)
+        if include_stats and self._stats is not None:
+            params["stats_y_sum"] = self._stats["y_sum"]
+            params["stats_n_samples"] = self._stats["n_samples"]
+            for key in ("gram", "xty", "col_sums", "shift"):
+                arrays[f"stats_{key}"] = self._stats[key]
+        save_model(path, "LinearRegression", params, arrays)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "LinearRegression":
+        """
+        Load a model written by `save`.
+
+        Args:
+            path (str | Path): Model file.
+            mmap (bool): Map `coef_`, the path arrays and any sufficient
+                statistics read-only from the file instead of copying them
+                into memory. `partial_fit` copies the statistics on first use.
+
+        Returns:
+            LinearRegression: The restored estimator.
+        """
+        params, arrays = load_model(path, mmap, kind="LinearRegression")
+        model = cls(
+            fit_intercept=params["fit_intercept"],
+            reg_strength=params["reg_strength"],
+            solver=params["solver"],
+        )
+        model.coef_ = arrays["coef_"]
+        model.intercept_ = params["intercept_"]
+        model.solver_ = params["solver_"]
+        model.best_alpha_ = params["best_alpha_"]
+        for name in ("alphas_", "coef_path_", "intercept_path_", "cv_errors_"):
+            setattr(model, name, arrays.get(name))
+        if "stats_gram" in arrays:
+            keys = ("gram", "xty", "col_sums", "shift")
+            model._stats = {key: arrays[f"stats_{key}"] for key in keys}
+            model._stats["y_sum"] = params["stats_y_sum"]
+            model._stats["n_samples"] = params["stats_n_samples"]
+        return model
+
+    def _select_solver(self, X) -> str:
+        """
+        Resolve "auto" into a concrete solver from the shape of X.
+        """
+        if self.solver != "auto":
+            return self.solver
+        n_samples, n_features = X.shape
+        if n_features > _DIRECT_MAX_FEATURES:
+            return "cg"
+        if is_sparse(X) or n_samples >= n_features:
+            return "cholesky"
+        return "svd"
+
+    def _empty_statistics(self, X) -> dict:
+        """
+        Create zeroed sufficient statistics for X's feature count.
+
+        Columns are shifted by the mean of the first block (when it is dense)
+        before accumulating, which keeps the later centring free of
+        catastrophic cancellation when features have large offsets. Later
+        sparse blocks receive the same shift algebraically.
+
+        Returns:
+            dict: Keys "gram", "xty", "col_sums", "y_sum", "n_samples", "shift".
+        """
+        n_features = X.shape[1]
+        shift = np.zeros(n_features)
+        if self.fit_intercept and not is_sparse(X):
+            shift = X[:_GRAM_CHUNK_ROWS].mean(axis=0)
+        return {
+            "gram": np.zeros((n_features, n_features)),
+            "xty": np.zeros(n_features),
+            "col_sums": np.zeros(n_features),
+            "y_sum": 0.0,
+            "n_samples": 0,
+            "shift": shift,
+        }
+
+    @staticmethod
+    def _accumulate_statistics(stats: dict, X, y: np.ndarray) -> None:
+        """
+        Add XᵀX, Xᵀy and column/target sums of (X, y) to `stats` in row chunks.
+        """
+        shift = stats["shift"]
+        for start in range(0, X.shape[0], _GRAM_CHUNK_ROWS):
+            block = X[start : start + _GRAM_CHUNK_ROWS]
+            y_block = y[start : start + _GRAM_CHUNK_ROWS]
+            if not is_sparse(block):
+                block = block - shift
+            stats["gram"] += to_dense(block.T @ block)
+            stats["xty"] += np.asarray(block.T @ y_block).ravel()
+            col_sums = np.asarray(block.sum(axis=0)).ravel()
+            if is_sparse(block) and np.any(shift):
+                # Shift sparse blocks algebraically so they stay sparse:
+                # (B - 1sᵀ)ᵀ(B - 1sᵀ) = BᵀB - s cᵀ - c sᵀ + m s sᵀ with c = Bᵀ1.
+                cross = np.outer(shift, col_sums)
+                stats["gram"] += block.shape[0] * np.outer(shift, shift) - cross - cross.T
+                stats["xty"] -= shift * float(y_block.sum())
+                col_sums = col_sums - block.shape[0] * shift
+            stats["col_sums"] += col_sums
+        stats["y_sum"] += float(y.sum())
+        stats["n_samples"] += X.shape[0]
+
+    def _solve_from_statistics(self, stats: dict) -> tuple[np.ndarray, float, bool]:
+        """
+        Solve the ridge normal equations from accumulated statistics.
+
+        Returns:
+            tuple[np.ndarray, float, bool]: Coefficients, intercept and whether
+            the Cholesky factorisation succeeded with acceptable conditioning.
+        """
+        n_samples = stats["n_samples"]
+        system = stats["gram"].copy()
+        rhs = stats["xty"].copy()
+        col_means = stats["col_sums"] / n_samples
+        y_mean = stats["y_sum"] / n_samples
+        if self.fit_intercept:
+            system -= n_samples * np.outer(col_means, col_means)
+            rhs -= n_samples * col_means * y_mean
+        system[np.diag_indices_from(system)] += self.reg_strength
+        well_conditioned = True
+        try:
+            lower = np.linalg.cholesky(system)
+            diag = np.abs(np.diag(lower))
+            well_conditioned = bool(diag.min() > 0) and (
+                (diag.max() / diag.min()) ** 2 <= _MAX_CHOLESKY_CONDITION
+            )
+            coef = np.linalg.solve(lower.T, np.linalg.solve(lower, rhs))
+        except np.linalg.LinAlgError:
+            well_conditioned = False
+            coef = np.linalg.lstsq(system, rhs, rcond=None)[0]
+        intercept = 0.0
+        if self.fit_intercept:
+            intercept = float(y_mean - (stats["shift"] + col_means) @ coef)
+        return coef, intercept, well_conditioned
+
+    def _fit_factorized(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        solver: str,
+    ) -> tuple[np.ndarray, float]:
+        """
+        Solve via QR or SVD of the centred design matrix.
+        """
+        x_mean = X.mean(axis=0) if self.fit_intercept else np.zeros(X.shape[1])
+        y_mean = float(y.mean()) if self.fit_intercept else 0.0
+        X_c = X - x_mean if self.fit_intercept else X
+        y_c = y - y_mean
+        if solver == "svd":
+            u, sing, vt = np.linalg.svd(X_c, full_matrices=False)
+            if self.reg_strength > 0:
+                factors = sing / (sing**2 + self.reg_strength)
+            else:
+                cutoff = np.finfo(float).eps * max(X_c.shape) * (sing[0] if sing.size else 0.0)
+                factors = np.where(sing > cutoff, 1.0 / np.where(sing > cutoff, sing, 1.0), 0.0)
+            coef = vt.T @ (factors * (u.T @ y_c))
+        else:
+            if self.reg_strength > 0:
+                # Ridge as ordinary least squares on [X; sqrt(alpha) I].
+                X_c = np.vstack([X_c, np.sqrt(self.reg_strength) * np.eye(X.shape[1])])
+                y_c = np.concatenate([y_c, np.zeros(X.shape[1])])
+            q, r = np.linalg.qr(X_c)
+            try:
+                coef = np.linalg.solve(r, q.T @ y_c)
+            except np.linalg.LinAlgError:
+                coef = np.linalg.lstsq(X_c, y_c, rcond=None)[0]
+        intercept = float(y_mean - x_mean @ coef) if self.fit_intercept else 0.0
+        return coef, intercept
+
+    def _fit_cg(self, X, y: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Solve the centred normal equations with matrix-free conjugate gradients.
+
+        Only products with X and Xᵀ are needed, so sparse inputs stay sparse
+        and XᵀX is never formed.
+        """
+        n_samples = X.shape[0]
+        col_means = np.asarray(X.mean(axis=0)).ravel() if self.fit_intercept else 0.0
+        y_mean = float(y.mean()) if self.fit_intercept else 0.0
+
+        def normal_matvec(w: np.ndarray) -> np.ndarray:
+            # Centre the residual-sized vectors, not XᵀX, to avoid cancellation.
+            residual = np.asarray(X @ w).ravel()
+            if self.fit_intercept:
+                residual -= float(col_means @ w)
+            out = np.asarray(X.T @ residual).ravel()
+            if self.fit_intercept:
+                out -= col_means * residual.sum()
+            return out + self.reg_strength * w
+
+        rhs = np.asarray(X.T @ (y - y_mean)).ravel()
+        if is_sparse(X):
+            diag = np.asarray(X.multiply(X).sum(axis=0)).ravel() - n_samples * col_means**2
+        elif self.fit_intercept:
+            diag = n_samples * X.var(axis=0)
+        else:
+            diag = np.einsum("ij,ij->j", X, X)
+        diag = diag + self.reg_strength
+        coef = _conjugate_gradient(normal_matvec, rhs, diag)
+        intercept = float(y_mean - col_means @ coef) if self.fit_intercept else 0.0
+        return coef, intercept
+
+    def _prepare_training_data(self, X, y) -> tuple:
+        """
+        Validate and convert a training design matrix and target vector.
+        """
+        X_arr = self._ensure_2d(X)
+        y_arr = np.asarray(y, dtype=float).ravel()
+        if X_arr.shape[0] != y_arr.shape[0]:
+            raise ValueError("X and y must contain the same number of samples.")
+        if X_arr.shape[0] == 0:
+            raise ValueError("Cannot fit on an empty dataset.")
+        return X_arr, y_arr
 
     def _augment_features(self, X: np.ndarray) -> np.ndarray:
         """
         Optionally prepend a bias column to X.
         """
-        raise NotImplementedError("Implement LinearRegression._augment_features.")
+        if not self.fit_intercept:
+            return X
+        return np.hstack([np.ones((X.shape[0], 1)), X])
 
     @staticmethod
     def _ensure_2d(X: np.ndarray) -> np.ndarray:
         """
         Coerce the input into a 2-D NumPy array of floats.
-        """
-        raise NotImplementedError("Implement LinearRegression._ensure_2d.")
 
+        SciPy sparse inputs are returned as CSR matrices of floats instead.
+        """
+        if is_sparse(X):
+            return as_csr(X)
+        X_arr = np.asarray(X, dtype=float)
+        if X_arr.ndim == 1:
+            X_arr = X_arr.reshape(-1, 1)
+        if X_arr.ndim != 2:
+            raise ValueError("X must be a 2-D array of shape (n_samples, n_features).")
+        return X_arr
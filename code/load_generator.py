@@ -0,0 +1,153 @@
+"""Load generator for the micro-batching inference server.
+
+Opens ``--concurrency`` connections to a running `inference_server` and has
+each send requests back to back, then reports client-side throughput and
+latency next to the server's batching statistics. With ``--demo`` it first
+trains a small SoftmaxRegression and serves it in-process on a free local
+port, so the whole loop can be tried without a saved model:
+
+    python load_generator.py --demo --requests 5000 --concurrency 64
+    python load_generator.py --port 8765 --features 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from inference_server import InferenceServer
+from logistic_softmax import SoftmaxRegression
+
+
+async def _client(host: str, port: int, rows: np.ndarray, latencies: list) -> None:
+    """
+    Send `rows` one request at a time over a single connection.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request_id, row in enumerate(rows):
+            started = time.perf_counter()
+            payload = {"id": request_id, "features": row.tolist()}
+            writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            if "error" in response:
+                raise RuntimeError(f"Server error: {response['error']}")
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _server_stats(host: str, port: int) -> dict:
+    """
+    Fetch the server's batching statistics.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'{"stats": true}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())["stats"]
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+
+async def run_load(
+    host: str,
+    port: int,
+    n_requests: int,
+    concurrency: int,
+    n_features: int,
+    seed: int = 0,
+) -> dict:
+    """
+    Drive the server with `concurrency` closed-loop clients.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+        n_requests (int): Total requests, split evenly across clients.
+        concurrency (int): Number of simultaneous connections.
+        n_features (int): Length of each random feature vector.
+        seed (int): Seed for the request payloads.
+
+    Returns:
+        dict: Keys "requests", "seconds", "throughput_rps", "latency_ms"
+        (client-side mean/p50/p95/p99) and "server" (server statistics).
+    """
+    rows = np.random.default_rng(seed).normal(size=(n_requests, n_features))
+    latencies: list = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_client(host, port, part, latencies) for part in np.array_split(rows, concurrency))
+    )
+    elapsed = time.perf_counter() - started
+    latency_ms = np.asarray(latencies) * 1e3
+    p50, p95, p99 = np.percentile(latency_ms, [50, 95, 99])
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "throughput_rps": len(latencies) / elapsed,
+        "latency_ms": {
+            "mean": float(latency_ms.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+        },
+        "server": await _server_stats(host, port),
+    }
+
+
+async def _demo(args: argparse.Namespace) -> dict:
+    """
+    Train a throwaway model, serve it locally and run the load against it.
+    """
+    rng = np.random.default_rng(args.seed)
+    X = rng.normal(size=(2000, args.features))
+    y = np.argmax(X[:, :3], axis=1)
+    model = SoftmaxRegression(epochs=200)
+    model.fit(X, y)
+    server = InferenceServer(
+        model, args.host, 0, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    )
+    port = await server.start()
+    try:
+        return await run_load(
+            args.host, port, args.requests, args.concurrency, args.features, args.seed
+        )
+    finally:
+        await server.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Parse arguments, run the load and print a JSON summary.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--demo", action="store_true", help="Serve a freshly trained model.")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+    if args.demo:
+        report = asyncio.run(_demo(args))
+    else:
+        report = asyncio.run(
+            run_load(
+                args.host, args.port, args.requests, args.concurrency, args.features, args.seed
+            )
+        )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
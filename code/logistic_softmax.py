@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+from typing import Callable
+
 import numpy as np
 
+from model_io import load_model, save_model
+from sparse_utils import as_csr, is_sparse, row_scaled, to_dense
+
+_EPS = 1e-12
+_SOLVERS = ("gd", "newton", "lbfgs")
+_DEFAULT_GTOL = 1e-8
+_LBFGS_MEMORY = 10
+
 
 def _sigmoid(z: np.ndarray) -> np.ndarray:
     """
@@ -15,7 +25,10 @@ def _sigmoid(z: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Sigmoid outputs.
     """
-    raise NotImplementedError("Implement _sigmoid.")
+    z = np.asarray(z, dtype=float)
+    # exp(-|z|) never overflows; pick the matching branch per element.
+    exp_neg = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1.0 / (1.0 + exp_neg), exp_neg / (1.0 + exp_neg))
 
 
 def _softmax(z: np.ndarray) -> np.ndarray:
@@ -28,11 +41,143 @@ def _softmax(z: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Probabilities for each class per sample.
     """
-    raise NotImplementedError("Implement _softmax.")
+    z = np.asarray(z, dtype=float)
+    shifted = z - np.max(z, axis=1, keepdims=True)
+    exp_z = np.exp(shifted)
+    return exp_z / np.sum(exp_z, axis=1, keepdims=True)
+
+
+def _as_2d_float(X, dtype=float) -> np.ndarray:
+    """
+    Coerce a feature matrix into a 2-D float array.
+
+    SciPy sparse inputs are kept sparse and returned in CSR format, which
+    supports the row slicing and matrix products used during training.
+
+    Args:
+        X (array-like | scipy.sparse matrix): Input features.
+        dtype (np.dtype): Target floating-point type (float64 by default).
+
+    Returns:
+        np.ndarray | scipy.sparse.csr_matrix: Shape (n_samples, n_features).
+
+    Raises:
+        ValueError: If X has more than two dimensions.
+    """
+    if is_sparse(X):
+        return as_csr(X, dtype)
+    X_arr = np.asarray(X, dtype=dtype)
+    if X_arr.ndim == 1:
+        X_arr = X_arr.reshape(-1, 1)
+    if X_arr.ndim != 2:
+        raise ValueError("X must be a 2-D array of shape (n_samples, n_features).")
+    return X_arr
+
+
+def _iter_batches(n_samples: int, batch_size: int | None, order: np.ndarray | None):
+    """
+    Yield index slices (or index arrays) covering one pass over the data.
+
+    Args:
+        n_samples (int): Number of rows to cover.
+        batch_size (int | None): Rows per batch; None means a single full batch.
+        order (np.ndarray | None): Optional permutation of row indices.
+
+    Yields:
+        slice | np.ndarray: Row selector for each batch.
+    """
+    step = n_samples if batch_size is None else min(batch_size, n_samples)
+    for start in range(0, n_samples, step):
+        stop = min(start + step, n_samples)
+        yield slice(start, stop) if order is None else order[start:stop]
+
+
+def _run_epochs(
+    run_epoch: Callable[[], float | None],
+    epochs: int,
+    tol: float | None,
+    n_iter_no_change: int,
+    track_loss: bool,
+) -> tuple[int, np.ndarray | None]:
+    """
+    Drive the training loop with optional loss-based early stopping.
+
+    Training stops once the epoch loss has failed to improve on the best loss
+    seen so far by at least `tol` for `n_iter_no_change` consecutive epochs.
+
+    Args:
+        run_epoch (Callable[[], float | None]): Performs one epoch and returns
+            its training loss (None when the loss is not being computed).
+        epochs (int): Maximum number of epochs.
+        tol (float | None): Minimum improvement; None disables early stopping.
+        n_iter_no_change (int): Patience in epochs.
+        track_loss (bool): Whether to return the per-epoch loss history.
+
+    Returns:
+        tuple[int, np.ndarray | None]: Epochs actually run and the loss history
+        (None unless `track_loss` is set).
+    """
+    history: list[float] = []
+    best_loss = np.inf
+    no_improvement = 0
+    n_iter = 0
+    for n_iter in range(1, epochs + 1):
+        loss = run_epoch()
+        if loss is None:
+            continue
+        history.append(loss)
+        if tol is None:
+            continue
+        no_improvement = no_improvement + 1 if loss > best_loss - tol else 0
+        best_loss = min(best_loss, loss)
+        if no_improvement >= n_iter_no_change:
+            break
+    return n_iter, (np.asarray(history) if track_loss else None)
+
+
+def _validate_stopping(tol: float | None, n_iter_no_change: int) -> None:
+    """
+    Check early-stopping hyperparameters shared by both classifiers.
+    """
+    if tol is not None and tol < 0:
+        raise ValueError("tol cannot be negative.")
+    if n_iter_no_change <= 0:
+        raise ValueError("n_iter_no_change must be positive.")
+
+
+def _lbfgs_direction(
+    grad: np.ndarray,
+    s_hist: list[np.ndarray],
+    y_hist: list[np.ndarray],
+) -> np.ndarray:
+    """
+    Two-loop recursion returning the L-BFGS descent direction.
+
+    Args:
+        grad (np.ndarray): Current gradient.
+        s_hist (list[np.ndarray]): Recent parameter differences (oldest first).
+        y_hist (list[np.ndarray]): Matching gradient differences.
+
+    Returns:
+        np.ndarray: Approximate -H^{-1} @ grad.
+    """
+    q = grad.copy()
+    rhos = [1.0 / float(y @ s) for s, y in zip(s_hist, y_hist)]
+    alphas = []
+    for s, y, rho in zip(reversed(s_hist), reversed(y_hist), reversed(rhos)):
+        alpha = rho * float(s @ q)
+        q -= alpha * y
+        alphas.append(alpha)
+    if s_hist:
+        q *= float(s_hist[-1] @ y_hist[-1]) / float(y_hist[-1] @ y_hist[-1])
+    for s, y, rho, alpha in zip(s_hist, y_hist, rhos, reversed(alphas)):
+        beta = rho * float(y @ q)
+        q += (alpha - beta) * s
+    return -q
 
 
 class LogisticRegression:
-    """Binary logistic regression trained via batch gradient descent."""
+    """Binary logistic regression trained via batch or mini-batch gradient descent."""
 
     def __init__(
         self,
@@ -40,13 +185,34 @@ class LogisticRegression:
         epochs: int = 1500,
         reg_strength: float = 0.0,
         random_state: int | None = 0,
+        batch_size: int | None = None,
+        shuffle: bool = True,
+        tol: float | None = None,
+        n_iter_no_change: int = 5,
+        track_loss: bool = False,
+        solver: str = "gd",
     ) -> None:
         """
         Args:
             learning_rate (float): Step size for gradient updates (> 0).
-            epochs (int): Number of passes over the training data (> 0).
+            epochs (int): Number of passes over the training data (> 0). For
+                the second-order solvers this is the iteration cap.
             reg_strength (float): L2 regularisation strength (>= 0).
             random_state (int | None): Seed passed to NumPy default RNG.
+            batch_size (int | None): Rows per gradient step. None uses the full
+                batch (classic gradient descent); smaller values give SGD.
+            shuffle (bool): Reshuffle rows each epoch when mini-batching.
+            tol (float | None): Early-stopping tolerance on the training loss.
+                None (default) always runs the full `epochs`.
+            n_iter_no_change (int): Epochs without a `tol` improvement before
+                training stops.
+            track_loss (bool): Record the loss after each epoch (or solver
+                iteration) in `loss_history_`, which has length `n_iter_`.
+            solver (str): "gd" for (mini-)batch gradient descent, "newton" for
+                IRLS (best with few features) or "lbfgs" for limited-memory
+                BFGS (many features). The second-order solvers minimise the
+                same regularised loss and stop once the gradient's max-norm
+                drops below `tol` (1e-8 when None).
         """
         if learning_rate <= 0:
             raise ValueError("learning_rate must be positive.")
@@ -54,23 +220,239 @@ class LogisticRegression:
             raise ValueError("epochs must be positive.")
         if reg_strength < 0:
             raise ValueError("reg_strength cannot be negative.")
+        if solver not in _SOLVERS:
+            raise ValueError(f"solver must be one of {_SOLVERS}.")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        _validate_stopping(tol, n_iter_no_change)
         self.learning_rate = learning_rate
         self.epochs = epochs
         self.reg_strength = reg_strength
         self.random_state = random_state
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.track_loss = track_loss
+        self.solver = solver
         self.weights: np.ndarray | None = None
         self.bias: float = 0.0
+        self.n_iter_: int = 0
+        self.loss_history_: np.ndarray | None = None
+        self._last_loss: float = 0.0
         self._rng = np.random.default_rng(random_state)
 
     def fit(self, X, y) -> None:
         """
-        Train the classifier using batch gradient descent.
+        Train the classifier with the configured solver.
 
         Args:
             X (array-like): Feature matrix of shape (n_samples, n_features).
             y (array-like): Binary labels of shape (n_samples,).
+
+        Raises:
+            ValueError: If X and y have different numbers of samples.
+        """
+        X_arr, y_arr = self._prepare_training_data(X, y)
+        self._initialize_parameters(X_arr.shape[1])
+        if self.solver == "newton":
+            self._fit_newton(X_arr, y_arr)
+            return
+        if self.solver == "lbfgs":
+            self._fit_lbfgs(X_arr, y_arr)
+            return
+        self.n_iter_, self.loss_history_ = _run_epochs(
+            lambda: self._run_epoch(X_arr, y_arr),
+            self.epochs,
+            self.tol,
+            self.n_iter_no_change,
+            self.track_loss,
+        )
+
+    def partial_fit(self, X_chunk, y_chunk) -> None:
+        """
+        Run a single pass of gradient descent over one chunk of data.
+
+        Parameters are initialised on the first call and reused afterwards, so
+        a dataset can be streamed through the model chunk by chunk without
+        ever holding it in memory at once. Always uses gradient descent,
+        whatever `solver` is set to.
+
+        Args:
+            X_chunk (array-like): Feature rows of shape (n_rows, n_features).
+            y_chunk (array-like): Binary labels of shape (n_rows,).
+
+        Raises:
+            ValueError: If the chunk's feature count differs from earlier chunks.
+        """
+        X_arr, y_arr = self._prepare_training_data(X_chunk, y_chunk)
+        if self.weights is None:
+            self._initialize_parameters(X_arr.shape[1])
+        elif X_arr.shape[1] != self.weights.shape[0]:
+            raise ValueError("X_chunk has a different number of features than seen before.")
+        elif not self.weights.flags.writeable:
+            # Weights mapped read-only by `load`; copy before updating in place.
+            self.weights = np.array(self.weights)
+        self._run_epoch(X_arr, y_arr)
+        self.n_iter_ += 1
+
+    def _run_epoch(self, X: np.ndarray, y: np.ndarray) -> float | None:
+        """
+        Perform one pass over (X, y) using the configured batching strategy.
+
+        Returns:
+            float | None: Row-weighted mean of the batch losses, or None when
+            the loss is not being tracked.
+        """
+        n_samples = X.shape[0]
+        order = None
+        if self.batch_size is not None and self.batch_size < n_samples and self.shuffle:
+            order = self._rng.permutation(n_samples)
+        epoch_loss = 0.0
+        for rows in _iter_batches(n_samples, self.batch_size, order):
+            X_batch, y_batch = X[rows], y[rows]
+            _, probs = self._forward(X_batch)
+            grad_w, grad_b = self._backward(X_batch, y_batch, probs)
+            self._update(grad_w, grad_b)
+            epoch_loss += self._last_loss * X_batch.shape[0]
+        return epoch_loss / n_samples if self._tracks_loss() else None
+
+    def _tracks_loss(self) -> bool:
+        """
+        Whether `_backward` needs to evaluate the training loss.
+        """
+        return self.tol is not None or self.track_loss
+
+    def _objective(
+        self,
+        theta: np.ndarray,
+        X: np.ndarray,
+        y: np.ndarray,
+    ) -> tuple[float, np.ndarray, np.ndarray]:
         """
-        raise NotImplementedError("Implement LogisticRegression.fit.")
+        Regularised log-loss, its gradient and the probabilities at `theta`.
+
+        Args:
+            theta (np.ndarray): Weights followed by the bias, shape (n_features + 1,).
+            X (np.ndarray): Feature matrix.
+            y (np.ndarray): Binary targets.
+
+        Returns:
+            tuple[float, np.ndarray, np.ndarray]: Loss, gradient w.r.t. theta
+            and predicted probabilities.
+        """
+        weights, bias = theta[:-1], theta[-1]
+        logits = np.asarray(X @ weights).ravel() + bias
+        probs = _sigmoid(logits)
+        loss = float(np.mean(np.logaddexp(0.0, logits) - y * logits))
+        loss += 0.5 * self.reg_strength * float(weights @ weights)
+        error = probs - y
+        grad = np.empty_like(theta)
+        grad[:-1] = X.T @ error / X.shape[0] + self.reg_strength * weights
+        grad[-1] = np.mean(error)
+        return loss, grad, probs
+
+    def _fit_newton(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Minimise the regularised log-loss with damped Newton steps (IRLS).
+        """
+        n_samples, n_features = X.shape
+        gtol = _DEFAULT_GTOL if self.tol is None else self.tol
+        theta = np.append(self.weights, self.bias)
+        loss, grad, probs = self._objective(theta, X, y)
+        history = []
+        n_iter = 0
+        while n_iter < self.epochs and np.max(np.abs(grad)) > gtol:
+            curvature = probs * (1.0 - probs)
+            hessian = np.empty((n_features + 1, n_features + 1))
+            hessian[:-1, :-1] = to_dense(X.T @ row_scaled(X, curvature)) / n_samples
+            hessian[:-1, :-1] += self.reg_strength * np.eye(n_features)
+            hessian[:-1, -1] = hessian[-1, :-1] = X.T @ curvature / n_samples
+            hessian[-1, -1] = np.mean(curvature)
+            try:
+                step = np.linalg.solve(hessian, grad)
+            except np.linalg.LinAlgError:
+                step = np.linalg.lstsq(hessian, grad, rcond=None)[0]
+            theta, loss, grad, probs = self._line_search(theta, -step, loss, grad, X, y)
+            history.append(loss)
+            n_iter += 1
+        self._store_solution(theta, n_iter, history)
+
+    def _fit_lbfgs(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Minimise the regularised log-loss with a pure-NumPy L-BFGS.
+        """
+        gtol = _DEFAULT_GTOL if self.tol is None else self.tol
+        theta = np.append(self.weights, self.bias)
+        loss, grad, _ = self._objective(theta, X, y)
+        history = []
+        s_hist: list[np.ndarray] = []
+        y_hist: list[np.ndarray] = []
+        n_iter = 0
+        while n_iter < self.epochs and np.max(np.abs(grad)) > gtol:
+            direction = _lbfgs_direction(grad, s_hist, y_hist)
+            if float(grad @ direction) >= 0:
+                s_hist.clear()
+                y_hist.clear()
+                direction = -grad
+            new_theta, loss, new_grad, _ = self._line_search(theta, direction, loss, grad, X, y)
+            s_vec, y_vec = new_theta - theta, new_grad - grad
+            if float(s_vec @ y_vec) > _EPS:
+                s_hist.append(s_vec)
+                y_hist.append(y_vec)
+                if len(s_hist) > _LBFGS_MEMORY:
+                    s_hist.pop(0)
+                    y_hist.pop(0)
+            theta, grad = new_theta, new_grad
+            history.append(loss)
+            n_iter += 1
+        self._store_solution(theta, n_iter, history)
+
+    def _line_search(
+        self,
+        theta: np.ndarray,
+        direction: np.ndarray,
+        loss: float,
+        grad: np.ndarray,
+        X: np.ndarray,
+        y: np.ndarray,
+    ) -> tuple[np.ndarray, float, np.ndarray, np.ndarray]:
+        """
+        Backtracking (Armijo) line search along `direction`.
+
+        Returns:
+            tuple: New parameters, loss, gradient and probabilities.
+        """
+        slope = float(grad @ direction)
+        step = 1.0
+        while True:
+            candidate = theta + step * direction
+            new_loss, new_grad, probs = self._objective(candidate, X, y)
+            if new_loss <= loss + 1e-4 * step * slope or step < 1e-10:
+                return candidate, new_loss, new_grad, probs
+            step *= 0.5
+
+    def _store_solution(self, theta: np.ndarray, n_iter: int, history: list[float]) -> None:
+        """
+        Unpack second-order solver results into the public attributes.
+        """
+        self.weights = theta[:-1].copy()
+        self.bias = float(theta[-1])
+        self.n_iter_ = n_iter
+        self.loss_history_ = np.asarray(history) if self.track_loss else None
+
+    @staticmethod
+    def _prepare_training_data(X, y) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Validate and convert training inputs to float arrays.
+        """
+        X_arr = _as_2d_float(X)
+        y_arr = np.asarray(y, dtype=float).ravel()
+        if X_arr.shape[0] != y_arr.shape[0]:
+            raise ValueError("X and y must contain the same number of samples.")
+        if X_arr.shape[0] == 0:
+            raise ValueError("Cannot fit on an empty dataset.")
+        return X_arr, y_arr
 
     def predict_proba(self, X) -> np.ndarray:
         """
@@ -85,19 +467,76 @@ class LogisticRegression:
         Raises:
             RuntimeError: If called before `fit`.
         """
-        raise NotImplementedError("Implement LogisticRegression.predict_proba.")
+        if self.weights is None:
+            raise RuntimeError("LogisticRegression must be fitted before predicting.")
+        _, probs = self._forward(_as_2d_float(X))
+        return probs
 
     def predict(self, X) -> np.ndarray:
         """
         Predict class labels (0 or 1) using a 0.5 threshold.
         """
-        raise NotImplementedError("Implement LogisticRegression.predict.")
+        return (self.predict_proba(X) >= 0.5).astype(int)
+
+    def save(self, path) -> None:
+        """
+        Write the fitted model to a binary model file (see `model_io`).
+
+        Args:
+            path (str | Path): Destination file.
+
+        Raises:
+            RuntimeError: If called before `fit`.
+        """
+        if self.weights is None:
+            raise RuntimeError("LogisticRegression must be fitted before saving.")
+        params = {
+            "learning_rate": self.learning_rate,
+            "epochs": self.epochs,
+            "reg_strength": self.reg_strength,
+            "random_state": self.random_state,
+            "batch_size": self.batch_size,
+            "shuffle": self.shuffle,
+            "tol": self.tol,
+            "n_iter_no_change": self.n_iter_no_change,
+            "track_loss": self.track_loss,
+            "solver": self.solver,
+            "bias": self.bias,
+            "n_iter_": self.n_iter_,
+        }
+        arrays = {"weights": self.weights}
+        if self.loss_history_ is not None:
+            arrays["loss_history_"] = self.loss_history_
+        save_model(path, "LogisticRegression", params, arrays)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "LogisticRegression":
+        """
+        Load a model written by `save`.
+
+        Args:
+            path (str | Path): Model file.
+            mmap (bool): Map the weights read-only from the file (zero-copy).
+                `partial_fit` copies them on its first update.
+
+        Returns:
+            LogisticRegression: The restored estimator.
+        """
+        params, arrays = load_model(path, mmap, kind="LogisticRegression")
+        bias, n_iter = params.pop("bias"), params.pop("n_iter_")
+        model = cls(**params)
+        model.weights = arrays["weights"]
+        model.bias = bias
+        model.n_iter_ = n_iter
+        model.loss_history_ = arrays.get("loss_history_")
+        return model
 
     def _forward(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
         Compute logits and probabilities for the current parameters.
         """
-        raise NotImplementedError("Implement LogisticRegression._forward.")
+        logits = X @ self.weights + self.bias
+        return logits, _sigmoid(logits)
 
     def _backward(
         self,
@@ -108,19 +547,63 @@ class LogisticRegression:
         """
         Compute gradients of the loss with respect to weights and bias.
         """
-        raise NotImplementedError("Implement LogisticRegression._backward.")
+        n_samples = X.shape[0]
+        error = probs - y_true
+        grad_w = X.T @ error / n_samples + self.reg_strength * self.weights
+        grad_b = float(np.mean(error))
+        if self._tracks_loss():
+            clipped = np.clip(probs, _EPS, 1.0 - _EPS)
+            data_loss = -np.mean(y_true * np.log(clipped) + (1.0 - y_true) * np.log1p(-clipped))
+            penalty = 0.5 * self.reg_strength * float(self.weights @ self.weights)
+            self._last_loss = float(data_loss) + penalty
+        return grad_w, grad_b
 
     def _update(self, grad_w: np.ndarray, grad_b: float) -> None:
         """
         Apply one gradient descent step.
         """
-        raise NotImplementedError("Implement LogisticRegression._update.")
+        self.weights -= self.learning_rate * grad_w
+        self.bias -= self.learning_rate * grad_b
 
     def _initialize_parameters(self, n_features: int) -> None:
         """
         Initialise weights from a small Gaussian and zero bias.
         """
-        raise NotImplementedError("Implement LogisticRegression._initialize_parameters.")
+        self.weights = self._rng.normal(0.0, 0.01, size=n_features)
+        self.bias = 0.0
+        self.n_iter_ = 0
+        self.loss_history_ = None
+
+
+def _validate_dtype(dtype) -> np.dtype:
+    """
+    Resolve a floating-point training dtype (float32 or float64).
+    """
+    resolved = np.dtype(dtype)
+    if resolved not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError("dtype must be float32 or float64.")
+    return resolved
+
+
+class _SoftmaxWorkspace:
+    """Preallocated buffers reused by every epoch of the fused softmax kernel."""
+
+    def __init__(self, y_idx: np.ndarray, n_features: int, n_classes: int, dtype: np.dtype) -> None:
+        """
+        Args:
+            y_idx (np.ndarray): Integer class code per sample.
+            n_features (int): Number of input features.
+            n_classes (int): Number of classes.
+            dtype (np.dtype): Floating-point type of all buffers.
+        """
+        n_samples = y_idx.shape[0]
+        # Flat offsets of each sample's true-class cell, for in-place gathers.
+        self.target_cells = np.arange(n_samples) * n_classes + y_idx
+        self.scores = np.empty((n_samples, n_classes), dtype=dtype)
+        self.row_buffer = np.empty((n_samples, 1), dtype=dtype)
+        self.true_logits = np.empty(n_samples, dtype=dtype)
+        self.grad_w = np.empty((n_features, n_classes), dtype=dtype)
+        self.grad_b = np.empty(n_classes, dtype=dtype)
 
 
 class SoftmaxRegression:
@@ -132,6 +615,11 @@ class SoftmaxRegression:
         epochs: int = 2000,
         reg_strength: float = 0.0,
         random_state: int | None = 0,
+        tol: float | None = None,
+        n_iter_no_change: int = 5,
+        track_loss: bool = False,
+        fused: bool = False,
+        dtype=np.float64,
     ) -> None:
         """
         Args:
@@ -139,6 +627,18 @@ class SoftmaxRegression:
             epochs (int): Number of iterations (> 0).
             reg_strength (float): L2 penalty applied to weights (>= 0).
             random_state (int | None): Seed for reproducible initialisation.
+            tol (float | None): Early-stopping tolerance on the training loss.
+                None (default) always runs the full `epochs`.
+            n_iter_no_change (int): Epochs without a `tol` improvement before
+                training stops.
+            track_loss (bool): Record the per-epoch loss in `loss_history_`.
+            fused (bool): Train with the fused kernel, which preallocates the
+                (n_samples, n_classes) buffers once and updates them in place
+                each epoch instead of allocating logits/probabilities/gradients
+                anew. Trains on integer class codes, so no one-hot matrix is
+                built either. Sparse X still costs one temporary per product.
+            dtype (np.dtype): Floating-point type of the training data and
+                parameters (float64 or float32).
         """
         if learning_rate <= 0:
             raise ValueError("learning_rate must be positive.")
@@ -146,13 +646,22 @@ class SoftmaxRegression:
             raise ValueError("epochs must be positive.")
         if reg_strength < 0:
             raise ValueError("reg_strength cannot be negative.")
+        _validate_stopping(tol, n_iter_no_change)
+        self.dtype = _validate_dtype(dtype)
+        self.fused = fused
         self.learning_rate = learning_rate
         self.epochs = epochs
         self.reg_strength = reg_strength
         self.random_state = random_state
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.track_loss = track_loss
         self.weights: np.ndarray | None = None
         self.bias: np.ndarray | None = None
         self.classes_: np.ndarray | None = None
+        self.n_iter_: int = 0
+        self.loss_history_: np.ndarray | None = None
+        self._last_loss: float = 0.0
         self._rng = np.random.default_rng(random_state)
 
     def fit(self, X, y) -> None:
@@ -162,8 +671,92 @@ class SoftmaxRegression:
         Args:
             X (array-like): Feature matrix of shape (n_samples, n_features).
             y (array-like): Class labels (hashable) of shape (n_samples,).
-        """
-        raise NotImplementedError("Implement SoftmaxRegression.fit.")
+
+        Raises:
+            ValueError: If X and y have different numbers of samples.
+        """
+        X_arr = _as_2d_float(X, dtype=self.dtype)
+        y_arr = np.asarray(y).ravel()
+        if X_arr.shape[0] != y_arr.shape[0]:
+            raise ValueError("X and y must contain the same number of samples.")
+        if X_arr.shape[0] == 0:
+            raise ValueError("Cannot fit on an empty dataset.")
+        self.classes_, y_idx = np.unique(y_arr, return_inverse=True)
+        n_classes = len(self.classes_)
+        self._initialize_parameters(X_arr.shape[1], n_classes)
+        if self.fused:
+            workspace = _SoftmaxWorkspace(y_idx, X_arr.shape[1], n_classes, self.dtype)
+            run_epoch = lambda: self._fused_epoch(X_arr, workspace)
+        else:
+            y_onehot = np.zeros((X_arr.shape[0], n_classes), dtype=self.dtype)
+            y_onehot[np.arange(X_arr.shape[0]), y_idx] = 1.0
+            run_epoch = lambda: self._run_epoch(X_arr, y_onehot)
+        self.n_iter_, self.loss_history_ = _run_epochs(
+            run_epoch,
+            self.epochs,
+            self.tol,
+            self.n_iter_no_change,
+            self.track_loss,
+        )
+
+    def _run_epoch(self, X: np.ndarray, y_onehot: np.ndarray) -> float | None:
+        """
+        Perform one full-batch gradient step and report the loss if tracked.
+        """
+        _, probs = self._forward(X)
+        grad_w, grad_b = self._backward(X, y_onehot, probs)
+        self._update(grad_w, grad_b)
+        return self._last_loss if self._tracks_loss() else None
+
+    def _fused_epoch(self, X: np.ndarray, ws: _SoftmaxWorkspace) -> float | None:
+        """
+        One gradient step computed entirely inside preallocated buffers.
+
+        Equivalent to `_forward` -> `_backward` -> `_update`, but the logits,
+        probabilities and error share one (n_samples, n_classes) buffer and
+        the log-sum-exp is evaluated in place.
+        """
+        n_samples = X.shape[0]
+        scores = ws.scores
+        sparse_input = is_sparse(X)
+        if sparse_input:
+            scores[...] = X @ self.weights
+        else:
+            np.matmul(X, self.weights, out=scores)
+        scores += self.bias
+        np.max(scores, axis=1, keepdims=True, out=ws.row_buffer)
+        scores -= ws.row_buffer
+        tracks_loss = self._tracks_loss()
+        if tracks_loss:
+            np.take(scores, ws.target_cells, out=ws.true_logits)
+        np.exp(scores, out=scores)
+        np.sum(scores, axis=1, keepdims=True, out=ws.row_buffer)
+        scores /= ws.row_buffer
+        if tracks_loss:
+            np.log(ws.row_buffer, out=ws.row_buffer)
+            data_loss = float(np.sum(ws.row_buffer) - np.sum(ws.true_logits)) / n_samples
+            penalty = 0.5 * self.reg_strength * float(np.sum(self.weights * self.weights))
+            self._last_loss = data_loss + penalty
+        # probs - onehot, in place.
+        scores.ravel()[ws.target_cells] -= 1.0
+        if sparse_input:
+            ws.grad_w[...] = X.T @ scores
+        else:
+            np.matmul(X.T, scores, out=ws.grad_w)
+        np.sum(scores, axis=0, out=ws.grad_b)
+        # W -= lr * (grad_w / n + reg * W), folded to avoid a temporary.
+        self.weights *= 1.0 - self.learning_rate * self.reg_strength
+        ws.grad_w *= self.learning_rate / n_samples
+        self.weights -= ws.grad_w
+        ws.grad_b *= self.learning_rate / n_samples
+        self.bias -= ws.grad_b
+        return self._last_loss if tracks_loss else None
+
+    def _tracks_loss(self) -> bool:
+        """
+        Whether `_backward` needs to evaluate the training loss.
+        """
+        return self.tol is not None or self.track_loss
 
     def predict_proba(self, X) -> np.ndarray:
         """
@@ -178,19 +771,86 @@ class SoftmaxRegression:
         Raises:
             RuntimeError: If the model has not been fitted.
         """
-        raise NotImplementedError("Implement SoftmaxRegression.predict_proba.")
+        if self.weights is None:
+            raise RuntimeError("SoftmaxRegression must be fitted before predicting.")
+        _, probs = self._forward(_as_2d_float(X))
+        return probs
 
     def predict(self, X) -> np.ndarray:
         """
         Predict class labels via argmax over predicted probabilities.
         """
-        raise NotImplementedError("Implement SoftmaxRegression.predict.")
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def save(self, path) -> None:
+        """
+        Write the fitted model to a binary model file (see `model_io`).
+
+        Numeric and string class labels are stored as raw arrays; other label
+        types must be JSON-serialisable and go into the header.
+
+        Args:
+            path (str | Path): Destination file.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+        """
+        if self.weights is None:
+            raise RuntimeError("SoftmaxRegression must be fitted before saving.")
+        params = {
+            "learning_rate": self.learning_rate,
+            "epochs": self.epochs,
+            "reg_strength": self.reg_strength,
+            "random_state": self.random_state,
+            "tol": self.tol,
+            "n_iter_no_change": self.n_iter_no_change,
+            "track_loss": self.track_loss,
+            "fused": self.fused,
+            "dtype": self.dtype.name,
+            "n_iter_": self.n_iter_,
+        }
+        arrays = {"weights": self.weights, "bias": self.bias}
+        if self.classes_.dtype.hasobject:
+            params["classes_"] = self.classes_.tolist()
+        else:
+            arrays["classes_"] = self.classes_
+        if self.loss_history_ is not None:
+            arrays["loss_history_"] = self.loss_history_
+        save_model(path, "SoftmaxRegression", params, arrays)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "SoftmaxRegression":
+        """
+        Load a model written by `save`.
+
+        Args:
+            path (str | Path): Model file.
+            mmap (bool): Map weights, bias and classes read-only from the file
+                (zero-copy), which keeps cold starts independent of model size.
+
+        Returns:
+            SoftmaxRegression: The restored estimator.
+        """
+        params, arrays = load_model(path, mmap, kind="SoftmaxRegression")
+        n_iter = params.pop("n_iter_")
+        classes = params.pop("classes_", None)
+        model = cls(**params)
+        model.weights = arrays["weights"]
+        model.bias = arrays["bias"]
+        if classes is None:
+            model.classes_ = arrays["classes_"]
+        else:
+            model.classes_ = np.asarray(classes, dtype=object)
+        model.n_iter_ = n_iter
+        model.loss_history_ = arrays.get("loss_history_")
+        return model
 
     def _forward(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
         Compute logits and softmax probabilities for the current parameters.
         """
-        raise NotImplementedError("Implement SoftmaxRegression._forward.")
+        logits = X @ self.weights + self.bias
+        return logits, _softmax(logits)
 
     def _backward(
         self,
@@ -201,17 +861,30 @@ class SoftmaxRegression:
         """
         Compute gradients for weights and bias given softmax probabilities.
         """
-        raise NotImplementedError("Implement SoftmaxRegression._backward.")
+        n_samples = X.shape[0]
+        error = probs - y_onehot
+        grad_w = X.T @ error / n_samples + self.reg_strength * self.weights
+        grad_b = np.mean(error, axis=0)
+        if self._tracks_loss():
+            data_loss = -np.sum(y_onehot * np.log(np.clip(probs, _EPS, 1.0))) / n_samples
+            penalty = 0.5 * self.reg_strength * float(np.sum(self.weights * self.weights))
+            self._last_loss = float(data_loss) + penalty
+        return grad_w, grad_b
 
     def _update(self, grad_w: np.ndarray, grad_b: np.ndarray) -> None:
         """
         Apply one gradient descent update.
         """
-        raise NotImplementedError("Implement SoftmaxRegression._update.")
+        self.weights -= self.learning_rate * grad_w
+        self.bias -= self.learning_rate * grad_b
 
     def _initialize_parameters(self, n_features: int, n_classes: int) -> None:
         """
         Initialise weights and biases for a given feature/class configuration.
         """
-        raise NotImplementedError("Implement SoftmaxRegression._initialize_parameters.")
+        weights = self._rng.normal(0.0, 0.01, size=(n_features, n_classes))
+        self.weights = weights.astype(self.dtype, copy=False)
+        self.bias = np.zeros(n_classes, dtype=self.dtype)
+        self.n_iter_ = 0
+        self.loss_history_ = None
 
@@ -3,6 +3,14 @@
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
+
+import sparse_utils
+from sparse_utils import is_sparse
+
+_SPARSE_FORMATS = ("coo", "csr")
+# Macro/micro F1 switch to a sparse confusion matrix above this many labels.
+_SPARSE_MIN_LABELS = 1024
 
 
 def _safe_divide(num: float, denom: float) -> float:
@@ -16,7 +24,15 @@ def _safe_divide(num: float, denom: float) -> float:
     Returns:
         float: num / denom when denom != 0, otherwise 0.0.
     """
-    raise NotImplementedError("Implement _safe_divide.")
+    return float(num) / float(denom) if denom != 0 else 0.0
+
+
+def _safe_divide_array(num: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    """
+    Element-wise `_safe_divide` over arrays.
+    """
+    num = np.asarray(num, dtype=float)
+    return np.divide(num, denom, out=np.zeros_like(num), where=np.asarray(denom) != 0)
 
 
 def _prepare_inputs(y_true, y_pred) -> tuple[np.ndarray, np.ndarray]:
@@ -33,7 +49,11 @@ def _prepare_inputs(y_true, y_pred) -> tuple[np.ndarray, np.ndarray]:
     Raises:
         ValueError: If the arrays do not share the same length.
     """
-    raise NotImplementedError("Implement _prepare_inputs.")
+    y_true_arr = np.asarray(y_true).ravel()
+    y_pred_arr = np.asarray(y_pred).ravel()
+    if y_true_arr.shape[0] != y_pred_arr.shape[0]:
+        raise ValueError("y_true and y_pred must have the same length.")
+    return y_true_arr, y_pred_arr
 
 
 def _resolve_labels(labels, y_true_arr: np.ndarray, y_pred_arr: np.ndarray) -> list:
@@ -51,13 +71,215 @@ def _resolve_labels(labels, y_true_arr: np.ndarray, y_pred_arr: np.ndarray) -> l
     Raises:
         ValueError: If the final label list is empty.
     """
-    raise NotImplementedError("Implement _resolve_labels.")
+    if labels is None:
+        resolved = list(_encounter_order(_pool(y_true_arr, y_pred_arr))[0])
+    else:
+        resolved = list(labels)
+    if not resolved:
+        raise ValueError("labels must not be empty.")
+    return resolved
+
+
+def _pool(*arrays: np.ndarray) -> np.ndarray:
+    """
+    Concatenate label arrays, keeping a native dtype when one fits all of them.
+    """
+    try:
+        return np.concatenate(arrays)
+    except TypeError:
+        return np.concatenate([np.asarray(array, dtype=object) for array in arrays])
+
+
+def _encounter_order(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Factorize values with codes assigned in order of first appearance.
+
+    Sortable values go through ``np.unique``; values that cannot be ordered
+    against each other (e.g. None mixed with strings) fall back to the hash
+    based ``pd.factorize``.
+
+    Args:
+        values (np.ndarray): 1-D array of hashable values.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Unique values in encounter order and the
+        code of every input element.
+    """
+    try:
+        uniques, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    except TypeError:
+        values = _as_object(values)
+        codes, _ = pd.factorize(values, sort=False, use_na_sentinel=False)
+        # Take uniques from the input: factorize reports None as NaN.
+        first = np.unique(codes, return_index=True)[1]
+        return values[first], codes.astype(np.intp, copy=False)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(order.size, dtype=np.intp)
+    rank[order] = np.arange(order.size)
+    return uniques[order], rank[inverse.ravel()]
+
+
+def _encode_pairs(
+    y_true_arr: np.ndarray, y_pred_arr: np.ndarray, labels
+) -> tuple[np.ndarray, np.ndarray, list]:
+    """
+    Map both label arrays to indices into the resolved label list in one pass.
+
+    Without explicit labels, a single ``np.unique(..., return_inverse=True)``
+    over truths and predictions yields every code at once. With explicit
+    labels, values are located by binary search in the sorted label list
+    (O(n log k), no Python-level dict); values outside it get code -1.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, list]: True codes, predicted codes and
+        the ordered label list.
+    """
+    n_samples = y_true_arr.shape[0]
+    if labels is None:
+        uniques, codes = _encounter_order(_pool(y_true_arr, y_pred_arr))
+        if uniques.size == 0:
+            raise ValueError("labels must not be empty.")
+        return codes[:n_samples], codes[n_samples:], list(uniques)
+    resolved = _resolve_labels(labels, y_true_arr, y_pred_arr)
+    label_arr = np.asarray(resolved)
+    try:
+        order = np.argsort(label_arr, kind="stable")
+        sorted_labels = label_arr[order]
+        if np.any(sorted_labels[1:] == sorted_labels[:-1]):
+            raise ValueError("labels must be unique.")
+        return (
+            _lookup_codes(y_true_arr, sorted_labels, order),
+            _lookup_codes(y_pred_arr, sorted_labels, order),
+            resolved,
+        )
+    except TypeError:
+        index = pd.Index(_as_object(resolved), dtype=object)
+        if not index.is_unique:
+            raise ValueError("labels must be unique.") from None
+        return (
+            index.get_indexer(pd.Index(_as_object(y_true_arr), dtype=object)),
+            index.get_indexer(pd.Index(_as_object(y_pred_arr), dtype=object)),
+            resolved,
+        )
+
+
+def _as_object(values) -> np.ndarray:
+    """
+    Copy values into a 1-D object array without NumPy's type coercion.
+    """
+    values = list(values)
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+def _lookup_codes(values: np.ndarray, sorted_labels: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Position of each value in the original label list via ``np.searchsorted``.
+
+    Args:
+        values (np.ndarray): Labels to encode.
+        sorted_labels (np.ndarray): Label list in sorted order.
+        order (np.ndarray): Original position of each sorted label.
+
+    Returns:
+        np.ndarray: Label index per value, -1 when the value is not a label.
+    """
+    try:
+        slots = np.searchsorted(sorted_labels, values)
+    except TypeError:
+        sorted_labels = sorted_labels.astype(object)
+        values = values.astype(object)
+        slots = np.searchsorted(sorted_labels, values)
+    slots = np.minimum(slots, sorted_labels.size - 1)
+    found = sorted_labels[slots] == values
+    return np.where(found, order[slots], -1)
+
+
+def _confusion_from_codes(
+    true_codes: np.ndarray, pred_codes: np.ndarray, n_labels: int, sparse: str | None = None
+):
+    """
+    Accumulate a confusion matrix from label codes.
+
+    The dense form is one flat bincount over the k * k cells. The sparse form
+    only materialises observed (true, predicted) pairs, so memory scales with
+    the number of distinct pairs rather than k squared. Pairs where either
+    code is -1 (label outside the requested set) are dropped.
+    """
+    keep = (true_codes >= 0) & (pred_codes >= 0)
+    flat = true_codes[keep].astype(np.int64) * n_labels + pred_codes[keep]
+    if sparse is None:
+        return np.bincount(flat, minlength=n_labels * n_labels).reshape(n_labels, n_labels)
+    if sparse not in _SPARSE_FORMATS:
+        raise ValueError(f"sparse must be None or one of {_SPARSE_FORMATS}.")
+    if sparse_utils.sp is None:
+        raise ImportError("SciPy is required for sparse confusion matrices.")
+    cells, counts = np.unique(flat, return_counts=True)
+    matrix = sparse_utils.sp.coo_matrix(
+        (counts, (cells // n_labels, cells % n_labels)), shape=(n_labels, n_labels)
+    )
+    return matrix.tocsr() if sparse == "csr" else matrix
+
+
+def _matrix_and_labels(y_true, y_pred, labels=None, sparse: str | None = None) -> tuple:
+    """
+    Shared front end: validate inputs and build the confusion matrix once.
+    """
+    y_true_arr, y_pred_arr = _prepare_inputs(y_true, y_pred)
+    true_codes, pred_codes, resolved = _encode_pairs(y_true_arr, y_pred_arr, labels)
+    return _confusion_from_codes(true_codes, pred_codes, len(resolved), sparse), resolved
+
+
+def _auto_sparse(labels) -> str | None:
+    """
+    Pick the sparse CSR form for large label sets when SciPy is available.
+    """
+    if sparse_utils.sp is not None and labels is not None and len(labels) >= _SPARSE_MIN_LABELS:
+        return "csr"
+    return None
+
+
+def _per_class_counts(matrix) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (true positives, predicted positives, actual positives) per class.
+
+    Works on dense arrays and SciPy sparse matrices alike.
+    """
+    if is_sparse(matrix):
+        return (
+            np.asarray(matrix.diagonal()),
+            np.asarray(matrix.sum(axis=0)).ravel(),
+            np.asarray(matrix.sum(axis=1)).ravel(),
+        )
+    return np.diagonal(matrix).copy(), matrix.sum(axis=0), matrix.sum(axis=1)
+
+
+def _f1_from_counts(tp, predicted, actual):
+    """
+    F1 = 2 TP / (predicted + actual), the same value as 2PR / (P + R).
+    """
+    if np.ndim(tp) == 0:
+        return _safe_divide(2.0 * tp, predicted + actual)
+    return _safe_divide_array(2.0 * np.asarray(tp), np.asarray(predicted) + np.asarray(actual))
+
+
+def _single_class_counts(y_true, y_pred, positive_label) -> tuple[int, int, int]:
+    """
+    (TP, predicted positives, actual positives) for one label.
+    """
+    matrix, resolved = _matrix_and_labels(y_true, y_pred)
+    if positive_label not in resolved:
+        return 0, 0, 0
+    index = resolved.index(positive_label)
+    return int(matrix[index, index]), int(matrix[:, index].sum()), int(matrix[index].sum())
 
 
 def confusion_matrix(
     y_true,
     y_pred,
     labels=None,
+    sparse: str | None = None,
 ) -> np.ndarray:
     """
     Build the confusion matrix for multi-class classification.
@@ -68,18 +290,20 @@ def confusion_matrix(
         labels (array-like | None): Optional ordered list of label values. When
             None, the union of labels from y_true and y_pred (in encounter order)
             is used. Every element must be hashable.
+        sparse (str | None): "coo" or "csr" to return a SciPy sparse matrix
+            holding only the observed cells (requires SciPy).
 
     Returns:
         np.ndarray: Square matrix of shape (n_classes, n_classes) containing
             integer counts. Rows correspond to true labels and columns to
-            predicted labels.
+            predicted labels. A SciPy sparse matrix when `sparse` is set.
 
     Example:
         >>> confusion_matrix(["cat", "dog"], ["cat", "cat"], labels=["cat", "dog"])
         array([[1, 0],
                [1, 0]])
     """
-    raise NotImplementedError("Implement confusion_matrix.")
+    return _matrix_and_labels(y_true, y_pred, labels, sparse)[0]
 
 
 def accuracy_score(y_true, y_pred) -> float:
@@ -97,7 +321,8 @@ def accuracy_score(y_true, y_pred) -> float:
         >>> accuracy_score(["cat", "dog"], ["cat", "cat"])
         0.5
     """
-    raise NotImplementedError("Implement accuracy_score.")
+    matrix, _ = _matrix_and_labels(y_true, y_pred)
+    return _safe_divide(np.trace(matrix), matrix.sum())
 
 
 def precision_score(y_true, y_pred, positive_label) -> float:
@@ -116,7 +341,8 @@ def precision_score(y_true, y_pred, positive_label) -> float:
         >>> precision_score(["cat", "dog"], ["cat", "cat"], positive_label="cat")
         0.5
     """
-    raise NotImplementedError("Implement precision_score.")
+    tp, predicted, _ = _single_class_counts(y_true, y_pred, positive_label)
+    return _safe_divide(tp, predicted)
 
 
 def recall_score(y_true, y_pred, positive_label) -> float:
@@ -135,7 +361,8 @@ def recall_score(y_true, y_pred, positive_label) -> float:
         >>> recall_score(["cat", "cat"], ["cat", "dog"], positive_label="cat")
         0.5
     """
-    raise NotImplementedError("Implement recall_score.")
+    tp, _, actual = _single_class_counts(y_true, y_pred, positive_label)
+    return _safe_divide(tp, actual)
 
 
 def f1_score(y_true, y_pred, positive_label) -> float:
@@ -154,7 +381,8 @@ def f1_score(y_true, y_pred, positive_label) -> float:
         >>> f1_score(["cat", "dog"], ["cat", "cat"], positive_label="cat")
         0.6666666666666666
     """
-    raise NotImplementedError("Implement f1_score.")
+    tp, predicted, actual = _single_class_counts(y_true, y_pred, positive_label)
+    return _f1_from_counts(tp, predicted, actual)
 
 
 def macro_f1_score(y_true, y_pred, labels) -> float:
@@ -174,7 +402,8 @@ def macro_f1_score(y_true, y_pred, labels) -> float:
         >>> macro_f1_score(["cat", "dog"], ["cat", "cat"], labels=["cat", "dog"])
         0.5
     """
-    raise NotImplementedError("Implement macro_f1_score.")
+    matrix, _ = _matrix_and_labels(y_true, y_pred, labels, _auto_sparse(labels))
+    return float(np.mean(_f1_from_counts(*_per_class_counts(matrix))))
 
 
 def micro_f1_score(y_true, y_pred, labels) -> float:
@@ -193,5 +422,167 @@ def micro_f1_score(y_true, y_pred, labels) -> float:
         >>> micro_f1_score(["cat", "dog"], ["cat", "cat"], labels=["cat", "dog"])
         0.5
     """
-    raise NotImplementedError("Implement micro_f1_score.")
+    matrix, _ = _matrix_and_labels(y_true, y_pred, labels, _auto_sparse(labels))
+    tp, predicted, actual = _per_class_counts(matrix)
+    return _f1_from_counts(tp.sum(), predicted.sum(), actual.sum())
+
+
+def classification_report(y_true, y_pred, labels=None, sparse: str | None = None) -> dict:
+    """
+    Compute every classification metric from a single confusion matrix.
+
+    The inputs are scanned once: labels are encoded with one
+    ``np.unique(..., return_inverse=True)`` and counted with one ``bincount``.
+    All per-class and averaged metrics are then read off the matrix margins.
+
+    Args:
+        y_true (array-like): Ground-truth labels.
+        y_pred (array-like): Predicted labels.
+        labels (array-like | None): Optional ordered label set (see
+            `confusion_matrix`).
+        sparse (str | None): Keep the confusion matrix in SciPy "coo"/"csr"
+            form; per-class metrics are computed from it directly.
+
+    Returns:
+        dict: Keys ``labels``, ``confusion_matrix``, per-class arrays
+        ``precision``, ``recall``, ``f1`` and ``support`` (aligned with
+        ``labels``), and the scalars ``accuracy``, ``macro_precision``,
+        ``macro_recall``, ``macro_f1``, ``micro_precision``, ``micro_recall``,
+        ``micro_f1`` and ``weighted_f1``.
+
+    Example:
+        >>> classification_report(["cat", "dog"], ["cat", "cat"])["macro_f1"]
+        0.3333333333333333
+    """
+    matrix, resolved = _matrix_and_labels(y_true, y_pred, labels, sparse)
+    return _report_from_matrix(matrix, resolved)
+
+
+def _report_from_matrix(matrix, resolved: list) -> dict:
+    """
+    Derive the `classification_report` dictionary from a confusion matrix.
+    """
+    tp, predicted, actual = _per_class_counts(matrix)
+    precision = _safe_divide_array(tp, predicted)
+    recall = _safe_divide_array(tp, actual)
+    f1 = _f1_from_counts(tp, predicted, actual)
+    total_tp, total_predicted, total_actual = tp.sum(), predicted.sum(), actual.sum()
+    return {
+        "labels": resolved,
+        "confusion_matrix": matrix,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "support": actual,
+        "accuracy": _safe_divide(total_tp, actual.sum()),
+        "macro_precision": float(precision.mean()),
+        "macro_recall": float(recall.mean()),
+        "macro_f1": float(f1.mean()),
+        "micro_precision": _safe_divide(total_tp, total_predicted),
+        "micro_recall": _safe_divide(total_tp, total_actual),
+        "micro_f1": _f1_from_counts(total_tp, total_predicted, total_actual),
+        "weighted_f1": _safe_divide(float(f1 @ actual), total_actual),
+    }
+
+
+class ConfusionMatrixAccumulator:
+    """
+    Running confusion matrix for evaluating prediction streams chunk by chunk.
+
+    Counts are integers, so any split of the data into chunks (and any merge
+    order across workers) yields exactly the matrix the batch functions build.
+    Without explicit labels, new labels are appended in order of first
+    appearance in the stream; pass `labels` to fix the row/column order.
+
+    Example:
+        >>> acc = ConfusionMatrixAccumulator()
+        >>> acc.update(["cat"], ["cat"]).update(["dog"], ["cat"]).result()["accuracy"]
+        0.5
+    """
 
+    def __init__(self, labels=None) -> None:
+        """
+        Args:
+            labels (array-like | None): Fixed ordered label set; values outside
+                it are ignored. None grows the label set as labels arrive.
+        """
+        self.fixed_labels = labels is not None
+        self.labels_: list = [] if labels is None else list(labels)
+        if self.fixed_labels and not self.labels_:
+            raise ValueError("labels must not be empty.")
+        self.confusion_matrix_ = np.zeros((len(self.labels_),) * 2, dtype=np.int64)
+
+    def update(self, y_true_chunk, y_pred_chunk) -> "ConfusionMatrixAccumulator":
+        """
+        Add one chunk of labels to the running matrix.
+
+        Args:
+            y_true_chunk (array-like): Ground-truth labels.
+            y_pred_chunk (array-like): Predicted labels, same length.
+
+        Returns:
+            ConfusionMatrixAccumulator: self, for chaining.
+        """
+        y_true_arr, y_pred_arr = _prepare_inputs(y_true_chunk, y_pred_chunk)
+        if not self.fixed_labels:
+            new_labels, _ = _encounter_order(_pool(y_true_arr, y_pred_arr))
+            self._extend_labels(list(new_labels))
+        if not self.labels_:
+            return self
+        true_codes, pred_codes, _ = _encode_pairs(y_true_arr, y_pred_arr, self.labels_)
+        self.confusion_matrix_ += _confusion_from_codes(true_codes, pred_codes, len(self.labels_))
+        return self
+
+    def merge(self, other: "ConfusionMatrixAccumulator") -> "ConfusionMatrixAccumulator":
+        """
+        Fold another accumulator (e.g. from a worker) into this one.
+
+        Args:
+            other (ConfusionMatrixAccumulator): Accumulator to absorb.
+
+        Returns:
+            ConfusionMatrixAccumulator: self, for chaining.
+        """
+        if not other.labels_:
+            return self
+        if not self.fixed_labels:
+            self._extend_labels(other.labels_)
+        positions, _, _ = _encode_pairs(
+            np.asarray(other.labels_), np.asarray(other.labels_), self.labels_
+        )
+        keep = np.flatnonzero(positions >= 0)
+        self.confusion_matrix_[np.ix_(positions[keep], positions[keep])] += (
+            other.confusion_matrix_[np.ix_(keep, keep)]
+        )
+        return self
+
+    def result(self) -> dict:
+        """
+        Compute every metric of `classification_report` from the running matrix.
+
+        Returns:
+            dict: Same keys as `classification_report`.
+
+        Raises:
+            ValueError: If no labels have been seen yet.
+        """
+        if not self.labels_:
+            raise ValueError("No samples have been accumulated.")
+        return _report_from_matrix(self.confusion_matrix_.copy(), list(self.labels_))
+
+    def _extend_labels(self, candidates: list) -> None:
+        """
+        Append unseen labels (keeping order) and grow the matrix to match.
+        """
+        if self.labels_:
+            known, _, _ = _encode_pairs(
+                np.asarray(candidates), np.asarray(candidates), self.labels_
+            )
+            candidates = [label for label, code in zip(candidates, known) if code < 0]
+        if not candidates:
+            return
+        n_old = len(self.labels_)
+        self.labels_.extend(candidates)
+        grown = np.zeros((len(self.labels_),) * 2, dtype=np.int64)
+        grown[:n_old, :n_old] = self.confusion_matrix_
+        self.confusion_matrix_ = grown
@@ -6,22 +6,44 @@ from typing import Dict
 
 import numpy as np
 
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+# Elements per block; caps the temporaries of a report at two such buffers.
+_BLOCK_SIZE = 1 << 16
 
-def _prepare_inputs(y_true, y_pred) -> tuple[np.ndarray, np.ndarray]:
+
+def _prepare_inputs(y_true, y_pred, dtype=None) -> tuple[np.ndarray, np.ndarray]:
     """
     Convert regression targets/predictions into aligned 1-D float arrays.
 
+    Contiguous float inputs that already have the requested dtype are returned
+    as views, without a defensive copy.
+
     Args:
         y_true (array-like): Ground-truth values.
         y_pred (array-like): Predicted values.
+        dtype (np.dtype | None): float32 or float64. None keeps float inputs'
+            common precision and converts anything else to float64.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Pair of flattened float arrays.
 
     Raises:
-        ValueError: If the arrays have different lengths.
+        ValueError: If the arrays have different lengths or dtype is not a
+            supported float type.
     """
-    raise NotImplementedError("Implement _prepare_inputs.")
+    y_true_arr = np.asarray(y_true)
+    y_pred_arr = np.asarray(y_pred)
+    if dtype is None:
+        dtype = np.result_type(y_true_arr.dtype, y_pred_arr.dtype)
+        if dtype not in _FLOAT_DTYPES:
+            dtype = np.float64
+    elif np.dtype(dtype) not in _FLOAT_DTYPES:
+        raise ValueError("dtype must be float32 or float64.")
+    y_true_arr = np.ravel(np.asarray(y_true_arr, dtype=dtype))
+    y_pred_arr = np.ravel(np.asarray(y_pred_arr, dtype=dtype))
+    if y_true_arr.shape[0] != y_pred_arr.shape[0]:
+        raise ValueError("y_true and y_pred must have the same length.")
+    return y_true_arr, y_pred_arr
 
 
 def mean_absolute_error(y_true, y_pred) -> float:
@@ -35,7 +57,7 @@ def mean_absolute_error(y_true, y_pred) -> float:
     Returns:
         float: Average absolute deviation between prediction and truth.
     """
-    raise NotImplementedError("Implement mean_absolute_error.")
+    return regression_report(y_true, y_pred)["mae"]
 
 
 def mean_squared_error(y_true, y_pred) -> float:
@@ -49,7 +71,7 @@ def mean_squared_error(y_true, y_pred) -> float:
     Returns:
         float: Average squared deviation between prediction and truth.
     """
-    raise NotImplementedError("Implement mean_squared_error.")
+    return regression_report(y_true, y_pred)["mse"]
 
 
 def root_mean_squared_error(y_true, y_pred) -> float:
@@ -63,7 +85,7 @@ def root_mean_squared_error(y_true, y_pred) -> float:
     Returns:
         float: Square root of the mean squared error.
     """
-    raise NotImplementedError("Implement root_mean_squared_error.")
+    return regression_report(y_true, y_pred)["rmse"]
 
 
 def r2_score(y_true, y_pred) -> float:
@@ -77,19 +99,159 @@ def r2_score(y_true, y_pred) -> float:
     Returns:
         float: R² score, 1.0 for perfect predictions.
     """
-    raise NotImplementedError("Implement r2_score.")
+    return regression_report(y_true, y_pred)["r2"]
 
 
-def regression_report(y_true, y_pred) -> Dict[str, float]:
+def regression_report(
+    y_true, y_pred, dtype=None, block_size: int = _BLOCK_SIZE
+) -> Dict[str, float]:
     """
     Aggregate common regression metrics into a dictionary.
 
+    All four metrics come from one fused pass: each block's residual is
+    computed once and reduced into the running sums, so temporary memory is
+    bounded by `block_size` regardless of the input length.
+
     Args:
         y_true (array-like): Ground-truth values.
         y_pred (array-like): Predicted values.
+        dtype (np.dtype | None): Precision of the per-block arithmetic
+            (float32 or float64); sums are always accumulated in float64.
+        block_size (int): Elements processed per block.
 
     Returns:
         Dict[str, float]: Keys "mae", "mse", "rmse", and "r2".
     """
-    raise NotImplementedError("Implement regression_report.")
+    accumulator = RegressionMetricsAccumulator(dtype=dtype, block_size=block_size)
+    return accumulator.update(y_true, y_pred).result()
+
+
+class RegressionMetricsAccumulator:
+    """
+    Running sums for MAE, MSE, RMSE and R² over a stream of chunks.
+
+    The state is the sample count, the sums of absolute and squared residuals,
+    and the mean and centred sum of squares (M2) of the targets. Chunks and
+    partial accumulators are combined with the pairwise Welford/Chan update,
+    which avoids the cancellation of the naive ``sum(y**2) - n * mean**2``.
+    Large chunks are consumed in blocks of `block_size` elements through two
+    reusable buffers. The batch functions are computed through this class,
+    so results agree with them up to rounding for any chunking.
+
+    Example:
+        >>> acc = RegressionMetricsAccumulator()
+        >>> acc.update([1.0, 2.0], [1.0, 3.0]).update([3.0], [3.0]).result()["mae"]
+        0.3333333333333333
+    """
+
+    def __init__(self, dtype=None, block_size: int = _BLOCK_SIZE) -> None:
+        """
+        Args:
+            dtype (np.dtype | None): Precision of the per-block arithmetic
+                (see `_prepare_inputs`).
+            block_size (int): Elements processed per block.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive.")
+        if dtype is not None and np.dtype(dtype) not in _FLOAT_DTYPES:
+            raise ValueError("dtype must be float32 or float64.")
+        self.dtype = dtype
+        self.block_size = block_size
+        self.n_samples_ = 0
+        self.abs_error_sum_ = 0.0
+        self.sq_error_sum_ = 0.0
+        self.mean_true_ = 0.0
+        self.m2_true_ = 0.0
+
+    def update(self, y_true_chunk, y_pred_chunk) -> "RegressionMetricsAccumulator":
+        """
+        Add one chunk of targets and predictions.
+
+        Args:
+            y_true_chunk (array-like): Ground-truth values.
+            y_pred_chunk (array-like): Predicted values, same length.
+
+        Returns:
+            RegressionMetricsAccumulator: self, for chaining.
+        """
+        y_true_arr, y_pred_arr = _prepare_inputs(y_true_chunk, y_pred_chunk, self.dtype)
+        n_chunk = y_true_arr.shape[0]
+        if n_chunk == 0:
+            return self
+        block = min(self.block_size, n_chunk)
+        residual = np.empty(block, dtype=y_true_arr.dtype)
+        scratch = np.empty(block, dtype=y_true_arr.dtype)
+        for start in range(0, n_chunk, block):
+            stop = min(start + block, n_chunk)
+            size = stop - start
+            r, tmp = residual[:size], scratch[:size]
+            y_block = y_true_arr[start:stop]
+            np.subtract(y_block, y_pred_arr[start:stop], out=r)
+            abs_sum = np.abs(r, out=tmp).sum(dtype=np.float64)
+            sq_sum = np.square(r, out=tmp).sum(dtype=np.float64)
+            block_mean = float(y_block.sum(dtype=np.float64)) / size
+            np.subtract(y_block, block_mean, out=tmp)
+            m2 = np.square(tmp, out=tmp).sum(dtype=np.float64)
+            self._combine(size, float(abs_sum), float(sq_sum), block_mean, float(m2))
+        return self
+
+    def merge(self, other: "RegressionMetricsAccumulator") -> "RegressionMetricsAccumulator":
+        """
+        Fold another accumulator (e.g. from a worker) into this one.
+
+        Args:
+            other (RegressionMetricsAccumulator): Accumulator to absorb.
+
+        Returns:
+            RegressionMetricsAccumulator: self, for chaining.
+        """
+        if other.n_samples_:
+            self._combine(
+                other.n_samples_,
+                other.abs_error_sum_,
+                other.sq_error_sum_,
+                other.mean_true_,
+                other.m2_true_,
+            )
+        return self
+
+    def result(self) -> Dict[str, float]:
+        """
+        Compute the metrics accumulated so far.
+
+        Returns:
+            Dict[str, float]: Keys "mae", "mse", "rmse", and "r2". R² is 1.0
+            for constant targets predicted exactly and 0.0 otherwise when the
+            targets have no variance.
+
+        Raises:
+            ValueError: If no samples have been accumulated.
+        """
+        if self.n_samples_ == 0:
+            raise ValueError("No samples have been accumulated.")
+        mse = self.sq_error_sum_ / self.n_samples_
+        if self.m2_true_ > 0:
+            r2 = 1.0 - self.sq_error_sum_ / self.m2_true_
+        else:
+            r2 = 1.0 if self.sq_error_sum_ == 0 else 0.0
+        return {
+            "mae": self.abs_error_sum_ / self.n_samples_,
+            "mse": mse,
+            "rmse": float(np.sqrt(mse)),
+            "r2": r2,
+        }
+
+    def _combine(
+        self, n_other: int, abs_sum: float, sq_sum: float, mean_other: float, m2_other: float
+    ) -> None:
+        """
+        Chan et al. pairwise merge of (count, mean, M2) plus plain residual sums.
+        """
+        n_total = self.n_samples_ + n_other
+        delta = mean_other - self.mean_true_
+        self.m2_true_ += m2_other + delta * delta * self.n_samples_ * n_other / n_total
+        self.mean_true_ += delta * n_other / n_total
+        self.n_samples_ = n_total
+        self.abs_error_sum_ += abs_sum
+        self.sq_error_sum_ += sq_sum
 
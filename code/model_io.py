@@ -0,0 +1,128 @@
+"""Versioned binary model files with zero-copy, memory-mapped loading.
+
+Layout (all integers little-endian)::
+
+    magic (8 bytes) | format version (uint32) | header length (uint32)
+    JSON header (kind, params, array table)
+    padding to a 64-byte boundary
+    raw C-ordered array bytes, each starting on a 64-byte boundary
+
+Array offsets in the header are relative to the start of the data section,
+so readers can map every array straight out of the file.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+FORMAT_VERSION = 1
+_MAGIC = b"ASE2MDL\x00"
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGN = 64
+
+
+def _aligned(offset: int) -> int:
+    """
+    Round `offset` up to the next multiple of the array alignment.
+    """
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _json_default(value):
+    """
+    Serialise NumPy scalars and dtypes that `json` does not know about.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.dtype):
+        return value.name
+    raise TypeError(f"Cannot serialise {type(value).__name__} in a model header.")
+
+
+def save_model(path, kind: str, params: dict, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write a model file.
+
+    Args:
+        path (str | Path): Destination file.
+        kind (str): Estimator class name, checked again on load.
+        params (dict): JSON-serialisable hyperparameters and scalar state.
+        arrays (Dict[str, np.ndarray]): Numeric or fixed-width string arrays.
+
+    Raises:
+        ValueError: If an array has object dtype.
+    """
+    table = {}
+    contiguous = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise ValueError(f"Array '{name}' has object dtype and cannot be stored raw.")
+        table[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        contiguous[name] = array
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps(
+        {"kind": kind, "params": params, "arrays": table}, default=_json_default
+    ).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+    with open(Path(path), "wb") as handle:
+        handle.write(_PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(header)))
+        handle.write(header)
+        for name, array in contiguous.items():
+            handle.write(b"\x00" * (data_start + table[name]["offset"] - handle.tell()))
+            handle.write(memoryview(array).cast("B"))
+
+
+def load_model(path, mmap: bool = True, kind: str | None = None) -> tuple[dict, dict]:
+    """
+    Read a model file written by `save_model`.
+
+    Args:
+        path (str | Path): Model file.
+        mmap (bool): Map arrays read-only from the file (zero-copy) instead of
+            reading them into memory.
+        kind (str | None): Expected estimator class name.
+
+    Returns:
+        tuple[dict, dict]: The params dictionary and the arrays by name.
+
+    Raises:
+        ValueError: If the file is not a model file, has a newer format
+            version, or holds a different kind of estimator.
+    """
+    path = Path(path)
+    with open(path, "rb") as handle:
+        preamble = handle.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError(f"{path} is not a model file.")
+        magic, version, header_len = _PREAMBLE.unpack(preamble)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a model file.")
+        if version > FORMAT_VERSION:
+            raise ValueError(
+                f"{path} uses format version {version}; this build reads up to {FORMAT_VERSION}."
+            )
+        header = json.loads(handle.read(header_len).decode("utf-8"))
+        if kind is not None and header["kind"] != kind:
+            raise ValueError(f"{path} holds a {header['kind']}, not a {kind}.")
+        data_start = _aligned(_PREAMBLE.size + header_len)
+        arrays = {}
+        raw = np.memmap(path, dtype=np.uint8, mode="r") if mmap and header["arrays"] else None
+        for name, entry in header["arrays"].items():
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            count = int(np.prod(shape, dtype=np.int64))
+            start = data_start + entry["offset"]
+            if raw is not None:
+                block = raw[start : start + count * dtype.itemsize]
+                arrays[name] = block.view(dtype).reshape(shape)
+            else:
+                handle.seek(start)
+                arrays[name] = np.fromfile(handle, dtype=dtype, count=count).reshape(shape)
+    return header["params"], arrays
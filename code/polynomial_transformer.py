@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from itertools import combinations_with_replacement
-from typing import Iterable, List, Sequence, Tuple
+from math import comb
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
 import numpy as np
 
+from model_io import load_model, save_model
+
 
 class PolynomialTransformer:
     """
@@ -22,6 +25,8 @@ class PolynomialTransformer:
         Number of input features seen during fit.
     combinations_ : list[tuple[int, ...]]
         Cached index combinations for generating monomials (excluding the bias term).
+    n_output_features_ : int
+        Width of the transformed matrix, computed combinatorially.
     """
 
     def __init__(self, degree: int = 2, include_bias: bool = True) -> None:
@@ -49,35 +54,203 @@ class PolynomialTransformer:
         Returns:
             PolynomialTransformer: The fitted transformer (self).
         """
-        raise NotImplementedError("Implement PolynomialTransformer.fit.")
+        X_arr = self._validate_input(X)
+        self.n_features_in_ = X_arr.shape[1]
+        self.combinations_ = self._generate_combinations(self.n_features_in_)
+        return self
 
-    def transform(self, X: Sequence[Sequence[float]]) -> np.ndarray:
+    def transform(
+        self,
+        X: Sequence[Sequence[float]],
+        out: np.ndarray | None = None,
+        dtype=np.float64,
+    ) -> np.ndarray:
         """
         Apply the learned polynomial expansion to new data.
 
+        The output is built degree by degree: every degree-d block is the
+        previous block times one input column, written straight into a single
+        preallocated matrix, so each monomial costs one multiplication
+        regardless of its degree. Columns follow the order of `combinations_`.
+
         Args:
             X (array-like): Input feature matrix of shape (n_samples, n_features).
+            out (np.ndarray | None): Optional preallocated destination of shape
+                (n_samples, n_output_columns); its dtype overrides `dtype`.
+            dtype (np.dtype): Floating-point type of a newly allocated output
+                (e.g. np.float32 to halve memory).
 
         Returns:
             np.ndarray: Dense design matrix containing all polynomial terms.
 
         Raises:
+            RuntimeError: If called before fit.
             ValueError: If transform is called with a different feature count
-                than was seen during fit.
+                than was seen during fit, or `out` has the wrong shape.
+        """
+        if self.combinations_ is None:
+            raise RuntimeError("PolynomialTransformer must be fitted before transform.")
+        X_arr = self._validate_input(X)
+        if X_arr.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"Expected {self.n_features_in_} features, got {X_arr.shape[1]}."
+            )
+        expected_shape = (X_arr.shape[0], self.n_output_features_)
+        if out is None:
+            out = np.empty(expected_shape, dtype=dtype)
+        elif out.shape != expected_shape:
+            raise ValueError(f"out must have shape {expected_shape}, got {out.shape}.")
+        self._fill_design(X_arr, out)
+        return out
+
+    def transform_iter(
+        self,
+        X: Sequence[Sequence[float]],
+        chunk_rows: int = 10_000,
+        dtype=np.float64,
+        reuse_buffer: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """
+        Lazily expand X in row blocks so the full design matrix never exists.
+
+        Args:
+            X (array-like): Input feature matrix (may be a np.memmap); rows are
+                read one block at a time.
+            chunk_rows (int): Maximum rows per yielded block (> 0).
+            dtype (np.dtype): Floating-point type of the blocks.
+            reuse_buffer (bool): Write every block into the same buffer. This
+                caps memory at one block, but each yielded array is overwritten
+                by the next, so consume it (e.g. accumulate XᵀX) before advancing.
+
+        Yields:
+            np.ndarray: Expanded block of shape (rows, n_output_features_).
+
+        Raises:
+            RuntimeError: If called before fit.
+            ValueError: If chunk_rows is not positive.
         """
-        raise NotImplementedError("Implement PolynomialTransformer.transform.")
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive.")
+        if self.combinations_ is None:
+            raise RuntimeError("PolynomialTransformer must be fitted before transform.")
+        n_samples = len(X)
+        buffer = None
+        for start in range(0, n_samples, chunk_rows):
+            block = X[start : start + chunk_rows]
+            if not reuse_buffer:
+                yield self.transform(block, dtype=dtype)
+                continue
+            if buffer is None:
+                buffer_shape = (min(chunk_rows, n_samples), self.n_output_features_)
+                buffer = np.empty(buffer_shape, dtype=dtype)
+            yield self.transform(block, out=buffer[: len(block)])
 
     def fit_transform(self, X: Sequence[Sequence[float]]) -> np.ndarray:
         """
         Fit the transformer on X and immediately return the transformed matrix.
         """
-        raise NotImplementedError("Implement PolynomialTransformer.fit_transform.")
+        return self.fit(X).transform(X)
+
+    def save(self, path) -> None:
+        """
+        Write the fitted transformer to a binary model file (see `model_io`).
+
+        `combinations_` is stored as an (n_terms, degree) index matrix padded
+        with -1.
+
+        Args:
+            path (str | Path): Destination file.
+
+        Raises:
+            RuntimeError: If called before fit.
+        """
+        if self.combinations_ is None:
+            raise RuntimeError("PolynomialTransformer must be fitted before saving.")
+        table = np.full((len(self.combinations_), self.degree), -1, dtype=np.int64)
+        for row, combo in enumerate(self.combinations_):
+            table[row, : len(combo)] = combo
+        params = {
+            "degree": self.degree,
+            "include_bias": self.include_bias,
+            "n_features_in_": self.n_features_in_,
+        }
+        save_model(path, "PolynomialTransformer", params, {"combinations_": table})
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "PolynomialTransformer":
+        """
+        Load a transformer written by `save`.
+
+        Args:
+            path (str | Path): Model file.
+            mmap (bool): Map the combination table instead of reading it.
+
+        Returns:
+            PolynomialTransformer: The restored, fitted transformer.
+        """
+        params, arrays = load_model(path, mmap, kind="PolynomialTransformer")
+        transformer = cls(degree=params["degree"], include_bias=params["include_bias"])
+        transformer.n_features_in_ = params["n_features_in_"]
+        transformer.combinations_ = [
+            tuple(int(i) for i in row if i >= 0) for row in arrays["combinations_"]
+        ]
+        return transformer
+
+    @property
+    def n_output_features_(self) -> int:
+        """
+        Number of columns produced by transform, without enumerating monomials.
+
+        There are C(n_features + degree, degree) monomials of total degree
+        <= degree, one of which is the constant term.
+
+        Raises:
+            RuntimeError: If called before fit.
+        """
+        if self.n_features_in_ is None:
+            raise RuntimeError("PolynomialTransformer must be fitted first.")
+        n_terms = comb(self.n_features_in_ + self.degree, self.degree) - 1
+        return n_terms + int(self.include_bias)
+
+    def _fill_design(self, X: np.ndarray, out: np.ndarray) -> None:
+        """
+        Write the polynomial expansion of X into `out` using the degree recurrence.
+
+        Within a degree, `combinations_` is lexicographic, so the monomials
+        whose first index is i are column i times the contiguous tail of the
+        previous degree's block whose first index is >= i.
+        """
+        n_features = X.shape[1]
+        col = 0
+        if self.include_bias:
+            out[:, 0] = 1.0
+            col = 1
+        if self.degree == 0 or n_features == 0:
+            return
+        linear_start = col
+        out[:, col : col + n_features] = X
+        prev_end = col + n_features
+        col = prev_end
+        for degree in range(2, self.degree + 1):
+            for i in range(n_features):
+                # Degree-(d-1) monomials over features i..n-1.
+                tail = comb(n_features - i + degree - 2, degree - 1)
+                np.multiply(
+                    out[:, prev_end - tail : prev_end],
+                    out[:, linear_start + i : linear_start + i + 1],
+                    out=out[:, col : col + tail],
+                )
+                col += tail
+            prev_end = col
 
     def _generate_combinations(self, n_features: int) -> List[Tuple[int, ...]]:
         """
         Enumerate all index tuples representing monomials up to self.degree.
         """
-        raise NotImplementedError("Implement PolynomialTransformer._generate_combinations.")
+        combos: List[Tuple[int, ...]] = []
+        for degree in range(1, self.degree + 1):
+            combos.extend(combinations_with_replacement(range(n_features), degree))
+        return combos
 
     @staticmethod
     def _validate_input(X: Sequence[Sequence[float]]) -> np.ndarray:
@@ -90,5 +263,10 @@ class PolynomialTransformer:
         Raises:
             ValueError: If X cannot be reshaped into 2 dimensions.
         """
-        raise NotImplementedError("Implement PolynomialTransformer._validate_input.")
+        X_arr = np.asarray(X, dtype=float)
+        if X_arr.ndim == 1:
+            X_arr = X_arr.reshape(-1, 1)
+        if X_arr.ndim != 2:
+            raise ValueError("X must be a 2-D array of shape (n_samples, n_features).")
+        return X_arr
 
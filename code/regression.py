@@ -7,13 +7,18 @@ import numpy as np
 from linear_regression import LinearRegression
 from polynomial_transformer import PolynomialTransformer
 
+# Positions of the surface basis [1, x1, x2, x1², x1·x2, x2²] inside the
+# tensor basis kron([1, x1, x1²], [1, x2, x2²]) (column a * 3 + b is x1^a x2^b).
+_SURFACE_TENSOR_COLUMNS = np.array([0, 3, 1, 6, 4, 2])
 
-def _ensure_column(vector) -> np.ndarray:
+
+def _ensure_column(vector, dtype=float) -> np.ndarray:
     """
     Convert a 1-D array-like input into a single-column matrix.
 
     Args:
         vector (array-like): Input values.
+        dtype (np.dtype): Floating-point type of the result.
 
     Returns:
         np.ndarray: Shape (n_samples, 1).
@@ -21,7 +26,12 @@ def _ensure_column(vector) -> np.ndarray:
     Raises:
         ValueError: If the input cannot be coerced into a column vector.
     """
-    raise NotImplementedError("Implement _ensure_column.")
+    arr = np.asarray(vector, dtype=dtype)
+    if arr.ndim == 1:
+        return arr.reshape(-1, 1)
+    if arr.ndim == 2 and arr.shape[1] == 1:
+        return arr
+    raise ValueError("Input must be a 1-D vector or a single-column matrix.")
 
 
 def _stack_features(*features) -> np.ndarray:
@@ -37,7 +47,10 @@ def _stack_features(*features) -> np.ndarray:
     Raises:
         ValueError: If feature vectors have different lengths.
     """
-    raise NotImplementedError("Implement _stack_features.")
+    columns = [_ensure_column(feature) for feature in features]
+    if len({column.shape[0] for column in columns}) > 1:
+        raise ValueError("All feature vectors must have the same length.")
+    return np.hstack(columns)
 
 
 def polynomial_features(x, degree: int) -> np.ndarray:
@@ -51,7 +64,9 @@ def polynomial_features(x, degree: int) -> np.ndarray:
     Returns:
         np.ndarray: Polynomial feature matrix including bias column.
     """
-    raise NotImplementedError("Implement polynomial_features.")
+    if degree < 0:
+        raise ValueError("degree must be non-negative.")
+    return PolynomialTransformer(degree=degree, include_bias=True).fit_transform(_ensure_column(x))
 
 
 def fit_polynomial_regression(
@@ -60,6 +75,7 @@ def fit_polynomial_regression(
     degree: int = 2,
     learning_rate: float = 0.01,
     epochs: int = 2000,
+    chunk_rows: int | None = None,
 ) -> np.ndarray:
     """
     Fit polynomial regression coefficients via closed-form least squares.
@@ -70,28 +86,200 @@ def fit_polynomial_regression(
         degree (int): Polynomial degree.
         learning_rate (float): Ignored; kept for parity with student API.
         epochs (int): Ignored; kept for parity with student API.
+        chunk_rows (int | None): When set, expand and accumulate the normal
+            equations block by block so the full design matrix is never held.
 
     Returns:
         np.ndarray: Learned weights (including bias).
+
+    Raises:
+        ValueError: If x and y have different lengths.
     """
-    raise NotImplementedError("Implement fit_polynomial_regression.")
+    x_col = _ensure_column(x)
+    y_arr = np.asarray(y, dtype=float).ravel()
+    if x_col.shape[0] != y_arr.shape[0]:
+        raise ValueError("x and y must contain the same number of samples.")
+    model = LinearRegression(fit_intercept=False)
+    if chunk_rows is None:
+        model.fit(polynomial_features(x_col, degree), y_arr)
+        return model.coef_
+    transformer = PolynomialTransformer(degree=degree, include_bias=True).fit(x_col[:1])
+    blocks = transformer.transform_iter(x_col, chunk_rows=chunk_rows, reuse_buffer=True)
+    y_blocks = (y_arr[start : start + chunk_rows] for start in range(0, len(y_arr), chunk_rows))
+    model.fit_chunks(zip(blocks, y_blocks))
+    return model.coef_
+
+
+def fit_polynomial_path(x, y, degrees, x_val=None, y_val=None) -> dict:
+    """
+    Fit polynomial regressions for several degrees from one factorisation.
+
+    The design matrix for the highest degree is built once and QR-factorised.
+    Because the columns [1, x, x², ...] are nested, the first ``d + 1`` columns
+    of Q and the leading block of R are the QR factors of the degree-``d``
+    design, so every fit, residual and hat-matrix diagonal is a prefix (or
+    cumulative sum) of the same factors.
+
+    Args:
+        x (array-like): Predictor values.
+        y (array-like): Target values.
+        degrees (array-like): Non-negative polynomial degrees to evaluate.
+        x_val (array-like | None): Validation predictor values.
+        y_val (array-like | None): Validation targets. When the validation set
+            is omitted, the exact leave-one-out error is reported instead.
+
+    Returns:
+        dict: ``degrees`` (np.ndarray), ``weights`` (list of weight vectors
+        including bias, one per degree), ``train_errors`` and ``val_errors``
+        (mean squared errors per degree), and ``best_degree`` (lowest
+        validation error, first on ties).
+
+    Raises:
+        ValueError: If degrees is empty or negative, the inputs have
+            mismatched lengths, only one of x_val/y_val is given, or there are
+            fewer samples than coefficients of the highest degree.
+    """
+    degrees_arr = np.asarray(degrees, dtype=int).ravel()
+    if degrees_arr.size == 0 or np.any(degrees_arr < 0):
+        raise ValueError("degrees must be a non-empty sequence of non-negative integers.")
+    if (x_val is None) != (y_val is None):
+        raise ValueError("x_val and y_val must be provided together.")
+    x_col = _ensure_column(x)
+    y_arr = np.asarray(y, dtype=float).ravel()
+    if x_col.shape[0] != y_arr.shape[0]:
+        raise ValueError("x and y must contain the same number of samples.")
+    max_degree = int(degrees_arr.max())
+    if x_col.shape[0] < max_degree + 1:
+        raise ValueError("Need at least degree + 1 samples for the highest degree.")
+
+    design = polynomial_features(x_col, max_degree)
+    q, r = np.linalg.qr(design)
+    qty = q.T @ y_arr
+    # Column k holds the fit / leverage using the first k + 1 basis columns.
+    fitted = np.cumsum(q * qty, axis=1)
+    leverage = np.cumsum(q**2, axis=1)
+    if x_val is not None:
+        val_design = polynomial_features(x_val, max_degree)
+        y_val_arr = np.asarray(y_val, dtype=float).ravel()
+        if val_design.shape[0] != y_val_arr.shape[0]:
+            raise ValueError("x_val and y_val must contain the same number of samples.")
+
+    weights, train_errors, val_errors = [], [], []
+    for degree in degrees_arr:
+        k = int(degree) + 1
+        try:
+            coef = np.linalg.solve(r[:k, :k], qty[:k])
+        except np.linalg.LinAlgError:
+            coef = np.linalg.lstsq(design[:, :k], y_arr, rcond=None)[0]
+        residuals = y_arr - fitted[:, k - 1]
+        weights.append(coef)
+        train_errors.append(float(np.mean(residuals**2)))
+        if x_val is not None:
+            val_errors.append(float(np.mean((y_val_arr - val_design[:, :k] @ coef) ** 2)))
+        else:
+            denom = 1.0 - leverage[:, k - 1]
+            loo = np.divide(
+                residuals, denom, out=np.full_like(residuals, np.inf), where=denom > 1e-12
+            )
+            val_errors.append(float(np.mean(loo**2)))
+    val_errors_arr = np.asarray(val_errors)
+    return {
+        "degrees": degrees_arr,
+        "weights": weights,
+        "train_errors": np.asarray(train_errors),
+        "val_errors": val_errors_arr,
+        "best_degree": int(degrees_arr[int(np.argmin(val_errors_arr))]),
+    }
 
 
 def predict_polynomial(
     x,
     weights,
+    chunk_rows: int | None = None,
+    dtype=np.float64,
 ) -> np.ndarray:
     """
     Evaluate a polynomial model at the provided inputs.
 
+    Uses Horner's scheme, ``(((w_d x + w_{d-1}) x + ...) x + w_0)``, updated in
+    place, so no (n_samples, degree + 1) feature matrix is ever built and the
+    only allocation is the output vector.
+
     Args:
         x (array-like): Predictor values.
         weights (array-like): Weight vector including bias.
+        chunk_rows (int | None): Evaluate this many points at a time so each
+            block stays cache-resident across the degree loop.
+        dtype (np.dtype): Floating-point type of the computation and output.
 
     Returns:
         np.ndarray: Predicted responses.
+
+    Raises:
+        ValueError: If weights is empty or chunk_rows is not positive.
+    """
+    x_arr = _ensure_column(x, dtype=dtype).ravel()
+    weights_arr = np.asarray(weights, dtype=dtype).ravel()
+    if weights_arr.size == 0:
+        raise ValueError("weights must not be empty.")
+    if chunk_rows is not None and chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive.")
+    out = np.empty(x_arr.shape[0], dtype=dtype)
+    step = chunk_rows or max(x_arr.shape[0], 1)
+    for start in range(0, x_arr.shape[0], step):
+        _horner(x_arr[start : start + step], weights_arr, out[start : start + step])
+    return out
+
+
+def _horner(x: np.ndarray, weights: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write ``sum_k weights[k] * x**k`` into `out` with in-place Horner steps.
     """
-    raise NotImplementedError("Implement predict_polynomial.")
+    out.fill(weights[-1])
+    for coef in weights[-2::-1]:
+        out *= x
+        out += coef
+
+
+def _grid_layout(x1: np.ndarray, x2: np.ndarray):
+    """
+    Detect whether (x1, x2) pairs cover a full tensor grid exactly once.
+
+    Args:
+        x1 (np.ndarray): First predictor, shape (n_samples,).
+        x2 (np.ndarray): Second predictor, shape (n_samples,).
+
+    Returns:
+        tuple | None: (axis1, axis2, rows, cols) with the sorted unique grid
+        coordinates and each sample's grid position, or None when the samples
+        are not a complete grid without repeats.
+    """
+    axis1, rows = np.unique(x1, return_inverse=True)
+    axis2, cols = np.unique(x2, return_inverse=True)
+    if axis1.size * axis2.size != x1.shape[0]:
+        return None
+    cells = np.bincount(rows.ravel() * axis2.size + cols.ravel(), minlength=x1.shape[0])
+    if np.any(cells != 1):
+        return None
+    return axis1, axis2, rows.ravel(), cols.ravel()
+
+
+def _fit_surface_grid(axis1, axis2, rows, cols, y_arr) -> np.ndarray:
+    """
+    Least squares for the quadratic surface on a tensor grid.
+
+    On a grid the design matrix is ``(A1 ⊗ A2) S`` where A1, A2 are the 1-D
+    quadratic Vandermonde matrices of the axes and S selects the six surface
+    columns. With ``A_i = Q_i R_i``, ``Q1 ⊗ Q2`` has orthonormal columns, so
+    the problem reduces to a 9 x 6 solve of ``(R1 ⊗ R2) S w = vec(Q1ᵀ Y Q2)``.
+    """
+    targets = np.empty((axis1.size, axis2.size))
+    targets[rows, cols] = y_arr
+    q1, r1 = np.linalg.qr(polynomial_features(axis1, 2))
+    q2, r2 = np.linalg.qr(polynomial_features(axis2, 2))
+    projected = (q1.T @ targets @ q2).ravel()
+    reduced = np.kron(r1, r2)[:, _SURFACE_TENSOR_COLUMNS]
+    return np.linalg.lstsq(reduced, projected, rcond=None)[0]
 
 
 def fit_surface_regression(
@@ -100,27 +288,50 @@ def fit_surface_regression(
     y,
     learning_rate: float = 0.01,
     epochs: int = 2500,
+    grid: bool | None = None,
 ) -> np.ndarray:
     """
     Fit a quadratic surface regression with two predictors.
 
+    When the samples form a complete x1 × x2 grid, the problem separates into
+    two 1-D QR factorisations of three-column matrices (see
+    `_fit_surface_grid`) instead of a dense solve over all samples.
+
     Args:
         x1 (array-like): First predictor.
         x2 (array-like): Second predictor.
         y (array-like): Target values.
         learning_rate (float): Ignored; API compatibility only.
         epochs (int): Ignored; API compatibility only.
+        grid (bool | None): True requires grid input, False always uses the
+            dense solver, None detects the grid automatically.
 
     Returns:
-        np.ndarray: Learned weight vector.
+        np.ndarray: Learned weight vector ordered as
+        [1, x1, x2, x1², x1·x2, x2²].
+
+    Raises:
+        ValueError: If the lengths differ, or grid=True and the samples do not
+            form a complete grid.
     """
-    raise NotImplementedError("Implement fit_surface_regression.")
+    features = _stack_features(x1, x2)
+    y_arr = np.asarray(y, dtype=float).ravel()
+    if features.shape[0] != y_arr.shape[0]:
+        raise ValueError("Predictors and y must contain the same number of samples.")
+    layout = None if grid is False else _grid_layout(features[:, 0], features[:, 1])
+    if layout is not None:
+        return _fit_surface_grid(*layout, y_arr)
+    if grid:
+        raise ValueError("grid=True requires x1, x2 to cover a full grid exactly once.")
+    design = PolynomialTransformer(degree=2, include_bias=True).fit_transform(features)
+    return LinearRegression(fit_intercept=False).fit(design, y_arr).coef_
 
 
 def predict_surface(
     x1,
     x2,
     weights,
+    grid: bool = False,
 ) -> np.ndarray:
     """
     Predict outputs from a quadratic surface regression model.
@@ -129,9 +340,20 @@ def predict_surface(
         x1 (array-like): First predictor.
         x2 (array-like): Second predictor.
         weights (array-like): Weight vector learned by fit_surface_regression.
+        grid (bool): Treat x1 and x2 as grid axes and evaluate the surface on
+            every (x1[i], x2[j]) pair as ``A1 W A2ᵀ`` with a 3 x 3 coefficient
+            matrix W, without forming the per-point design matrix.
 
     Returns:
-        np.ndarray: Predicted responses.
+        np.ndarray: Predicted responses; shape (len(x1), len(x2)) when grid
+        is True.
     """
-    raise NotImplementedError("Implement predict_surface.")
-
+    weights_arr = np.asarray(weights, dtype=float).ravel()
+    if grid:
+        coef = np.zeros(9)
+        coef[_SURFACE_TENSOR_COLUMNS] = weights_arr
+        return polynomial_features(x1, 2) @ coef.reshape(3, 3) @ polynomial_features(x2, 2).T
+    design = PolynomialTransformer(degree=2, include_bias=True).fit_transform(
+        _stack_features(x1, x2)
+    )
+    return design @ weights_arr
@@ -0,0 +1,69 @@
+"""Optional SciPy sparse-matrix support shared by the linear models."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # SciPy is optional; dense inputs never need it.
+    sp = None
+
+
+def is_sparse(X) -> bool:
+    """
+    Return True when X is a SciPy sparse matrix or array.
+
+    Args:
+        X: Any input accepted by the estimators.
+
+    Returns:
+        bool: Whether X should be handled by the sparse code paths.
+    """
+    return sp is not None and sp.issparse(X)
+
+
+def as_csr(X, dtype=float):
+    """
+    Convert a sparse input to CSR format with a floating-point dtype.
+
+    Args:
+        X: SciPy sparse matrix/array of any format.
+        dtype (np.dtype): Target floating-point type.
+
+    Returns:
+        scipy.sparse.csr_matrix: CSR view/copy of X (no copy when X is
+        already CSR with the requested dtype).
+
+    Raises:
+        ValueError: If X is not two-dimensional.
+    """
+    X_csr = X.tocsr()
+    if X_csr.ndim != 2:
+        raise ValueError("Sparse inputs must be 2-D.")
+    if X_csr.dtype != np.dtype(dtype):
+        X_csr = X_csr.astype(dtype)
+    return X_csr
+
+
+def row_scaled(X, scale: np.ndarray):
+    """
+    Multiply each row of X by the matching entry of `scale`.
+
+    Args:
+        X: Dense array or SciPy sparse matrix of shape (n_samples, n_features).
+        scale (np.ndarray): Per-row factors of shape (n_samples,).
+
+    Returns:
+        Same kind as X: Row-scaled matrix (sparse stays sparse).
+    """
+    if is_sparse(X):
+        return sp.diags(scale) @ X
+    return X * scale[:, None]
+
+
+def to_dense(M) -> np.ndarray:
+    """
+    Densify a (small) result matrix if it is sparse.
+    """
+    return M.toarray() if is_sparse(M) else np.asarray(M)
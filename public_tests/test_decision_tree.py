@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -60,3 +61,141 @@ def test_best_split_by_criteria():
             decision_tree.best_split(df, features, target="play", criterion=criterion) == feature
         )
 
+
+
+def test_batched_impurity_matches_per_group_wrappers():
+    df = load_dataset()
+    label_codes, classes = decision_tree.encode_labels(df["play"])
+    group_codes, groups = decision_tree.encode_labels(df["outlook"])
+    counts = decision_tree.group_class_counts(group_codes, label_codes, len(groups), len(classes))
+    assert counts.sum() == len(df)
+    entropies = decision_tree.entropy_from_counts(counts)
+    ginis = decision_tree.gini_from_counts(counts)
+    for i, value in enumerate(groups):
+        subset = df.loc[df["outlook"] == value, "play"].tolist()
+        assert entropies[i] == pytest.approx(decision_tree.entropy(subset), abs=1e-12)
+        assert ginis[i] == pytest.approx(decision_tree.gini(subset), abs=1e-12)
+    assert decision_tree.entropy([]) == 0.0
+    assert decision_tree.gini(["a", "a"]) == 0.0
+
+
+def test_contingency_scores_match_partition_definitions():
+    df = load_dataset()
+    features = [col for col in df.columns if col not in {"day", "play"}]
+    for feature in features:
+        partitions = decision_tree.partition_dataset(df, feature)
+        table = decision_tree.contingency_table(df, feature)
+        assert sorted(table.sum(axis=1)) == sorted(len(part) for part in partitions.values())
+        weighted_gini = sum(
+            len(part) / len(df) * decision_tree.gini(part["play"]) for part in partitions.values()
+        )
+        target_codes, classes = decision_tree.encode_labels(df["play"])
+        feature_codes, values = decision_tree.encode_labels(df[feature])
+        gini_score = decision_tree.score_encoded_features(
+            feature_codes[:, None], [len(values)], target_codes, len(classes), "gini"
+        )[0]
+        assert gini_score == pytest.approx(decision_tree.gini(df["play"]) - weighted_gini)
+
+
+def test_decision_tree_classifier_fits_and_predicts_batch():
+    df = load_dataset()
+    features = [col for col in df.columns if col not in {"day", "play"}]
+    tree = decision_tree.DecisionTreeClassifier(criterion="information_gain")
+    tree.fit(df, target="play", features=features)
+    assert tree.features_[tree.node_feature_[0]] == "outlook"
+    assert tree.predict(df).tolist() == df["play"].tolist()
+
+    stump = decision_tree.DecisionTreeClassifier(max_depth=1).fit(df, features=features)
+    assert np.count_nonzero(stump.node_feature_ >= 0) == 1
+    unseen = df.head(2).assign(outlook="foggy")
+    majority = df["play"].value_counts().idxmax()
+    assert stump.predict(unseen).tolist() == [majority, majority]
+
+
+def test_numeric_threshold_splits_match_brute_force():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"humidity": rng.integers(60, 100, 200).astype(float)})
+    df["play"] = np.where(df["humidity"] + rng.normal(0, 5, 200) > 80, "no", "yes")
+    threshold, score = decision_tree.best_threshold(df, "humidity", criterion="information_gain")
+    values = np.unique(df["humidity"])
+    gains = []
+    for cut in (values[:-1] + values[1:]) / 2:
+        side = np.where(df["humidity"] <= cut, "le", "gt")
+        gains.append(
+            decision_tree.information_gain(df.assign(side=side), "side", target="play")
+        )
+    assert score == pytest.approx(max(gains))
+    assert threshold == pytest.approx(((values[:-1] + values[1:]) / 2)[int(np.argmax(gains))])
+    binned, _ = decision_tree.best_threshold(df, "humidity", max_bins=8)
+    assert binned in decision_tree.quantile_bin_edges(df["humidity"].to_numpy(), 8)
+
+    tree = decision_tree.DecisionTreeClassifier(criterion="gini").fit(df)
+    assert tree.node_threshold_[0] == pytest.approx(
+        decision_tree.best_threshold(df, "humidity", criterion="gini")[0]
+    )
+    # A fully grown tree reaches the majority label of every distinct value.
+    majority = df.groupby("humidity")["play"].agg(lambda s: s.value_counts().idxmax())
+    best_possible = (df["humidity"].map(majority) == df["play"]).mean()
+    assert (tree.predict(df) == df["play"]).mean() == pytest.approx(best_possible)
+    histogram = decision_tree.DecisionTreeClassifier(max_bins=16).fit(df)
+    assert (histogram.predict(df) == df["play"]).mean() > 0.8
+
+
+def test_adjacent_float_thresholds_separate_rows():
+    low = 1.0 + 2.0**-52
+    high = np.nextafter(low, 2.0)
+    df = pd.DataFrame({"x": [low, high, low, high], "play": ["yes", "no", "yes", "no"]})
+    threshold, score = decision_tree.best_threshold(df, "x", criterion="information_gain")
+    assert low <= threshold < high
+    assert score == pytest.approx(1.0)
+
+    tree = decision_tree.DecisionTreeClassifier(criterion="gini").fit(df)
+    assert tree.node_feature_.size == 3
+    assert tree.predict(df).tolist() == df["play"].tolist()
+
+
+def test_parallel_split_search_matches_serial():
+    rng = np.random.default_rng(3)
+    columns = {f"f{j}": rng.choice(["a", "b", "c"], 2000) for j in range(40)}
+    df = pd.DataFrame(columns)
+    df["play"] = np.where(df["f7"] == "a", "yes", "no")
+    df["copy"] = df["f7"]  # ties with f7; the earlier candidate must win
+    candidates = [col for col in df.columns if col != "play"]
+    serial = decision_tree.best_split(df, candidates)
+    assert decision_tree.best_split(df, candidates, n_jobs=4) == serial == "f7"
+
+    codes = np.column_stack([decision_tree.encode_labels(df[c])[0] for c in candidates])
+    targets, classes = decision_tree.encode_labels(df["play"])
+    args = (codes, [3] * len(candidates), targets, len(classes))
+    np.testing.assert_array_equal(
+        decision_tree.score_encoded_features(*args, n_jobs=3),
+        decision_tree.score_encoded_features(*args),
+    )
+
+    df["play"] = rng.choice(["yes", "no"], len(df))
+    trees = [
+        decision_tree.DecisionTreeClassifier(max_depth=4, n_jobs=n_jobs).fit(df)
+        for n_jobs in (None, 4)
+    ]
+    np.testing.assert_array_equal(trees[0].node_feature_, trees[1].node_feature_)
+
+
+def test_random_forest_is_reproducible_across_n_jobs():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame(
+        {
+            "temperature": rng.normal(20, 5, 300),
+            "outlook": rng.choice(["sunny", "overcast", "rain"], 300),
+            "windy": rng.choice(["true", "false"], 300),
+        }
+    )
+    df["play"] = np.where((df["temperature"] > 20) ^ (df["outlook"] == "rain"), "yes", "no")
+    serial = decision_tree.RandomForestClassifier(n_estimators=8, random_state=0).fit(df)
+    parallel = decision_tree.RandomForestClassifier(n_estimators=8, random_state=0, n_jobs=2)
+    parallel.fit(df)
+    proba = serial.predict_proba(df)
+    np.testing.assert_array_equal(proba, parallel.predict_proba(df))
+    np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+    assert (serial.predict(df) == df["play"]).mean() > 0.9
+    other = decision_tree.RandomForestClassifier(n_estimators=8, random_state=1).fit(df)
+    assert not np.array_equal(proba, other.predict_proba(df))
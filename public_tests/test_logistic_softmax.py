@@ -3,6 +3,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 # Add code directory to path (following bayesnet pattern)
 sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
@@ -66,3 +67,212 @@ def test_softmax_regression_trains_and_predicts():
     preds = clf.predict(X)
     assert preds.tolist() == expected_labels.tolist()
 
+
+
+def test_logistic_regression_minibatch_matches_full_batch_labels():
+    X, y = load_binary()
+    _, expected_labels = load_expected_logistic()
+    clf = LogisticRegression(learning_rate=0.3, epochs=1000, reg_strength=0.01, batch_size=4)
+    clf.fit(X, y)
+    assert clf.predict(X).tolist() == expected_labels.tolist()
+
+
+def test_logistic_regression_partial_fit_streams_chunks():
+    X, y = load_binary()
+    expected_probs, _ = load_expected_logistic()
+    clf = LogisticRegression(learning_rate=0.3, reg_strength=0.01)
+    for _ in range(4000):
+        clf.partial_fit(X, y)
+    assert np.allclose(clf.predict_proba(X), expected_probs, atol=1e-4)
+    streamed = LogisticRegression(learning_rate=0.3, reg_strength=0.01, batch_size=5)
+    for _ in range(200):
+        for start in range(0, len(X), 5):
+            streamed.partial_fit(X[start : start + 5], y[start : start + 5])
+    assert streamed.predict(X).tolist() == y.tolist()
+
+
+def test_early_stopping_records_loss_history():
+    X, y = load_binary()
+    clf = LogisticRegression(
+        learning_rate=0.3, epochs=4000, reg_strength=0.01, tol=1e-7, track_loss=True
+    )
+    clf.fit(X, y)
+    assert clf.n_iter_ < 4000
+    assert clf.loss_history_.shape == (clf.n_iter_,)
+    assert clf.loss_history_[-1] < clf.loss_history_[0]
+    expected_probs, _ = load_expected_logistic()
+    assert np.allclose(clf.predict_proba(X), expected_probs, atol=5e-3)
+
+    X_multi, y_multi = load_multiclass()
+    softmax = SoftmaxRegression(learning_rate=0.2, epochs=5000, reg_strength=0.01, tol=1e-8)
+    softmax.fit(X_multi, y_multi)
+    _, expected_labels, _ = load_expected_softmax()
+    assert softmax.n_iter_ < 5000
+    assert softmax.loss_history_ is None
+    assert softmax.predict(X_multi).tolist() == expected_labels.tolist()
+
+
+def test_second_order_solvers_match_gradient_descent():
+    X, y = load_binary()
+    expected_probs, expected_labels = load_expected_logistic()
+    for solver in ("newton", "lbfgs"):
+        clf = LogisticRegression(reg_strength=0.01, epochs=200, solver=solver, track_loss=True)
+        clf.fit(X, y)
+        assert clf.n_iter_ < 200
+        assert clf.loss_history_.shape == (clf.n_iter_,)
+        assert np.allclose(clf.predict_proba(X), expected_probs, atol=1e-4)
+        assert clf.predict(X).tolist() == expected_labels.tolist()
+
+
+def test_fused_softmax_matches_reference_path():
+    X, y = load_multiclass()
+    expected_probs, expected_labels, _ = load_expected_softmax()
+    fused = SoftmaxRegression(learning_rate=0.2, epochs=5000, reg_strength=0.01, fused=True)
+    fused.fit(X, y)
+    assert np.allclose(fused.predict_proba(X), expected_probs, atol=1e-8)
+    assert fused.predict(X).tolist() == expected_labels.tolist()
+
+    tracked = SoftmaxRegression(learning_rate=0.2, epochs=300, reg_strength=0.01, track_loss=True)
+    tracked.fit(X, y)
+    tracked_fused = SoftmaxRegression(
+        learning_rate=0.2, epochs=300, reg_strength=0.01, track_loss=True, fused=True
+    )
+    tracked_fused.fit(X, y)
+    assert np.allclose(tracked.loss_history_, tracked_fused.loss_history_, rtol=1e-10)
+
+    single = SoftmaxRegression(
+        learning_rate=0.2, epochs=5000, reg_strength=0.01, fused=True, dtype=np.float32
+    )
+    single.fit(X, y)
+    assert single.weights.dtype == np.float32
+    assert np.allclose(single.predict_proba(X), expected_probs, atol=1e-3)
+
+
+def test_classifiers_accept_sparse_csr_inputs():
+    sparse = pytest.importorskip("scipy.sparse")
+    X, y = load_binary()
+    expected_probs, _ = load_expected_logistic()
+    for solver in ("gd", "newton", "lbfgs"):
+        clf = LogisticRegression(learning_rate=0.3, epochs=4000, reg_strength=0.01, solver=solver)
+        clf.fit(sparse.csr_matrix(X), y)
+        assert np.allclose(clf.predict_proba(sparse.csr_matrix(X)), expected_probs, atol=1e-4)
+
+    X_multi, y_multi = load_multiclass()
+    expected_softmax, _, _ = load_expected_softmax()
+    for fused in (False, True):
+        softmax = SoftmaxRegression(learning_rate=0.2, epochs=5000, reg_strength=0.01, fused=fused)
+        softmax.fit(sparse.csr_matrix(X_multi), y_multi)
+        assert np.allclose(softmax.predict_proba(X_multi), expected_softmax, atol=1e-4)
+
+
+def test_classifiers_round_trip_through_model_files(tmp_path):
+    X, y = load_binary()
+    clf = LogisticRegression(learning_rate=0.3, epochs=200, track_loss=True)
+    clf.fit(X, y)
+    clf.save(tmp_path / "logistic.bin")
+    for mmap in (True, False):
+        loaded = LogisticRegression.load(tmp_path / "logistic.bin", mmap=mmap)
+        np.testing.assert_array_equal(loaded.predict_proba(X), clf.predict_proba(X))
+        np.testing.assert_array_equal(loaded.loss_history_, clf.loss_history_)
+    mapped = LogisticRegression.load(tmp_path / "logistic.bin")
+    assert isinstance(mapped.weights, np.memmap)
+    saved_weights = clf.weights.copy()
+    mapped.partial_fit(X, y)
+    clf.partial_fit(X, y)
+    np.testing.assert_allclose(mapped.weights, clf.weights, rtol=1e-12)
+    reloaded = LogisticRegression.load(tmp_path / "logistic.bin")
+    np.testing.assert_array_equal(reloaded.weights, saved_weights)
+
+    X, y = load_multiclass()
+    soft = SoftmaxRegression(learning_rate=0.2, epochs=200, dtype=np.float32)
+    soft.fit(X, y)
+    soft.save(tmp_path / "softmax.bin")
+    restored = SoftmaxRegression.load(tmp_path / "softmax.bin")
+    assert restored.weights.dtype == np.float32
+    assert not restored.weights.flags.writeable
+    np.testing.assert_array_equal(restored.predict_proba(X), soft.predict_proba(X))
+    assert restored.predict(X).tolist() == soft.predict(X).tolist()
+    with pytest.raises(ValueError):
+        LogisticRegression.load(tmp_path / "softmax.bin")
+
+
+def test_micro_batching_server_matches_direct_predictions():
+    import asyncio
+    import json
+
+    from inference_server import InferenceServer
+
+    X, y = load_multiclass()
+    clf = SoftmaxRegression(learning_rate=0.2, epochs=200)
+    clf.fit(X, y)
+    expected = clf.predict_proba(X)
+
+    async def scenario():
+        server = InferenceServer(clf, max_batch_size=8, max_wait_ms=20.0)
+        port = await server.start()
+        try:
+            direct = await asyncio.gather(*(server.batcher.predict(row) for row in X))
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for i, row in enumerate(X[:3]):
+                writer.write(json.dumps({"id": i, "features": row.tolist()}).encode() + b"\n")
+            writer.write(b'{"id": 99, "features": "oops"}\n')
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(4)]
+            writer.write(b'{"stats": true}\n')
+            await writer.drain()
+            stats = json.loads(await reader.readline())["stats"]
+            writer.close()
+            return direct, responses, stats
+        finally:
+            await server.stop()
+
+    direct, responses, stats = asyncio.run(scenario())
+    np.testing.assert_allclose(np.stack(direct), expected, rtol=1e-12)
+    by_id = {response["id"]: response for response in responses}
+    for i in range(3):
+        np.testing.assert_allclose(by_id[i]["proba"], expected[i], rtol=1e-12)
+    assert "error" in by_id[99]
+    assert stats["max_batch_size"] == 8
+    assert stats["batches"] < stats["requests"] == len(X) + 3
+
+
+def test_micro_batcher_isolates_bad_rows_and_fails_in_flight_on_stop():
+    import asyncio
+
+    from inference_server import MicroBatcher
+
+    X, y = load_multiclass()
+    clf = SoftmaxRegression(learning_rate=0.2, epochs=200)
+    clf.fit(X, y)
+    expected = clf.predict_proba(X[:2])
+
+    async def scenario():
+        batcher = MicroBatcher(clf.predict_proba, max_batch_size=8, max_wait_ms=20.0)
+        await batcher.start()
+        mixed = await asyncio.gather(
+            batcher.predict(X[0]),
+            batcher.predict(X[1]),
+            batcher.predict([1.0, 2.0, 3.0]),
+            return_exceptions=True,
+        )
+        after = await batcher.predict(X[0])
+        checked = MicroBatcher(clf.predict_proba, n_features=X.shape[1])
+        await checked.start()
+        with pytest.raises(ValueError):
+            await checked.predict([1.0, 2.0, 3.0])
+        await checked.stop()
+        slow = MicroBatcher(clf.predict_proba, max_batch_size=8, max_wait_ms=500.0)
+        await slow.start()
+        waiting = asyncio.create_task(slow.predict(X[0]))
+        await asyncio.sleep(0.05)
+        await slow.stop()
+        stopped = await asyncio.wait_for(asyncio.gather(waiting, return_exceptions=True), 1.0)
+        await batcher.stop()
+        return mixed, after, stopped[0]
+
+    mixed, after, stopped = asyncio.run(scenario())
+    np.testing.assert_allclose(mixed[0], expected[0], rtol=1e-12)
+    np.testing.assert_allclose(mixed[1], expected[1], rtol=1e-12)
+    assert isinstance(mixed[2], ValueError)
+    np.testing.assert_allclose(after, expected[0], rtol=1e-12)
+    assert isinstance(stopped, RuntimeError)
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -57,6 +58,61 @@ def test_macro_micro_scores():
     )
 
 
+def test_classification_report_matches_individual_metrics():
+    y_true, y_pred = load_classification()
+    expected = load_expected_metrics("expected_metrics_classification.csv")
+    report = metrics_classification.classification_report(y_true, y_pred, labels=["cat", "dog", "bird"])
+    np.testing.assert_array_equal(
+        report["confusion_matrix"],
+        metrics_classification.confusion_matrix(y_true, y_pred, labels=["cat", "dog", "bird"]),
+    )
+    assert report["accuracy"] == pytest.approx(expected["accuracy"])
+    assert report["precision"][0] == pytest.approx(expected["precision_cat"])
+    assert report["recall"][0] == pytest.approx(expected["recall_cat"])
+    assert report["f1"][0] == pytest.approx(expected["f1_cat"])
+    assert report["macro_f1"] == pytest.approx(expected["macro_f1"])
+    assert report["micro_f1"] == pytest.approx(expected["micro_f1"])
+    assert report["support"].sum() == len(y_true)
+
+    inferred = metrics_classification.classification_report(["b", "a"], ["c", "a"])
+    assert inferred["labels"] == ["b", "a", "c"]
+    partial = metrics_classification.confusion_matrix(["a", "b", "z"], ["a", "z", "z"], labels=["a", "b"])
+    np.testing.assert_array_equal(partial, [[1, 0], [0, 0]])
+
+
+def test_sparse_confusion_matrix_for_large_label_space():
+    rng = np.random.default_rng(0)
+    labels = [f"class_{i}" for i in range(3000)]
+    y_true = rng.choice(labels, 5000)
+    y_pred = np.where(rng.random(5000) < 0.7, y_true, rng.choice(labels, 5000))
+    dense = metrics_classification.confusion_matrix(y_true, y_pred, labels=labels[:50])
+    for fmt in ("coo", "csr"):
+        sparse = metrics_classification.confusion_matrix(y_true, y_pred, labels=labels[:50], sparse=fmt)
+        assert sparse.format == fmt
+        np.testing.assert_array_equal(sparse.toarray(), dense)
+
+    report = metrics_classification.classification_report(y_true, y_pred, labels=labels, sparse="csr")
+    assert report["confusion_matrix"].nnz < len(y_true)
+    assert metrics_classification.macro_f1_score(y_true, y_pred, labels=labels) == pytest.approx(report["macro_f1"])
+    assert metrics_classification.micro_f1_score(y_true, y_pred, labels=labels) == pytest.approx(
+        np.mean(y_true == y_pred)
+    )
+
+
+def test_confusion_matrix_accepts_unorderable_labels():
+    cm = metrics_classification.confusion_matrix([None, "a", 1], ["a", "a", None])
+    np.testing.assert_array_equal(cm, [[0, 1, 0], [0, 1, 0], [1, 0, 0]])
+    explicit = metrics_classification.confusion_matrix(
+        [None, "a", 1], ["a", "a", None], labels=[1, "a", None]
+    )
+    np.testing.assert_array_equal(explicit, cm[::-1, ::-1])
+
+    acc = metrics_classification.ConfusionMatrixAccumulator()
+    acc.update([None, "a"], ["a", "a"]).update(["b"], [None])
+    assert acc.labels_ == [None, "a", "b"]
+    np.testing.assert_array_equal(acc.confusion_matrix_, [[0, 1, 0], [0, 1, 0], [1, 0, 0]])
+
+
 def test_regression_metrics():
     y_true, y_pred = load_regression()
     expected = load_expected_metrics("expected_metrics_regression.csv")
@@ -75,3 +131,63 @@ def test_regression_report_structure():
     assert set(report.keys()) == {"mae", "mse", "rmse", "r2"}
     assert report["mae"] == pytest.approx(expected["mae"], rel=1e-6)
     assert report["r2"] == pytest.approx(expected["r2"], rel=1e-6)
+
+
+def test_streaming_accumulators_match_batch_metrics():
+    y_true, y_pred = load_classification()
+    labels = ["cat", "dog", "bird"]
+    left = metrics_classification.ConfusionMatrixAccumulator(labels=labels)
+    right = metrics_classification.ConfusionMatrixAccumulator(labels=labels)
+    left.update(y_true[:3], y_pred[:3]).update(y_true[3:6], y_pred[3:6])
+    right.update(y_true[6:], y_pred[6:])
+    result = left.merge(right).result()
+    batch = metrics_classification.classification_report(y_true, y_pred, labels=labels)
+    np.testing.assert_array_equal(result["confusion_matrix"], batch["confusion_matrix"])
+    assert result["macro_f1"] == batch["macro_f1"]
+
+    grown = metrics_classification.ConfusionMatrixAccumulator().update(y_true[:4], y_pred[:4])
+    other = metrics_classification.ConfusionMatrixAccumulator().update(y_true[4:], y_pred[4:])
+    merged = grown.merge(other).result()
+    assert sorted(merged["labels"]) == sorted(labels)
+    assert merged["accuracy"] == metrics_classification.accuracy_score(y_true, y_pred)
+    assert merged["micro_f1"] == pytest.approx(batch["micro_f1"])
+
+    y_true, y_pred = load_regression()
+    y_true = np.asarray(y_true) + 1e8  # large offset: naive sum-of-squares would cancel
+    y_pred = np.asarray(y_pred) + 1e8
+    parts = [
+        metrics_regression.RegressionMetricsAccumulator().update(y_true[i : i + 3], y_pred[i : i + 3])
+        for i in range(0, len(y_true), 3)
+    ]
+    streaming = parts[0]
+    for part in parts[1:]:
+        streaming.merge(part)
+    batch = metrics_regression.regression_report(y_true, y_pred)
+    for key, value in streaming.result().items():
+        assert value == pytest.approx(batch[key], rel=1e-9)
+    assert batch["r2"] == pytest.approx(
+        1 - np.sum((y_true - y_pred) ** 2) / np.sum((y_true - y_true.mean()) ** 2), rel=1e-9
+    )
+
+
+def test_regression_report_blockwise_and_dtype_control():
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(5.0, 2.0, 10_001)
+    y_pred = y_true + rng.normal(0.0, 0.5, y_true.size)
+    reference = metrics_regression.regression_report(y_true, y_pred)
+    blocked = metrics_regression.regression_report(y_true, y_pred, block_size=97)
+    single32 = metrics_regression.regression_report(
+        y_true.astype(np.float32), y_pred.astype(np.float32)
+    )
+    forced32 = metrics_regression.regression_report(y_true, y_pred, dtype=np.float32)
+    for key, value in reference.items():
+        assert blocked[key] == pytest.approx(value, rel=1e-10)
+        assert single32[key] == pytest.approx(value, rel=1e-5)
+        assert forced32[key] == pytest.approx(value, rel=1e-5)
+
+    prepared, _ = metrics_regression._prepare_inputs(y_true, y_pred)
+    assert np.shares_memory(prepared, y_true)
+    prepared32, _ = metrics_regression._prepare_inputs(y_true.astype(np.float32), y_pred)
+    assert prepared32.dtype == np.float64
+    with pytest.raises(ValueError):
+        metrics_regression.regression_report(y_true, y_pred, dtype=np.int32)
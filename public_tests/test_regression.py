@@ -58,3 +58,247 @@ def test_surface_training_and_prediction():
     expected = load_expected_weights("expected_surface_weights.csv")
     assert np.allclose(weights, expected, atol=0.08)
 
+
+
+def test_linear_regression_sparse_matches_dense():
+    sparse = pytest.importorskip("scipy.sparse")
+    from linear_regression import LinearRegression
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 6)) * (rng.random((200, 6)) < 0.2)
+    y = X @ np.arange(1.0, 7.0) + 3.0 + rng.normal(scale=0.01, size=200)
+    dense = LinearRegression(reg_strength=0.1).fit(X, y)
+    direct = LinearRegression(reg_strength=0.1).fit(sparse.csr_matrix(X), y)
+    assert np.allclose(direct.coef_, dense.coef_)
+    assert direct.intercept_ == pytest.approx(dense.intercept_)
+    assert np.allclose(direct.predict(sparse.csr_matrix(X)), dense.predict(X))
+
+    wide = sparse.random(300, 2500, density=0.002, format="csr", random_state=0)
+    wide_y = np.asarray(wide.sum(axis=1)).ravel() + 1.0
+    iterative = LinearRegression(reg_strength=0.1).fit(wide, wide_y)
+    reference = LinearRegression(reg_strength=0.1).fit(wide.toarray(), wide_y)
+    assert np.allclose(iterative.coef_, reference.coef_, atol=1e-6)
+    assert iterative.intercept_ == pytest.approx(reference.intercept_, abs=1e-6)
+
+
+def test_linear_regression_solvers_agree():
+    from linear_regression import LinearRegression
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(500, 8)) + 1e4
+    y = X @ rng.normal(size=8) - 2.0 + rng.normal(scale=0.1, size=500)
+    reference = LinearRegression(reg_strength=0.5, solver="svd").fit(X, y)
+    for solver in ("auto", "cholesky", "qr", "cg"):
+        model = LinearRegression(reg_strength=0.5, solver=solver).fit(X, y)
+        assert np.allclose(model.coef_, reference.coef_, atol=1e-6)
+        assert np.allclose(model.predict(X), reference.predict(X), atol=1e-4)
+        if solver != "cg":
+            assert model.intercept_ == pytest.approx(reference.intercept_, rel=1e-6)
+    assert LinearRegression().fit(X, y).solver_ == "cholesky"
+
+    collinear = np.column_stack([X[:, 0], X[:, 0], X[:, 1]])
+    auto = LinearRegression().fit(collinear, y)
+    assert auto.solver_ == "svd"
+    svd = LinearRegression(solver="svd").fit(collinear, y)
+    assert np.allclose(auto.predict(collinear), svd.predict(collinear))
+
+
+def test_linear_regression_streaming_mixes_dense_and_sparse_chunks():
+    sparse = pytest.importorskip("scipy.sparse")
+    from linear_regression import LinearRegression
+
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(200, 3)) + np.array([50.0, -20.0, 5.0])
+    y = X @ np.array([2.88, -1.0, 0.5]) + 4.0 + rng.normal(0, 0.1, 200)
+    reference = LinearRegression(reg_strength=0.1).fit(X, y)
+    for first, second in ((np.asarray, sparse.csr_matrix), (sparse.csr_matrix, np.asarray)):
+        model = LinearRegression(reg_strength=0.1)
+        model.partial_fit(first(X[:120]), y[:120]).partial_fit(second(X[120:]), y[120:])
+        np.testing.assert_allclose(model.coef_, reference.coef_, rtol=1e-8)
+        assert model.intercept_ == pytest.approx(reference.intercept_)
+
+
+def test_linear_regression_streaming_matches_single_fit():
+    from linear_regression import LinearRegression, iter_csv_blocks
+
+    x1, x2, y = load_regression_2d()
+    X = np.column_stack([x1, x2])
+    full = LinearRegression(reg_strength=0.1).fit(X, y)
+
+    streamed = LinearRegression(reg_strength=0.1)
+    for X_block, y_block in iter_csv_blocks(DATA_DIR / "regression_2d.csv", ["x1", "x2"], "y", 2):
+        streamed.partial_fit(X_block, y_block)
+    assert streamed._stale
+    assert np.allclose(streamed.coef_, full.coef_)
+    assert streamed.intercept_ == pytest.approx(full.intercept_)
+    assert not streamed._stale
+
+    collinear = np.column_stack([X, X[:, 0] + X[:, 1]])
+    fallback = LinearRegression().fit(collinear, y)
+    assert fallback.solver_ == "svd"
+    with pytest.raises(RuntimeError):
+        fallback.partial_fit(collinear, y)
+
+    blocks = iter_csv_blocks(DATA_DIR / "regression_2d.csv", ["x1", "x2"], "y", chunk_rows=4)
+    once = LinearRegression(reg_strength=0.1).fit_chunks(blocks)
+    assert np.allclose(once.predict(X), full.predict(X))
+
+
+def test_linear_regression_fit_path_matches_refits_and_loo():
+    from linear_regression import LinearRegression
+
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(30, 4))
+    y = X @ np.array([1.0, -2.0, 0.0, 0.5]) + 1.5 + rng.normal(scale=0.5, size=30)
+    alphas = [0.0, 0.1, 1.0, 10.0]
+    model = LinearRegression().fit_path(X, y, alphas)
+    for i, alpha in enumerate(alphas):
+        single = LinearRegression(reg_strength=alpha, solver="svd").fit(X, y)
+        assert np.allclose(model.coef_path_[i], single.coef_)
+        assert model.intercept_path_[i] == pytest.approx(single.intercept_)
+        loo = []
+        for j in range(len(X)):
+            mask = np.arange(len(X)) != j
+            held_out = LinearRegression(reg_strength=alpha).fit(X[mask], y[mask])
+            loo.append((held_out.predict(X[j : j + 1])[0] - y[j]) ** 2)
+        assert model.cv_errors_[i] == pytest.approx(np.mean(loo))
+    assert model.best_alpha_ == alphas[int(np.argmin(model.cv_errors_))]
+    assert np.allclose(model.coef_, model.coef_path_[np.argmin(model.cv_errors_)])
+
+
+def test_linear_regression_fit_path_scores_interpolating_fits_as_inf():
+    import warnings
+
+    from linear_regression import LinearRegression
+
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(10, 12))
+    y = rng.normal(size=10)
+    for scoring in ("loo", "gcv"):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            model = LinearRegression().fit_path(X, y, [0.0, 1.0], scoring=scoring)
+        assert np.isinf(model.cv_errors_[0])
+        assert np.isfinite(model.cv_errors_[1])
+        assert model.best_alpha_ == 1.0
+
+
+def test_polynomial_transformer_recurrence_matches_monomials():
+    from polynomial_transformer import PolynomialTransformer
+
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(6, 3))
+    transformer = PolynomialTransformer(degree=4).fit(X)
+    design = transformer.transform(X)
+    naive = np.column_stack(
+        [np.ones(len(X))] + [np.prod(X[:, list(combo)], axis=1) for combo in transformer.combinations_]
+    )
+    assert np.allclose(design, naive)
+
+    out = np.empty(design.shape, dtype=np.float32)
+    assert transformer.transform(X, out=out) is out
+    assert np.allclose(out, naive, rtol=1e-5)
+    assert transformer.transform(X, dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        transformer.transform(X[:, :2])
+
+
+def test_polynomial_chunked_expansion_and_fit():
+    from polynomial_transformer import PolynomialTransformer
+
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(25, 3))
+    transformer = PolynomialTransformer(degree=3).fit(X)
+    assert transformer.n_output_features_ == transformer.transform(X).shape[1] == 20
+    blocks = [block.copy() for block in transformer.transform_iter(X, chunk_rows=7, reuse_buffer=True)]
+    assert [len(block) for block in blocks] == [7, 7, 7, 4]
+    assert np.allclose(np.vstack(blocks), transformer.transform(X))
+
+    x, y = load_regression_1d()
+    full = regression.fit_polynomial_regression(x, y, degree=3)
+    chunked = regression.fit_polynomial_regression(x, y, degree=3, chunk_rows=3)
+    assert np.allclose(full, chunked)
+
+
+def test_polynomial_path_matches_individual_fits():
+    x, y = load_regression_1d()
+    path = regression.fit_polynomial_path(x, y, degrees=[1, 2, 3, 5])
+    for degree, weights, train_error, loo_error in zip(
+        path["degrees"], path["weights"], path["train_errors"], path["val_errors"]
+    ):
+        reference = regression.fit_polynomial_regression(x, y, degree=degree)
+        np.testing.assert_allclose(weights, reference, rtol=1e-6, atol=1e-8)
+        residuals = y - regression.predict_polynomial(x, reference)
+        assert train_error == pytest.approx(np.mean(residuals**2), rel=1e-8)
+        if degree == 2:
+            loo = []
+            for i in range(len(x)):
+                held_out = regression.fit_polynomial_regression(np.delete(x, i), np.delete(y, i), degree=2)
+                loo.append((y[i] - regression.predict_polynomial(x[i : i + 1], held_out)[0]) ** 2)
+            assert loo_error == pytest.approx(np.mean(loo), rel=1e-6)
+
+    half = len(x) // 2
+    holdout = regression.fit_polynomial_path(x[:half], y[:half], range(4), x[half:], y[half:])
+    assert holdout["best_degree"] in range(4)
+    expected = np.mean((y[half:] - regression.predict_polynomial(x[half:], holdout["weights"][2])) ** 2)
+    assert holdout["val_errors"][2] == pytest.approx(expected)
+
+
+def test_horner_prediction_matches_design_matrix():
+    rng = np.random.default_rng(2)
+    x = rng.uniform(-2, 2, 1001)
+    weights = rng.normal(size=7)
+    reference = regression.polynomial_features(x, 6) @ weights
+    np.testing.assert_allclose(regression.predict_polynomial(x, weights), reference, rtol=1e-12, atol=1e-12)
+    chunked = regression.predict_polynomial(x[:, None], weights, chunk_rows=128)
+    np.testing.assert_allclose(chunked, reference, rtol=1e-12, atol=1e-12)
+    single = regression.predict_polynomial(x.astype(np.float32), weights, dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, reference, rtol=1e-4, atol=1e-3)
+    assert regression.predict_polynomial(x, [3.0]).tolist() == [3.0] * len(x)
+
+
+def test_surface_grid_solver_matches_dense():
+    rng = np.random.default_rng(4)
+    axis1, axis2 = np.linspace(-1, 2, 7), np.linspace(0, 3, 5)
+    g1, g2 = (grid.ravel() for grid in np.meshgrid(axis1, axis2, indexing="ij"))
+    order = rng.permutation(g1.size)
+    x1, x2 = g1[order], g2[order]
+    y = 1 + 2 * x1 - x2 + 0.5 * x1**2 + x1 * x2 - 0.3 * x2**2 + rng.normal(0, 0.1, x1.size)
+    fast = regression.fit_surface_regression(x1, x2, y, grid=True)
+    dense = regression.fit_surface_regression(x1, x2, y, grid=False)
+    np.testing.assert_allclose(fast, dense, rtol=1e-9, atol=1e-10)
+    np.testing.assert_allclose(regression.fit_surface_regression(x1, x2, y), dense, rtol=1e-9, atol=1e-10)
+
+    mesh = regression.predict_surface(axis1, axis2, fast, grid=True)
+    assert mesh.shape == (7, 5)
+    np.testing.assert_allclose(mesh.ravel(), regression.predict_surface(g1, g2, fast), rtol=1e-12)
+    with pytest.raises(ValueError):
+        regression.fit_surface_regression(x1[1:], x2[1:], y[1:], grid=True)
+
+
+def test_linear_model_and_transformer_round_trip(tmp_path):
+    from linear_regression import LinearRegression
+    from polynomial_transformer import PolynomialTransformer
+
+    rng = np.random.default_rng(6)
+    X = rng.normal(size=(300, 3))
+    y = X @ np.array([1.0, -2.0, 0.5]) + 3 + rng.normal(0, 0.1, 300)
+    model = LinearRegression(reg_strength=0.1).partial_fit(X[:200], y[:200])
+    model.save(tmp_path / "compact.bin")
+    model.save(tmp_path / "linear.bin", include_stats=True)
+    assert (tmp_path / "compact.bin").stat().st_size < (tmp_path / "linear.bin").stat().st_size
+    with pytest.raises(RuntimeError):
+        LinearRegression.load(tmp_path / "compact.bin").partial_fit(X[200:], y[200:])
+    loaded = LinearRegression.load(tmp_path / "linear.bin")
+    assert not loaded._stats["gram"].flags.writeable
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+    loaded.partial_fit(X[200:], y[200:])
+    reference = LinearRegression(reg_strength=0.1).fit(X, y)
+    np.testing.assert_allclose(loaded.coef_, reference.coef_, rtol=1e-8)
+
+    transformer = PolynomialTransformer(degree=3, include_bias=False).fit(X)
+    transformer.save(tmp_path / "poly.bin")
+    restored = PolynomialTransformer.load(tmp_path / "poly.bin", mmap=False)
+    assert restored.combinations_ == transformer.combinations_
+    np.testing.assert_array_equal(restored.transform(X), transformer.transform(X))